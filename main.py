@@ -1,6 +1,7 @@
 # --- Standard Library Imports ---
 import sys
 import os
+import multiprocessing
 import time
 import traceback
 
@@ -88,9 +89,7 @@ def main():
             downloader_app_instance._center_on_screen()
 
         # --- First-Run Welcome Tour ---
-        if TourDialog.should_show_tour():
-            tour_dialog = TourDialog(parent_app=downloader_app_instance)
-            tour_dialog.exec_()
+        TourDialog.run_tour_if_needed(downloader_app_instance)
 
         # --- Start Application ---
         exit_code = qt_app.exec_()
@@ -107,4 +106,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Required for the image compression process pool in frozen builds.
+    multiprocessing.freeze_support()
     main()
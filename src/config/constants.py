@@ -1,3 +1,5 @@
+import os
+
 # --- Application Metadata ---
 CONFIG_ORGANIZATION_NAME = "KemonoDownloader"
 CONFIG_APP_NAME_MAIN = "ApplicationSettings"
@@ -40,11 +42,23 @@ POST_WORKER_BATCH_THRESHOLD = 30
 POST_WORKER_NUM_BATCHES = 4
 POST_WORKER_BATCH_DELAY_SECONDS = 2.5
 MAX_POST_WORKERS_WHEN_COMMENT_FILTERING = 3
+# Above SOFT_WARNING_THREAD_THRESHOLD post workers, the post worker pool is split into
+# POST_WORKER_NUM_BATCHES segments (each with its own queue), chosen by post ID.
+POST_WORKER_POOL_IDLE_TIMEOUT_SECONDS = 30  # Keeps idle workers alive across submission batches
+PAGE_PREFETCH_WINDOW = 4  # Post-list pages fetched concurrently ahead of the one being processed
+PAGE_REQUEST_MIN_INTERVAL_S = 0.6  # Minimum spacing between the starts of post-list page requests
 
 # --- Multipart Download Settings ---
 MIN_SIZE_FOR_MULTIPART_DOWNLOAD = 10 * 1024 * 1024  # 10 MB
 MAX_PARTS_FOR_MULTIPART_DOWNLOAD = 15
 
+# --- Single-Stream Download Settings ---
+# Read size for the synchronous socket-to-file copy loop (same sizes as shutil's copy buffer)
+SYNC_FILE_IO_CHUNK_SIZE = 1024 * 1024 if os.name == 'nt' else 64 * 1024
+# Per-file progress is only considered after this many bytes (doubling up to the max step)
+PROGRESS_REPORT_MIN_BYTES_STEP = 64 * 1024
+PROGRESS_REPORT_MAX_BYTES_STEP = 4 * 1024 * 1024
+
 # --- UI and Settings Keys (for QSettings) ---
 TOUR_SHOWN_KEY = "neverShowTourAgainV19"
 MANGA_FILENAME_STYLE_KEY = "mangaFilenameStyleV1"
@@ -57,9 +71,22 @@ THEME_KEY = "currentThemeV2"
 SCAN_CONTENT_IMAGES_KEY = "scanContentForImagesV1"
 LANGUAGE_KEY = "currentLanguageV1"
 DOWNLOAD_LOCATION_KEY = "downloadLocationV1"
+USE_ASYNC_HTTP_KEY = "useAsyncHttpV1"  # Opt-in: single-stream downloads through the shared aiohttp loop
 
 # --- UI Constants and Identifiers ---
-HTML_PREFIX = "<!HTML!>"
+MAIN_LOG_FLUSH_INTERVAL_MS = 50  # Queued log lines are written to the log view this long after the first one arrives
+EXTERNAL_LOG_FLUSH_INTERVAL_MS = 200  # External link lines are written to their log in batches at this interval
+EXTERNAL_LINK_DRAIN_INTERVAL_MS = 250  # Queued external links are displayed in batches at this interval
+EXTERNAL_LINK_DRAIN_BATCH_SIZE = 50  # Maximum number of queued external links displayed per batch
+MISSED_CHARACTER_LOG_REFRESH_MS = 250  # New missed character terms are redrawn together at most this often
+MAIN_LOG_BUFFER_MAX_LINES = 5000  # Oldest unflushed lines are dropped beyond this
+MAIN_LOG_MAX_BLOCKS = 5000  # The log view keeps at most this many lines; older ones are removed from the top
+EXTERNAL_LOG_MAX_BLOCKS = 5000  # Same cap for the plain-text external links log
+MISSED_CHARACTER_LOG_MAX_BLOCKS = 20000  # Cap for the missed character log (four lines per term)
+EXIT_POOL_DRAIN_TIMEOUT_MS = 3000  # On exit, running post workers get this long to stop before the window closes anyway
+CHARACTER_FILTER_DEBOUNCE_MS = 150  # Live filter edits during a download apply after typing pauses this long
+TEXT_INPUT_DEBOUNCE_MS = 150  # URL and search box handlers run after typing pauses this long
+FILE_PROGRESS_UPDATE_INTERVAL_S = 0.1  # In-flight file progress redraws the progress label at most this often
 LOG_DISPLAY_LINKS = "links"
 LOG_DISPLAY_DOWNLOAD_PROGRESS = "download_progress"
 
@@ -98,6 +125,13 @@ FOLDER_NAME_STOP_WORDS = {
  # add more according to need     
 }
 
+# Words never reported as key terms from titles skipped by the character filter
+MISSED_TITLE_STOP_WORDS = frozenset({
+    "a", "an", "the", "is", "was", "were", "of", "for", "with", "in", "on", "at",
+    "by", "to", "and", "or", "but", "i", "you", "he", "she", "it", "we", "they",
+    "my", "your", "his", "her", "its", "our", "their", "com", "net", "org", "www",
+})
+
 # Additional words to ignore specifically for creator-level downloads
 CREATOR_DOWNLOAD_DEFAULT_FOLDER_IGNORE_WORDS = {
     "poll", "cover", "fan-art", "fanart", "requests", "request", "holiday",
@@ -1,18 +1,47 @@
 # --- Standard Library Imports ---
+import threading
 import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from urllib.parse import urlparse
 
 # --- Third-Party Library Imports ---
 import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- Local Application Imports ---
-from ..utils.network_utils import extract_post_info, prepare_cookies_for_request
+from ..utils.network_utils import extract_post_info, prepare_cookies_for_request, get_http_session
 from ..config.constants import (
-    STYLE_DATE_POST_TITLE
+    STYLE_DATE_POST_TITLE, PAGE_PREFETCH_WINDOW, PAGE_REQUEST_MIN_INTERVAL_S
 )
 
 
+def _decode_json_response(response):
+    """
+    Decodes a JSON API response, using 'orjson' when it is installed.
+
+    orjson parses the raw bytes directly, which is several times faster than
+    response.json() on multi-MB post-list pages. Both raise a ValueError
+    subclass on malformed JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _retry_after_seconds(response, default_delay):
+    """Returns the delay requested by a 429 response's Retry-After header, or `default_delay`."""
+    retry_after = response.headers.get('Retry-After', '').strip()
+    if retry_after.isdigit():
+        return int(retry_after)
+    return default_delay
+
+
 def fetch_posts_paginated(api_url_base, headers, offset, logger, cancellation_event=None, pause_event=None, cookies_dict=None):
     """
     Fetches a single page of posts from the API with retry logic.
@@ -58,14 +87,19 @@ def fetch_posts_paginated(api_url_base, headers, offset, logger, cancellation_ev
         logger(log_message)
 
         try:
-            response = requests.get(paginated_url, headers=headers, timeout=(15, 90), cookies=cookies_dict)
+            response = get_http_session().get(paginated_url, headers=headers, timeout=(15, 90), cookies=cookies_dict)
+            if response.status_code == 429 and attempt < max_retries - 1:
+                delay = _retry_after_seconds(response, retry_delay * (2 ** attempt))
+                logger(f"   ⚠️ Rate limited (429) on page fetch. Retrying in {delay} seconds...")
+                time.sleep(delay)
+                continue
             response.raise_for_status()
 
             if 'application/json' not in response.headers.get('Content-Type', '').lower():
                 logger(f"⚠️ Unexpected content type from API: {response.headers.get('Content-Type')}. Body: {response.text[:200]}")
                 return []
 
-            return response.json()
+            return _decode_json_response(response)
 
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
             logger(f"   ⚠️ Retryable network error on page fetch (Attempt {attempt + 1}): {e}")
@@ -88,6 +122,99 @@ def fetch_posts_paginated(api_url_base, headers, offset, logger, cancellation_ev
     raise RuntimeError(f"Failed to fetch page {paginated_url} after all attempts.")
 
 
+def _fetch_page_at(start_at, is_past_last_page, *fetch_args):
+    """
+    Waits until `start_at` (a time.monotonic() value), then fetches the page.
+
+    Returns an empty page without a request if `is_past_last_page()` has
+    become true meanwhile, i.e. an earlier page already ended the feed.
+    """
+    delay = start_at - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    if is_past_last_page():
+        return []
+    return fetch_posts_paginated(*fetch_args)
+
+
+def iter_pages_prefetched(api_url_base, headers, start_offset, page_size, logger, cancellation_event=None,
+                          pause_event=None, cookies_dict=None, end_page=None):
+    """
+    Yields pages of posts in order while the following pages are fetched in the background.
+
+    Up to PAGE_PREFETCH_WINDOW pages are requested concurrently in a sliding
+    window, so processing of one page overlaps the network round-trips of the
+    next ones. Request starts are still spaced PAGE_REQUEST_MIN_INTERVAL_S
+    apart so the window does not burst into the API's rate limit. Pages are
+    always yielded in offset order. An error fetching a page is raised when
+    that page is reached. Once a page comes back short, empty or with an
+    error, no later offsets are scheduled, and prefetches past it that have
+    not started yet return an empty page without a request. Closing the
+    generator cancels the outstanding fetches.
+
+    Args:
+        api_url_base (str): The base URL for the user's posts.
+        headers (dict): The request headers.
+        start_offset (int): The offset of the first page.
+        page_size (int): The number of posts per page.
+        logger (callable): Function to log messages.
+        cancellation_event (threading.Event): Event to signal cancellation.
+        pause_event (threading.Event): Event to signal pause.
+        cookies_dict (dict): A dictionary of cookies to include in the request.
+        end_page (int, optional): The last page number to fetch.
+
+    Yields:
+        tuple: (offset, list of post data dictionaries).
+    """
+    end_offset = end_page * page_size if end_page else None
+    executor = ThreadPoolExecutor(max_workers=PAGE_PREFETCH_WINDOW, thread_name_prefix='PageFetch_')
+    pending = deque()
+    next_offset = start_offset
+    next_start_at = time.monotonic()
+    # The lowest offset whose page ended the feed (short, empty or failed), once one is known.
+    last_page_state = {'offset': None}
+    last_page_lock = threading.Lock()
+
+    def is_past_last_page(offset):
+        with last_page_lock:
+            return last_page_state['offset'] is not None and offset > last_page_state['offset']
+
+    def note_page_done(offset, future):
+        if future.cancelled():
+            return
+        if future.exception() is None:
+            posts = future.result()
+            if isinstance(posts, list) and len(posts) >= page_size:
+                return
+        with last_page_lock:
+            if last_page_state['offset'] is None or offset < last_page_state['offset']:
+                last_page_state['offset'] = offset
+
+    try:
+        while True:
+            while len(pending) < PAGE_PREFETCH_WINDOW and (end_offset is None or next_offset < end_offset):
+                if cancellation_event and cancellation_event.is_set():
+                    break
+                if is_past_last_page(next_offset):
+                    break
+                next_start_at = max(next_start_at, time.monotonic())
+                future = executor.submit(_fetch_page_at, next_start_at, partial(is_past_last_page, next_offset),
+                                         api_url_base, headers, next_offset, logger,
+                                         cancellation_event, pause_event, cookies_dict)
+                future.add_done_callback(partial(note_page_done, next_offset))
+                next_start_at += PAGE_REQUEST_MIN_INTERVAL_S
+                pending.append((next_offset, future))
+                next_offset += page_size
+            if not pending:
+                return
+            offset, future = pending.popleft()
+            yield offset, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 def fetch_post_comments(api_domain, service, user_id, post_id, headers, logger, cancellation_event=None, pause_event=None, cookies_dict=None):
     """Fetches all comments for a specific post."""
     if cancellation_event and cancellation_event.is_set():
@@ -97,9 +224,9 @@ def fetch_post_comments(api_domain, service, user_id, post_id, headers, logger,
     logger(f"   Fetching comments: {comments_api_url}")
     
     try:
-        response = requests.get(comments_api_url, headers=headers, timeout=(10, 30), cookies=cookies_dict)
+        response = get_http_session().get(comments_api_url, headers=headers, timeout=(10, 30), cookies=cookies_dict)
         response.raise_for_status()
-        return response.json()
+        return _decode_json_response(response)
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Error fetching comments for post {post_id}: {e}")
     except ValueError as e:
@@ -142,9 +269,9 @@ manga_filename_style_for_sort_check =None
         direct_post_api_url =f"https://{api_domain }/api/v1/{service }/user/{user_id }/post/{target_post_id }"
         logger (f"   Attempting direct fetch for target post: {direct_post_api_url }")
         try :
-            direct_response =requests .get (direct_post_api_url ,headers =headers ,timeout =(10 ,30 ),cookies =cookies_for_api )
+            direct_response =get_http_session ().get (direct_post_api_url ,headers =headers ,timeout =(10 ,30 ),cookies =cookies_for_api )
             direct_response .raise_for_status ()
-            direct_post_data =direct_response .json ()
+            direct_post_data =_decode_json_response (direct_response )
             if isinstance (direct_post_data ,list )and direct_post_data :
                 direct_post_data =direct_post_data [0 ]
             if isinstance (direct_post_data ,dict )and 'post'in direct_post_data and isinstance (direct_post_data ['post'],dict ):
@@ -181,6 +308,7 @@ manga_filename_style_for_sort_check =None
             logger (f"   Manga Mode: Starting fetch from page 1 (offset 0).")
         if end_page :
             logger (f"   Manga Mode: Will fetch up to page {end_page }.")
+        manga_page_iterator =iter_pages_prefetched (api_base_url ,headers ,current_offset_manga ,page_size ,logger ,cancellation_event ,pause_event ,cookies_dict =cookies_for_api ,end_page =end_page )
         while True :
             if pause_event and pause_event .is_set ():
                 logger ("   Manga mode post fetching paused...")
@@ -198,7 +326,7 @@ manga_filename_style_for_sort_check =None
                 logger (f"   Manga Mode: Reached specified end page ({end_page }). Stopping post fetch.")
                 break 
             try :
-                posts_batch_manga =fetch_posts_paginated (api_base_url ,headers ,current_offset_manga ,logger ,cancellation_event ,pause_event ,cookies_dict =cookies_for_api )
+                current_offset_manga ,posts_batch_manga =next (manga_page_iterator )
                 if not isinstance (posts_batch_manga ,list ):
                     logger (f"❌ API Error (Manga Mode): Expected list of posts, got {type (posts_batch_manga )}.")
                     break 
@@ -211,7 +339,8 @@ manga_filename_style_for_sort_check =None
                     break 
                 all_posts_for_manga_mode .extend (posts_batch_manga )
                 current_offset_manga +=page_size 
-                time .sleep (0.6 )
+            except StopIteration :
+                break 
             except RuntimeError as e :
                 if "cancelled by user"in str (e ).lower ():
                     logger (f"ℹ️ Manga mode pagination stopped due to cancellation: {e }")
@@ -222,6 +351,7 @@ manga_filename_style_for_sort_check =None
                 logger (f"❌ Unexpected error during manga mode fetch: {e }")
                 traceback .print_exc ()
                 break 
+        manga_page_iterator .close ()
         if cancellation_event and cancellation_event .is_set ():return 
         if all_posts_for_manga_mode :
             logger (f"   Manga Mode: Fetched {len (all_posts_for_manga_mode )} total posts. Sorting by publication date (oldest first)...")
@@ -263,59 +393,64 @@ manga_filename_style_for_sort_check =None
         current_offset =(start_page -1 )*page_size 
         current_page_num =start_page 
         logger (f"   Starting from page {current_page_num } (calculated offset {current_offset }).")
-    while True :
-        if pause_event and pause_event .is_set ():
-            logger ("   Post fetching loop paused...")
-            while pause_event .is_set ():
-                if cancellation_event and cancellation_event .is_set ():
-                    logger ("   Post fetching loop cancelled while paused.")
+    page_iterator =iter_pages_prefetched (api_base_url ,headers ,current_offset ,page_size ,logger ,cancellation_event ,pause_event ,cookies_dict =cookies_for_api ,end_page =None if target_post_id else end_page )
+    try :
+        while True :
+            if pause_event and pause_event .is_set ():
+                logger ("   Post fetching loop paused...")
+                while pause_event .is_set ():
+                    if cancellation_event and cancellation_event .is_set ():
+                        logger ("   Post fetching loop cancelled while paused.")
+                        break 
+                    time .sleep (0.5 )
+                if not (cancellation_event and cancellation_event .is_set ()):logger ("   Post fetching loop resumed.")
+            if cancellation_event and cancellation_event .is_set ():
+                logger ("   Post fetching loop cancelled.")
+                break 
+            if target_post_id and processed_target_post_flag :
+                break 
+            if not target_post_id and end_page and current_page_num >end_page :
+                logger (f"✅ Reached specified end page ({end_page }) for creator feed. Stopping.")
+                break 
+            try :
+                current_offset ,posts_batch =next (page_iterator )
+                if not isinstance (posts_batch ,list ):
+                    logger (f"❌ API Error: Expected list of posts, got {type (posts_batch )} at page {current_page_num } (offset {current_offset }).")
                     break 
-                time .sleep (0.5 )
-            if not (cancellation_event and cancellation_event .is_set ()):logger ("   Post fetching loop resumed.")
-        if cancellation_event and cancellation_event .is_set ():
-            logger ("   Post fetching loop cancelled.")
-            break 
-        if target_post_id and processed_target_post_flag :
-            break 
-        if not target_post_id and end_page and current_page_num >end_page :
-            logger (f"✅ Reached specified end page ({end_page }) for creator feed. Stopping.")
-            break 
-        try :
-            posts_batch =fetch_posts_paginated (api_base_url ,headers ,current_offset ,logger ,cancellation_event ,pause_event ,cookies_dict =cookies_for_api )
-            if not isinstance (posts_batch ,list ):
-                logger (f"❌ API Error: Expected list of posts, got {type (posts_batch )} at page {current_page_num } (offset {current_offset }).")
+            except StopIteration :
+                break 
+            except RuntimeError as e :
+                if "cancelled by user"in str (e ).lower ():
+                     logger (f"ℹ️ Pagination stopped due to cancellation: {e }")
+                else :
+                    logger (f"❌ {e }\n   Aborting pagination at page {current_page_num } (offset {current_offset }).")
+                break 
+            except Exception as e :
+                logger (f"❌ Unexpected error fetching page {current_page_num } (offset {current_offset }): {e }")
+                traceback .print_exc ()
+                break 
+            if not posts_batch :
+                if target_post_id and not processed_target_post_flag :
+                    logger (f"❌ Target post {target_post_id } not found after checking all available pages (API returned no more posts at offset {current_offset }).")
+                elif not target_post_id :
+                    if current_page_num ==(start_page or 1 ):
+                         logger (f"😕 No posts found on the first page checked (page {current_page_num }, offset {current_offset }).")
+                    else :
+                         logger (f"✅ Reached end of posts (no more content from API at offset {current_offset }).")
                 break 
-        except RuntimeError as e :
-            if "cancelled by user"in str (e ).lower ():
-                 logger (f"ℹ️ Pagination stopped due to cancellation: {e }")
-            else :
-                logger (f"❌ {e }\n   Aborting pagination at page {current_page_num } (offset {current_offset }).")
-            break 
-        except Exception as e :
-            logger (f"❌ Unexpected error fetching page {current_page_num } (offset {current_offset }): {e }")
-            traceback .print_exc ()
-            break 
-        if not posts_batch :
             if target_post_id and not processed_target_post_flag :
-                logger (f"❌ Target post {target_post_id } not found after checking all available pages (API returned no more posts at offset {current_offset }).")
+                matching_post =next ((p for p in posts_batch if str (p .get ('id'))==str (target_post_id )),None )
+                if matching_post :
+                    logger (f"🎯 Found target post {target_post_id } on page {current_page_num } (offset {current_offset }).")
+                    yield [matching_post ]
+                    processed_target_post_flag =True 
             elif not target_post_id :
-                if current_page_num ==(start_page or 1 ):
-                     logger (f"😕 No posts found on the first page checked (page {current_page_num }, offset {current_offset }).")
-                else :
-                     logger (f"✅ Reached end of posts (no more content from API at offset {current_offset }).")
-            break 
-        if target_post_id and not processed_target_post_flag :
-            matching_post =next ((p for p in posts_batch if str (p .get ('id'))==str (target_post_id )),None )
-            if matching_post :
-                logger (f"🎯 Found target post {target_post_id } on page {current_page_num } (offset {current_offset }).")
-                yield [matching_post ]
-                processed_target_post_flag =True 
-        elif not target_post_id :
-            yield posts_batch 
-        if processed_target_post_flag :
-            break 
-        current_offset +=page_size 
-        current_page_num +=1 
-        time .sleep (0.6 )
+                yield posts_batch 
+            if processed_target_post_flag :
+                break 
+            current_offset +=page_size 
+            current_page_num +=1 
+    finally :
+        page_iterator .close ()
     if target_post_id and not processed_target_post_flag and not (cancellation_event and cancellation_event .is_set ()):
         logger (f"❌ Target post {target_post_id } could not be found after checking all relevant pages (final check after loop).")
\ No newline at end of file
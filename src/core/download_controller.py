@@ -0,0 +1,68 @@
+# --- Standard Library Imports ---
+import threading
+import traceback
+
+# --- PyQt5 Imports ---
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, Qt
+
+
+class DownloadController(QObject):
+    """
+    Runs download orchestration tasks on one long-lived QThread.
+
+    The post fetcher for a multi-threaded download used to get a fresh
+    Python thread per download. Instead, the controller is moved onto a
+    single QThread at startup and each download's fetch-and-submit loop is
+    handed to it through a queued signal, so starting a download no longer
+    creates an OS thread. If a download starts while an earlier fetcher is
+    still unwinding on the controller thread, the new one gets a thread of
+    its own instead of queuing behind it. The post worker pool itself is
+    unchanged.
+    """
+    start_requested = pyqtSignal(object, tuple)
+    log_signal = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self._busy = False
+        self._busy_lock = threading.Lock()
+        self.start_requested.connect(self._run_task, Qt.QueuedConnection)
+
+    def start_download(self, task_fn, *args):
+        """Runs `task_fn(*args)` on the controller thread, or on a new thread if it is busy. Safe to call from any thread."""
+        with self._busy_lock:
+            controller_busy = self._busy
+            self._busy = True
+        if controller_busy:
+            threading.Thread(target=self._call_task, args=(task_fn, args), name="PostFetcher", daemon=True).start()
+        else:
+            self.start_requested.emit(task_fn, args)
+
+    @pyqtSlot(object, tuple)
+    def _run_task(self, task_fn, args):
+        try:
+            self._call_task(task_fn, args)
+        finally:
+            with self._busy_lock:
+                self._busy = False
+
+    def _call_task(self, task_fn, args):
+        try:
+            task_fn(*args)
+        except Exception as e:
+            self.log_signal.emit(f"❌ Unhandled error in download controller task: {e}\n{traceback.format_exc()}")
+
+
+def create_download_controller():
+    """
+    Creates a DownloadController running on its own started QThread.
+
+    Returns:
+        tuple: (DownloadController, QThread). Stop the thread with quit() and wait().
+    """
+    controller_thread = QThread()
+    controller_thread.setObjectName("DownloadController")
+    controller = DownloadController()
+    controller.moveToThread(controller_thread)
+    controller_thread.start()
+    return controller, controller_thread
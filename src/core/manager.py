@@ -4,12 +4,13 @@ import time
 import os
 import json
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from concurrent.futures import as_completed, Future
 
 # --- Local Application Imports ---
 # These imports reflect the new, organized project structure.
 from .api_client import download_from_api
 from .workers import PostProcessorWorker, DownloadThread
+from .thread_pool import create_post_worker_pool
 from ..config.constants import (
     STYLE_DATE_BASED, STYLE_POST_TITLE_GLOBAL_NUMBERING,
     MAX_THREADS, POST_WORKER_BATCH_THRESHOLD, POST_WORKER_NUM_BATCHES,
@@ -128,7 +129,7 @@ class DownloadManager:
         """
         try:
             num_workers = min(config.get('num_threads', 4), MAX_THREADS)
-            self.thread_pool = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix='PostWorker_')
+            self.thread_pool = create_post_worker_pool(num_workers, thread_name_prefix='PostWorker_')
             
             # Fetch posts
             # In a real implementation, this would call `api_client.download_from_api`
@@ -156,7 +157,7 @@ class DownloadManager:
                     break
                 # Each PostProcessorWorker gets the queue to send its own updates
                 worker = PostProcessorWorker(post_data, config, self.progress_queue)
-                future = self.thread_pool.submit(worker.process)
+                future = self.thread_pool.submit_for_post(post_data.get('id'), worker.process)
                 future.add_done_callback(self._handle_future_result)
                 self.active_futures.append(future)
         
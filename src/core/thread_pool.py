@@ -0,0 +1,104 @@
+# --- Standard Library Imports ---
+import itertools
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor as StdThreadPoolExecutor
+
+# --- Third-Party Library Imports ---
+try:
+    from threadlet import ThreadPoolExecutor as ThreadletPoolExecutor
+except ImportError:
+    ThreadletPoolExecutor = None
+
+# --- Local Application Imports ---
+from ..config.constants import (
+    POST_WORKER_POOL_IDLE_TIMEOUT_SECONDS, POST_WORKER_NUM_BATCHES,
+    SOFT_WARNING_THREAD_THRESHOLD
+)
+
+# Flag to indicate if the faster 'threadlet' executor can be used.
+THREADLET_AVAILABLE = ThreadletPoolExecutor is not None
+
+
+def _create_executor(max_workers, thread_name_prefix):
+    """Creates a single executor, preferring 'threadlet' when installed."""
+    if THREADLET_AVAILABLE:
+        return ThreadletPoolExecutor(
+            max_workers=max_workers,
+            idle_timeout=POST_WORKER_POOL_IDLE_TIMEOUT_SECONDS,
+            name=thread_name_prefix.rstrip('_')
+        )
+    return StdThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+
+class SegmentedPostWorkerPool:
+    """
+    Spreads post processing tasks over several independent executors.
+
+    Each segment has its own work queue and lock, so with a high thread count
+    the submitting fetcher thread and the workers no longer contend on a
+    single queue. Tasks for a given post always go to the same segment.
+    """
+
+    def __init__(self, max_workers, num_segments, thread_name_prefix='PostWorker_'):
+        num_segments = max(1, min(num_segments, max_workers))
+        workers_per_segment = math.ceil(max_workers / num_segments)
+        self.max_workers = max_workers
+        self._segments = [
+            _create_executor(workers_per_segment, f"{thread_name_prefix}S{index}_")
+            for index in range(num_segments)
+        ]
+        self._round_robin = itertools.count()
+        self._round_robin_lock = threading.Lock()
+
+    @property
+    def num_segments(self):
+        return len(self._segments)
+
+    def _segment_for_key(self, segment_key):
+        if segment_key is None:
+            with self._round_robin_lock:
+                index = next(self._round_robin)
+        else:
+            try:
+                index = int(segment_key)
+            except (TypeError, ValueError):
+                index = hash(segment_key)
+        return self._segments[index % len(self._segments)]
+
+    def submit(self, fn, *args, **kwargs):
+        """Submits a task to the next segment in round-robin order."""
+        return self._segment_for_key(None).submit(fn, *args, **kwargs)
+
+    def submit_for_post(self, post_id, fn, *args, **kwargs):
+        """Submits a task to the segment selected by the post ID."""
+        return self._segment_for_key(post_id).submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """Shuts down every segment with the same semantics as Executor.shutdown."""
+        for segment in self._segments:
+            segment.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def create_post_worker_pool(max_workers, thread_name_prefix='PostWorker_'):
+    """
+    Creates the pool used to run PostProcessorWorker tasks.
+
+    Uses 'threadlet' when it is installed, since its submit path avoids the
+    idle-semaphore bookkeeping of the standard library executor. Idle workers
+    are kept alive for POST_WORKER_POOL_IDLE_TIMEOUT_SECONDS so batched
+    submissions do not pay thread start-up cost again.
+
+    Above SOFT_WARNING_THREAD_THRESHOLD workers the pool is split into
+    POST_WORKER_NUM_BATCHES segments; below it a single segment is used so
+    one slow post cannot hold back tasks queued behind it.
+
+    Args:
+        max_workers (int): The maximum number of worker threads.
+        thread_name_prefix (str): Prefix for the worker thread names.
+
+    Returns:
+        SegmentedPostWorkerPool: The created pool.
+    """
+    num_segments = POST_WORKER_NUM_BATCHES if max_workers > SOFT_WARNING_THREAD_THRESHOLD else 1
+    return SegmentedPostWorkerPool(max_workers, num_segments, thread_name_prefix=thread_name_prefix)
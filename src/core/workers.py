@@ -1,6 +1,5 @@
 # --- Standard Library Imports ---
 import os
-import queue
 import re
 import threading
 import time
@@ -10,11 +9,11 @@ import http
 import html
 import json
 from collections import deque
-import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed, CancelledError, Future
 from io import BytesIO
 from urllib .parse import urlparse 
 import requests
+from urllib3 .exceptions import DecodeError ,ProtocolError ,ReadTimeoutError ,SSLError 
 # --- Third-Party Library Imports ---
 try:
     from PIL import Image
@@ -25,22 +24,41 @@ from PyQt5 .QtCore import Qt ,QThread ,pyqtSignal ,QMutex ,QMutexLocker ,QObject
 # --- Local Application Imports ---
 from .api_client import download_from_api, fetch_post_comments
 from ..services.multipart_downloader import download_file_in_parts, MULTIPART_DOWNLOADER_AVAILABLE
+from ..services.async_downloader import stream_file_with_aiohttp, ASYNC_DOWNLOADER_AVAILABLE
+from ..services.uring_writer import open_part_file_for_write
+from ..services.image_compressor import compress_image_to_webp
 from ..services.drive_downloader import (
     download_mega_file, download_gdrive_file, download_dropbox_file
 )
 # Corrected Imports:
 from ..utils.file_utils import (
     is_image, is_video, is_zip, is_rar, is_archive, is_audio, KNOWN_NAMES,
-    clean_filename, clean_folder_name
+    clean_filename, clean_folder_name, new_content_hasher
 )
-from ..utils.network_utils import prepare_cookies_for_request, get_link_platform
+from ..utils.network_utils import prepare_cookies_for_request, get_link_platform, get_http_session
+from ..utils.fast_queue import QUEUE_EMITTER_TYPES
 from ..utils.text_utils import (
     is_title_match_for_character, is_filename_match_for_character, strip_html_tags,
+    compile_skip_words_pattern, compile_remove_words_pattern,
     extract_folder_name_from_title, # This was the function causing the error
     match_folders_from_title, match_folders_from_filename_enhanced
 )
 from ..config.constants import *
 
+
+def is_incomplete_read_error (exc ):
+    """Returns True if a download error was a truncated body, which is queued to retry later rather than failed."""
+    if isinstance (exc ,http .client .IncompleteRead ):
+        return True 
+    if isinstance (getattr (exc ,'__cause__',None ),http .client .IncompleteRead ):
+        return True 
+    if exc is None :
+        return False 
+    if "incompleteread"in str (exc ).lower ():
+        return True 
+    return isinstance (exc ,tuple )and any ("incompleteread"in str (arg ).lower ()for arg in exc if isinstance (arg ,(str ,Exception )))
+
+
 class PostProcessorSignals (QObject ):
     progress_signal =pyqtSignal (str )
     file_download_status_signal =pyqtSignal (bool )
@@ -79,6 +97,10 @@ class PostProcessorWorker:
     manga_global_file_counter_ref =None ,
     session_file_path=None,
     session_lock=None,
+    sync_file_io =True ,
+    use_async_http =False ,
+    use_uring =True ,
+    skip_words_pattern =None ,
     ):
         self .post =post_data 
         self .download_root =download_root 
@@ -117,6 +139,7 @@ class PostProcessorWorker:
         self .manga_filename_style =manga_filename_style 
         self .char_filter_scope =char_filter_scope 
         self .remove_from_filename_words_list =remove_from_filename_words_list if remove_from_filename_words_list is not None else []
+        self .remove_words_pattern =compile_remove_words_pattern (self .remove_from_filename_words_list )
         self .allow_multipart_download =allow_multipart_download 
         self .manga_date_file_counter_ref =manga_date_file_counter_ref 
         self .selected_cookie_file =selected_cookie_file 
@@ -130,13 +153,23 @@ class PostProcessorWorker:
         self .creator_download_folder_ignore_words =creator_download_folder_ignore_words 
         self.session_file_path = session_file_path
         self.session_lock = session_lock
+        self .sync_file_io =sync_file_io 
+        self .use_async_http =use_async_http 
+        self .use_uring =use_uring 
+        self .skip_words_pattern =skip_words_pattern if skip_words_pattern is not None else compile_skip_words_pattern (self .skip_words_list )
+
+        # Filter scopes are fixed for the whole run; resolve them once instead of per post and per file.
+        self ._skip_words_on_files =bool (self .skip_words_list )and self .skip_words_scope in (SKIP_SCOPE_FILES ,SKIP_SCOPE_BOTH )
+        self ._skip_words_on_posts =bool (self .skip_words_list )and self .skip_words_scope in (SKIP_SCOPE_POSTS ,SKIP_SCOPE_BOTH )
+        self ._char_filter_on_title =self .char_filter_scope in (CHAR_SCOPE_TITLE ,CHAR_SCOPE_BOTH )
+        self ._char_filter_on_comments =self .char_filter_scope ==CHAR_SCOPE_COMMENTS 
         if self .compress_images and Image is None :
 
             self .logger ("⚠️ Image compression disabled: Pillow library not found.")
             self .compress_images =False 
     def _emit_signal (self ,signal_type_str ,*payload_args ):
         """Helper to emit signal either directly or via queue."""
-        if isinstance (self .emitter ,queue .Queue ):
+        if isinstance (self .emitter ,QUEUE_EMITTER_TYPES ):
             self .emitter .put ({'type':signal_type_str ,'payload':payload_args })
         elif self .emitter and hasattr (self .emitter ,f"{signal_type_str }_signal"):
             signal_attr =getattr (self .emitter ,f"{signal_type_str }_signal")
@@ -157,6 +190,50 @@ class PostProcessorWorker:
                 time .sleep (0.5 )
             if not self .check_cancel ():self .logger (f"   {context_message } resumed.")
         return False 
+    def _find_skip_word (self ,text ):
+        """Returns the first skip word found in the text (case-insensitive), or None."""
+        if not self .skip_words_pattern or not text :
+            return None 
+        match =self .skip_words_pattern .search (text )
+        return match .group (0 ).lower ()if match else None 
+
+    def _iter_response_chunks (self ,response ):
+        """Yields the response body in chunks, reading the raw socket synchronously when sync_file_io is set."""
+        if not self .sync_file_io :
+            yield from response .iter_content (chunk_size =1 *1024 *1024 )
+            return 
+        response .raw .decode_content =True 
+        read_buffer =bytearray (SYNC_FILE_IO_CHUNK_SIZE )
+        read_view =memoryview (read_buffer )
+        while True :
+            # Map urllib3 errors to the requests exceptions iter_content() raises, so the
+            # retry handling treats timeouts and dropped connections the same on both paths.
+            try :
+                bytes_read =response .raw .readinto (read_buffer )
+            except ProtocolError as e :
+                raise requests .exceptions .ChunkedEncodingError (e )
+            except DecodeError as e :
+                raise requests .exceptions .ContentDecodingError (e )
+            except ReadTimeoutError as e :
+                raise requests .exceptions .ConnectionError (e )
+            except SSLError as e :
+                raise requests .exceptions .SSLError (e )
+            if not bytes_read :
+                return 
+            yield read_view [:bytes_read ]
+    def _is_single_stream_attempt_complete (self ,status_code ,total_size_bytes ,received_bytes ,api_original_filename ):
+        """Checks whether a finished single-stream attempt received the whole file."""
+        if status_code !=200 :
+            return False 
+        if total_size_bytes >0 :
+            if received_bytes ==total_size_bytes :
+                return True 
+            self .logger (f"   ⚠️ Single-stream attempt for '{api_original_filename }' incomplete: received {received_bytes } of {total_size_bytes } bytes.")
+            return False 
+        if received_bytes ==0 :
+            return True 
+        self .logger (f"   ⚠️ Mismatch for '{api_original_filename }': Server reported 0 bytes, but received {received_bytes } bytes this attempt.")
+        return False 
     def _download_single_file (self ,file_info ,target_folder_path ,headers ,original_post_id_for_log ,skip_event ,
     post_title ="",file_index_in_post =0 ,num_files_in_this_post =1 ,
     manga_date_file_counter_ref =None ):
@@ -200,12 +277,11 @@ class PostProcessorWorker:
             self .logger (f"   Retrying with forced filename: '{filename_to_save_in_main_path }'")
         else :
 
-            if self .skip_words_list and (self .skip_words_scope ==SKIP_SCOPE_FILES or self .skip_words_scope ==SKIP_SCOPE_BOTH ):
-                filename_to_check_for_skip_words =api_original_filename .lower ()
-                for skip_word in self .skip_words_list :
-                    if skip_word .lower ()in filename_to_check_for_skip_words :
-                        self .logger (f"   -> Skip File (Keyword in Original Name '{skip_word }'): '{api_original_filename }'. Scope: {self .skip_words_scope }")
-                        return 0 ,1 ,api_original_filename ,False ,FILE_DOWNLOAD_STATUS_SKIPPED ,None 
+            if self ._skip_words_on_files :
+                skip_word =self ._find_skip_word (api_original_filename )
+                if skip_word :
+                    self .logger (f"   -> Skip File (Keyword in Original Name '{skip_word }'): '{api_original_filename }'. Scope: {self .skip_words_scope }")
+                    return 0 ,1 ,api_original_filename ,False ,FILE_DOWNLOAD_STATUS_SKIPPED ,None 
 
             cleaned_original_api_filename =clean_filename (api_original_filename )
 
@@ -339,14 +415,10 @@ class PostProcessorWorker:
 
 
 
-            if self .remove_from_filename_words_list and filename_to_save_in_main_path :
+            if self .remove_words_pattern and filename_to_save_in_main_path :
 
                 base_name_for_removal ,ext_for_removal =os .path .splitext (filename_to_save_in_main_path )
-                modified_base_name =base_name_for_removal 
-                for word_to_remove in self .remove_from_filename_words_list :
-                    if not word_to_remove :continue 
-                    pattern =re .compile (re .escape (word_to_remove ),re .IGNORECASE )
-                    modified_base_name =pattern .sub ("",modified_base_name )
+                modified_base_name =self .remove_words_pattern .sub ("",base_name_for_removal )
                 modified_base_name =re .sub (r'[_.\s-]+',' ',modified_base_name )
                 modified_base_name =re .sub (r'\s+',' ',modified_base_name )
                 modified_base_name =modified_base_name .strip ()
@@ -412,6 +484,11 @@ class PostProcessorWorker:
         download_successful_flag =False 
         last_exception_for_retry_later =None 
 
+        # The opt-in aiohttp path replaces the whole requests stream below: sync_file_io, use_uring
+        # and the shared session's 502/503/504 adapter retries do not apply to it.
+        use_async_transfer =(self .use_async_http and ASYNC_DOWNLOADER_AVAILABLE and not (
+        self .allow_multipart_download and MULTIPART_DOWNLOADER_AVAILABLE and 
+        min (self .num_file_threads ,MAX_PARTS_FOR_MULTIPART_DOWNLOAD )>1 ))
         response_for_this_attempt =None 
         for attempt_num_single_stream in range (max_retries +1 ):
             response_for_this_attempt =None 
@@ -422,7 +499,43 @@ class PostProcessorWorker:
                     self .logger (f"   Retrying download for '{api_original_filename }' (Overall Attempt {attempt_num_single_stream +1 }/{max_retries +1 })...")
                     time .sleep (retry_delay *(2 **(attempt_num_single_stream -1 )))
                 self ._emit_signal ('file_download_status',True )
-                response =requests .get (file_url ,headers =headers ,timeout =(15 ,300 ),stream =True ,cookies =cookies_to_use_for_file )
+                if use_async_transfer :
+                    self .logger (f"⬇️ Downloading (Single Stream, async): '{api_original_filename }' [Base Name: '{filename_to_save_in_main_path }']")
+                    current_single_stream_part_path =os .path .join (target_folder_path ,f"{unique_part_file_stem_on_disk }{temp_file_ext_for_unique_part }.part")
+                    async_progress_state ={'time':time .time (),'next_bytes':PROGRESS_REPORT_MIN_BYTES_STEP ,'step':PROGRESS_REPORT_MIN_BYTES_STEP }
+                    def report_async_progress (received_bytes ,expected_bytes ):
+                        if expected_bytes <=0 or received_bytes <async_progress_state ['next_bytes']:return 
+                        async_progress_state ['step']=min (async_progress_state ['step']*2 ,PROGRESS_REPORT_MAX_BYTES_STEP )
+                        async_progress_state ['next_bytes']=received_bytes +async_progress_state ['step']
+                        now =time .time ()
+                        if now -async_progress_state ['time']>1 :
+                            self ._emit_signal ('file_progress',api_original_filename ,(received_bytes ,expected_bytes ))
+                            async_progress_state ['time']=now 
+                    try :
+                        stream_result =stream_file_with_aiohttp (
+                        file_url ,current_single_stream_part_path ,headers ,cookies =cookies_to_use_for_file ,timeout =(15 ,300 ),
+                        cancellation_event =self .cancellation_event ,skip_event =skip_event ,pause_event =self .pause_event ,
+                        progress_callback =report_async_progress 
+                        )
+                    except Exception :
+                        if os .path .exists (current_single_stream_part_path ):os .remove (current_single_stream_part_path )
+                        raise 
+                    total_size_bytes =stream_result .total_size_bytes 
+                    if stream_result .interrupted or self .check_cancel ()or (skip_event and skip_event .is_set ()):
+                        if os .path .exists (current_single_stream_part_path ):os .remove (current_single_stream_part_path )
+                        break 
+                    if self ._is_single_stream_attempt_complete (stream_result .status_code ,total_size_bytes ,stream_result .downloaded_bytes ,api_original_filename ):
+                        calculated_file_hash =stream_result .content_hash 
+                        downloaded_size_bytes =stream_result .downloaded_bytes 
+                        downloaded_part_file_path =current_single_stream_part_path 
+                        was_multipart_download =False 
+                        download_successful_flag =True 
+                        break 
+                    if os .path .exists (current_single_stream_part_path ):
+                        try :os .remove (current_single_stream_part_path )
+                        except OSError as e_rem_part :self .logger (f"  -> Failed to remove .part file after failed single stream attempt: {e_rem_part }")
+                    continue 
+                response =get_http_session ().get (file_url ,headers =headers ,timeout =(15 ,300 ),stream =True ,cookies =cookies_to_use_for_file )
                 response .raise_for_status ()
                 total_size_bytes =int (response .headers .get ('Content-Length',0 ))
                 num_parts_for_file =min (self .num_file_threads ,MAX_PARTS_FOR_MULTIPART_DOWNLOAD )
@@ -468,48 +581,39 @@ class PostProcessorWorker:
 
                     current_single_stream_part_path =os .path .join (target_folder_path ,f"{unique_part_file_stem_on_disk }{temp_file_ext_for_unique_part }.part")
                     current_attempt_downloaded_bytes =0 
-                    md5_hasher =hashlib .md5 ()
+                    content_hasher =new_content_hasher ()
                     last_progress_time =time .time ()
+                    progress_report_step =PROGRESS_REPORT_MIN_BYTES_STEP 
+                    next_progress_report_bytes =progress_report_step 
 
                     single_stream_exception =None 
                     try :
-                        with open (current_single_stream_part_path ,'wb')as f_part :
-                            for chunk in response .iter_content (chunk_size =1 *1024 *1024 ):
+                        with open_part_file_for_write (current_single_stream_part_path ,use_uring =self .use_uring )as f_part :
+                            for chunk in self ._iter_response_chunks (response ):
                                 if self ._check_pause (f"Chunk download for '{api_original_filename }'"):break 
                                 if self .check_cancel ()or (skip_event and skip_event .is_set ()):break 
                                 if chunk :
                                     f_part .write (chunk )
-                                    md5_hasher .update (chunk )
+                                    content_hasher .update (chunk )
                                     current_attempt_downloaded_bytes +=len (chunk )
-                                    if time .time ()-last_progress_time >1 and total_size_bytes >0 :
-                                        self ._emit_signal ('file_progress',api_original_filename ,(current_attempt_downloaded_bytes ,total_size_bytes ))
-                                        last_progress_time =time .time ()
+                                    if current_attempt_downloaded_bytes >=next_progress_report_bytes and total_size_bytes >0 :
+                                        progress_report_step =min (progress_report_step *2 ,PROGRESS_REPORT_MAX_BYTES_STEP )
+                                        next_progress_report_bytes =current_attempt_downloaded_bytes +progress_report_step 
+                                        now =time .time ()
+                                        if now -last_progress_time >1 :
+                                            self ._emit_signal ('file_progress',api_original_filename ,(current_attempt_downloaded_bytes ,total_size_bytes ))
+                                            last_progress_time =now 
 
                         if self .check_cancel ()or (skip_event and skip_event .is_set ())or (self .pause_event and self .pause_event .is_set ()and not (current_attempt_downloaded_bytes >0 or (total_size_bytes ==0 and response .status_code ==200 ))):
                             if os .path .exists (current_single_stream_part_path ):os .remove (current_single_stream_part_path )
                             break 
 
 
-                        attempt_is_complete =False 
-                        if response .status_code ==200 :
-                            if total_size_bytes >0 :
-                                if current_attempt_downloaded_bytes ==total_size_bytes :
-                                    attempt_is_complete =True 
-                                else :
-                                    self .logger (f"   ⚠️ Single-stream attempt for '{api_original_filename }' incomplete: received {current_attempt_downloaded_bytes } of {total_size_bytes } bytes.")
-                            elif total_size_bytes ==0 :
-                                if current_attempt_downloaded_bytes ==0 :
-                                    attempt_is_complete =True 
-                                else :
-                                    self .logger (f"   ⚠️ Mismatch for '{api_original_filename }': Server reported 0 bytes, but received {current_attempt_downloaded_bytes } bytes this attempt.")
+                        attempt_is_complete =self ._is_single_stream_attempt_complete (response .status_code ,total_size_bytes ,current_attempt_downloaded_bytes ,api_original_filename )
 
 
-                            elif current_attempt_downloaded_bytes >0 :
-                                attempt_is_complete =True 
-                                self .logger (f"   ⚠️ Single-stream for '{api_original_filename }' received {current_attempt_downloaded_bytes } bytes (no Content-Length from server). Assuming complete for this attempt as stream ended.")
-
                         if attempt_is_complete :
-                            calculated_file_hash =md5_hasher .hexdigest ()
+                            calculated_file_hash =content_hasher .hexdigest ()
                             downloaded_size_bytes =current_attempt_downloaded_bytes 
                             downloaded_part_file_path =current_single_stream_part_path 
                             was_multipart_download =False 
@@ -520,6 +624,9 @@ class PostProcessorWorker:
                                 try :os .remove (current_single_stream_part_path )
                                 except OSError as e_rem_part :self .logger (f"  -> Failed to remove .part file after failed single stream attempt: {e_rem_part }")
 
+                    except requests .exceptions .RequestException :
+                        if os .path .exists (current_single_stream_part_path ):os .remove (current_single_stream_part_path )
+                        raise 
                     except Exception as e_write :
                         self .logger (f"   ❌ Error writing single-stream to disk for '{api_original_filename }': {e_write }")
                         if os .path .exists (current_single_stream_part_path ):os .remove (current_single_stream_part_path )
@@ -564,19 +671,7 @@ class PostProcessorWorker:
             self .logger (f"❌ Download failed for '{api_original_filename }' after {max_retries +1 } attempts.")
 
 
-            is_actually_incomplete_read =False 
-            if isinstance (last_exception_for_retry_later ,http .client .IncompleteRead ):
-                is_actually_incomplete_read =True 
-            elif hasattr (last_exception_for_retry_later ,'__cause__')and isinstance (last_exception_for_retry_later .__cause__ ,http .client .IncompleteRead ):
-                is_actually_incomplete_read =True 
-
-            elif last_exception_for_retry_later is not None :
-                str_exc =str (last_exception_for_retry_later ).lower ()
-
-                if "incompleteread"in str_exc or (isinstance (last_exception_for_retry_later ,tuple )and any ("incompleteread"in str (arg ).lower ()for arg in last_exception_for_retry_later if isinstance (arg ,(str ,Exception )))):
-                    is_actually_incomplete_read =True 
-
-            if is_actually_incomplete_read :
+            if is_incomplete_read_error (last_exception_for_retry_later ):
                 self .logger (f"   Marking '{api_original_filename }' for potential retry later due to IncompleteRead.")
                 retry_later_details ={
                 'file_info':file_info ,
@@ -605,14 +700,16 @@ class PostProcessorWorker:
                 }
                 return 0 ,1 ,filename_to_save_in_main_path ,was_original_name_kept_flag ,FILE_DOWNLOAD_STATUS_FAILED_PERMANENTLY_THIS_SESSION ,permanent_failure_details 
         if self ._check_pause (f"Post-download hash check for '{api_original_filename }'"):return 0 ,1 ,filename_to_save_in_main_path ,was_original_name_kept_flag ,FILE_DOWNLOAD_STATUS_SKIPPED ,None 
+        # Hold the lock for the membership test only; logging and file removal happen outside it.
         with self .downloaded_file_hashes_lock :
-            if calculated_file_hash in self .downloaded_file_hashes :
-                self .logger (f"   -> Skip Saving Duplicate (Hash Match): '{api_original_filename }' (Hash: {calculated_file_hash [:8 ]}...).")
-                with self .downloaded_files_lock :self .downloaded_files .add (filename_to_save_in_main_path )
-                if downloaded_part_file_path and os .path .exists (downloaded_part_file_path ):
-                    try :os .remove (downloaded_part_file_path )
-                    except OSError as e_rem :self .logger (f"  -> Failed to remove .part file for hash duplicate: {e_rem }")
-                return 0 ,1 ,filename_to_save_in_main_path ,was_original_name_kept_flag ,FILE_DOWNLOAD_STATUS_SKIPPED ,None 
+            is_duplicate_hash =calculated_file_hash in self .downloaded_file_hashes 
+        if is_duplicate_hash :
+            self .logger (f"   -> Skip Saving Duplicate (Hash Match): '{api_original_filename }' (Hash: {calculated_file_hash [:8 ]}...).")
+            with self .downloaded_files_lock :self .downloaded_files .add (filename_to_save_in_main_path )
+            if downloaded_part_file_path and os .path .exists (downloaded_part_file_path ):
+                try :os .remove (downloaded_part_file_path )
+                except OSError as e_rem :self .logger (f"  -> Failed to remove .part file for hash duplicate: {e_rem }")
+            return 0 ,1 ,filename_to_save_in_main_path ,was_original_name_kept_flag ,FILE_DOWNLOAD_STATUS_SKIPPED ,None 
 
         effective_save_folder =target_folder_path 
         filename_after_styling_and_word_removal =filename_to_save_in_main_path 
@@ -637,32 +734,27 @@ class PostProcessorWorker:
             img_content_for_pillow =None 
             try :
                 with open (downloaded_part_file_path ,'rb')as f_img_in :
-                    img_content_for_pillow =BytesIO (f_img_in .read ())
-
-                with Image .open (img_content_for_pillow )as img_obj :
-                    if img_obj .mode =='P':img_obj =img_obj .convert ('RGBA')
-                    elif img_obj .mode not in ['RGB','RGBA','L']:img_obj =img_obj .convert ('RGB')
-
-                    compressed_output_io =BytesIO ()
-                    img_obj .save (compressed_output_io ,format ='WebP',quality =80 ,method =4 )
-                    compressed_size =compressed_output_io .getbuffer ().nbytes 
-
-                    if compressed_size <downloaded_size_bytes *0.9 :
-                        self .logger (f"   Compression success: {compressed_size /(1024 *1024 ):.2f} MB.")
-                        data_to_write_io =compressed_output_io 
-                        data_to_write_io .seek (0 )
-                        base_name_orig ,_ =os .path .splitext (filename_after_compression )
-                        filename_after_compression =base_name_orig +'.webp'
-                        self .logger (f"   Updated filename (compressed): {filename_after_compression }")
-                    else :
-                        self .logger (f"   Compression skipped: WebP not significantly smaller.")
+                    img_content_for_pillow =f_img_in .read ()
+
+                compressed_output_io =BytesIO (compress_image_to_webp (img_content_for_pillow ))
+                compressed_size =compressed_output_io .getbuffer ().nbytes 
+
+                if compressed_size <downloaded_size_bytes *0.9 :
+                    self .logger (f"   Compression success: {compressed_size /(1024 *1024 ):.2f} MB.")
+                    data_to_write_io =compressed_output_io 
+                    data_to_write_io .seek (0 )
+                    base_name_orig ,_ =os .path .splitext (filename_after_compression )
+                    filename_after_compression =base_name_orig +'.webp'
+                    self .logger (f"   Updated filename (compressed): {filename_after_compression }")
+                else :
+                    self .logger (f"   Compression skipped: WebP not significantly smaller.")
 
-                        if compressed_output_io :compressed_output_io .close ()
+                    if compressed_output_io :compressed_output_io .close ()
             except Exception as comp_e :
                 self .logger (f"❌ Compression failed for '{api_original_filename }': {comp_e }. Saving original.")
 
             finally :
-                if img_content_for_pillow :img_content_for_pillow .close ()
+                img_content_for_pillow =None 
 
         final_filename_on_disk =filename_after_compression 
 
@@ -764,7 +856,7 @@ class PostProcessorWorker:
         post_is_candidate_by_file_char_match_in_comment_scope =False 
         char_filter_that_matched_file_in_comment_scope =None 
         char_filter_that_matched_comment =None 
-        if current_character_filters and (self .char_filter_scope ==CHAR_SCOPE_TITLE or self .char_filter_scope ==CHAR_SCOPE_BOTH ):
+        if current_character_filters and self ._char_filter_on_title :
             if self ._check_pause (f"Character title filter for post {post_id }"):return 0 ,num_potential_files_in_post ,[],[],[],None 
             for idx ,filter_item_obj in enumerate (current_character_filters ):
                 if self .check_cancel ():break 
@@ -794,7 +886,7 @@ class PostProcessorWorker:
                 original_api_att_name =att_info .get ('name')or os .path .basename (att_info ['path'].lstrip ('/'))
                 if original_api_att_name :
                     all_files_from_post_api_for_char_check .append ({'_original_name_for_log':original_api_att_name })
-        if current_character_filters and self .char_filter_scope ==CHAR_SCOPE_COMMENTS :
+        if current_character_filters and self ._char_filter_on_comments :
             self .logger (f"   [Char Scope: Comments] Phase 1: Checking post files for matches before comments for post ID '{post_id }'.")
             if self ._check_pause (f"File check (comments scope) for post {post_id }"):return 0 ,num_potential_files_in_post ,[],[],[],None 
             for file_info_item in all_files_from_post_api_for_char_check :
@@ -814,7 +906,7 @@ class PostProcessorWorker:
                     if post_is_candidate_by_file_char_match_in_comment_scope :break 
                 if post_is_candidate_by_file_char_match_in_comment_scope :break 
             self .logger (f"   [Char Scope: Comments] Phase 1 Result: post_is_candidate_by_file_char_match_in_comment_scope = {post_is_candidate_by_file_char_match_in_comment_scope }")
-        if current_character_filters and self .char_filter_scope ==CHAR_SCOPE_COMMENTS :
+        if current_character_filters and self ._char_filter_on_comments :
             if not post_is_candidate_by_file_char_match_in_comment_scope :
                 if self ._check_pause (f"Comment check for post {post_id }"):return 0 ,num_potential_files_in_post ,[],[],[],None 
                 self .logger (f"   [Char Scope: Comments] Phase 2: No file match found. Checking post comments for post ID '{post_id }'.")
@@ -866,19 +958,18 @@ class PostProcessorWorker:
                 self .logger (f"   -> Skip Post (Scope: Title - No Char Match): Title '{post_title [:50 ]}' does not match character filters.")
                 self ._emit_signal ('missed_character_post',post_title ,"No title match for character filter")
                 return 0 ,num_potential_files_in_post ,[],[],[],None 
-            if self .char_filter_scope ==CHAR_SCOPE_COMMENTS and not post_is_candidate_by_file_char_match_in_comment_scope and not post_is_candidate_by_comment_char_match :
+            if self ._char_filter_on_comments and not post_is_candidate_by_file_char_match_in_comment_scope and not post_is_candidate_by_comment_char_match :
                 self .logger (f"   -> Skip Post (Scope: Comments - No Char Match in Comments): Post ID '{post_id }', Title '{post_title [:50 ]}...'")
                 if self .emitter and hasattr (self .emitter ,'missed_character_post_signal'):
                     self ._emit_signal ('missed_character_post',post_title ,"No character match in files or comments (Comments scope)")
                 return 0 ,num_potential_files_in_post ,[],[],[],None 
-        if self .skip_words_list and (self .skip_words_scope ==SKIP_SCOPE_POSTS or self .skip_words_scope ==SKIP_SCOPE_BOTH ):
+        if self ._skip_words_on_posts :
             if self ._check_pause (f"Skip words (post title) for post {post_id }"):return 0 ,num_potential_files_in_post ,[],[],[],None 
-            post_title_lower =post_title .lower ()
-            for skip_word in self .skip_words_list :
-                if skip_word .lower ()in post_title_lower :
-                    self .logger (f"   -> Skip Post (Keyword in Title '{skip_word }'): '{post_title [:50 ]}...'. Scope: {self .skip_words_scope }")
-                    return 0 ,num_potential_files_in_post ,[],[],[],None 
-        if not self .extract_links_only and self .manga_mode_active and current_character_filters and (self .char_filter_scope ==CHAR_SCOPE_TITLE or self .char_filter_scope ==CHAR_SCOPE_BOTH )and not post_is_candidate_by_title_char_match :
+            skip_word =self ._find_skip_word (post_title )
+            if skip_word :
+                self .logger (f"   -> Skip Post (Keyword in Title '{skip_word }'): '{post_title [:50 ]}...'. Scope: {self .skip_words_scope }")
+                return 0 ,num_potential_files_in_post ,[],[],[],None 
+        if not self .extract_links_only and self .manga_mode_active and current_character_filters and self ._char_filter_on_title and not post_is_candidate_by_title_char_match :
             self .logger (f"   -> Skip Post (Manga Mode with Title/Both Scope - No Title Char Match): Title '{post_title [:50 ]}' doesn't match filters.")
             self ._emit_signal ('missed_character_post',post_title ,"Manga Mode: No title match for character filter (Title/Both scope)")
             return 0 ,num_potential_files_in_post ,[],[],[],None 
@@ -891,14 +982,14 @@ class PostProcessorWorker:
             if self ._check_pause (f"Subfolder determination for post {post_id }"):return 0 ,num_potential_files_in_post ,[],[],[],None 
             primary_char_filter_for_folder =None 
             log_reason_for_folder =""
-            if self .char_filter_scope ==CHAR_SCOPE_COMMENTS and char_filter_that_matched_comment :
+            if self ._char_filter_on_comments and char_filter_that_matched_comment :
                 if post_is_candidate_by_file_char_match_in_comment_scope and char_filter_that_matched_file_in_comment_scope :
                     primary_char_filter_for_folder =char_filter_that_matched_file_in_comment_scope 
                     log_reason_for_folder ="Matched char filter in filename (Comments scope)"
                 elif post_is_candidate_by_comment_char_match and char_filter_that_matched_comment :
                     primary_char_filter_for_folder =char_filter_that_matched_comment 
                     log_reason_for_folder ="Matched char filter in comments (Comments scope, no file match)"
-            elif (self .char_filter_scope ==CHAR_SCOPE_TITLE or self .char_filter_scope ==CHAR_SCOPE_BOTH )and char_filter_that_matched_title :
+            elif self ._char_filter_on_title and char_filter_that_matched_title :
                 primary_char_filter_for_folder =char_filter_that_matched_title 
                 log_reason_for_folder ="Matched char filter in title"
             if primary_char_filter_for_folder :
@@ -1041,8 +1132,8 @@ class PostProcessorWorker:
             if self ._check_pause (f"Folder keyword skip check for post {post_id }"):return 0 ,num_potential_files_in_post ,[],[],[],None 
             for folder_name_to_check in base_folder_names_for_post_content :
                 if not folder_name_to_check :continue 
-                if any (skip_word .lower ()in folder_name_to_check .lower ()for skip_word in self .skip_words_list ):
-                    matched_skip =next ((sw for sw in self .skip_words_list if sw .lower ()in folder_name_to_check .lower ()),"unknown_skip_word")
+                matched_skip =self ._find_skip_word (folder_name_to_check )
+                if matched_skip :
                     self .logger (f"   -> Skip Post (Folder Keyword): Potential folder '{folder_name_to_check }' contains '{matched_skip }'.")
                     return 0 ,num_potential_files_in_post ,[],[],[],None 
         if (self .show_external_links or self .extract_links_only )and post_content_html :
@@ -1367,9 +1458,9 @@ class PostProcessorWorker:
         if not self .extract_links_only and (total_downloaded_this_post >0 or not (
         (current_character_filters and (
         (self .char_filter_scope ==CHAR_SCOPE_TITLE and not post_is_candidate_by_title_char_match )or 
-        (self .char_filter_scope ==CHAR_SCOPE_COMMENTS and not post_is_candidate_by_file_char_match_in_comment_scope and not post_is_candidate_by_comment_char_match )
+        (self ._char_filter_on_comments and not post_is_candidate_by_file_char_match_in_comment_scope and not post_is_candidate_by_comment_char_match )
         ))or 
-        (self .skip_words_list and (self .skip_words_scope ==SKIP_SCOPE_POSTS or self .skip_words_scope ==SKIP_SCOPE_BOTH )and any (sw .lower ()in post_title .lower ()for sw in self .skip_words_list ))
+        (self ._skip_words_on_posts and self ._find_skip_word (post_title ))
         )):
             top_file_name_for_history ="N/A"
             if post_main_file_info and post_main_file_info .get ('name'):
@@ -1446,6 +1537,10 @@ class DownloadThread (QThread ):
     cookie_text ="",
     session_file_path=None,
     session_lock=None,
+    sync_file_io =True ,
+    use_async_http =False ,
+    use_uring =True ,
+    skip_words_pattern =None ,
     ):
         super ().__init__ ()
         self .api_url_input =api_url_input 
@@ -1498,6 +1593,10 @@ class DownloadThread (QThread ):
         self .manga_global_file_counter_ref =manga_global_file_counter_ref 
         self.session_file_path = session_file_path
         self.session_lock = session_lock
+        self .sync_file_io =sync_file_io 
+        self .use_async_http =use_async_http 
+        self .use_uring =use_uring 
+        self .skip_words_pattern =skip_words_pattern if skip_words_pattern is not None else compile_skip_words_pattern (self .skip_words_list )
         self.history_candidates_buffer =deque (maxlen =8 )
         if self .compress_images and Image is None :
             self .logger ("⚠️ Image compression disabled: Pillow library not found (DownloadThread).")
@@ -1539,16 +1638,15 @@ class DownloadThread (QThread ):
             highest_num =0 
             if os .path .isdir (series_scan_dir ):
                 self .logger (f"ℹ️ [Thread] Manga Date Mode: Scanning for existing files in '{series_scan_dir }'...")
+                prefix_to_check =clean_filename (self .manga_date_prefix .strip ())if self .manga_date_prefix and self .manga_date_prefix .strip ()else ""
+                leading_number_pattern =re .compile (r"(\d+)")
                 for dirpath ,_ ,filenames_in_dir in os .walk (series_scan_dir ):
                     for filename_to_check in filenames_in_dir :
-
-                        prefix_to_check =clean_filename (self .manga_date_prefix .strip ())if self .manga_date_prefix and self .manga_date_prefix .strip ()else ""
                         name_part_to_match =filename_to_check 
                         if prefix_to_check and name_part_to_match .startswith (prefix_to_check ):
                             name_part_to_match =name_part_to_match [len (prefix_to_check ):].lstrip ()
 
-                        base_name_no_ext =os .path .splitext (name_part_to_match )[0 ]
-                        match =re .match (r"(\d+)",base_name_no_ext )
+                        match =leading_number_pattern .match (name_part_to_match )
                         if match :highest_num =max (highest_num ,int (match .group (1 )))
             self .manga_date_file_counter_ref =[highest_num +1 ,threading .Lock ()]
             self .logger (f"ℹ️ [Thread] Manga Date Mode: Initialized date-based counter at {self .manga_date_file_counter_ref [0 ]}.")
@@ -1630,6 +1728,10 @@ class DownloadThread (QThread ):
                     creator_download_folder_ignore_words =self .creator_download_folder_ignore_words ,
                     session_file_path=self.session_file_path,
                     session_lock=self.session_lock,
+                    sync_file_io =self .sync_file_io ,
+                    use_async_http =self .use_async_http ,
+                    use_uring =self .use_uring ,
+                    skip_words_pattern =self .skip_words_pattern ,
                     )
                     try :
                         dl_count ,skip_count ,kept_originals_this_post ,retryable_failures ,permanent_failures ,history_data =post_processing_worker .process ()
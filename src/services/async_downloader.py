@@ -0,0 +1,261 @@
+# --- Standard Library Imports ---
+import asyncio
+import http.client
+import os
+import threading
+
+# --- Third-Party Library Imports ---
+import requests
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# --- Local Application Imports ---
+from ..config.constants import MAX_THREADS
+from ..utils.file_utils import new_content_hasher
+
+# --- Module Constants ---
+ASYNC_STREAM_CHUNK_SIZE = 64 * 1024  # 64 KB per iter_chunked() read
+PAUSE_POLL_INTERVAL_SECONDS = 0.5
+
+# Flag to indicate if the optional 'aiohttp' backend can be used.
+ASYNC_DOWNLOADER_AVAILABLE = aiohttp is not None
+
+_loop = None
+_loop_lock = threading.Lock()
+_session = None
+
+
+class AsyncStreamResult:
+    """The outcome of a single streamed download attempt."""
+
+    def __init__(self, status_code, total_size_bytes, downloaded_bytes, content_hash, interrupted):
+        self.status_code = status_code
+        self.total_size_bytes = total_size_bytes
+        self.downloaded_bytes = downloaded_bytes
+        self.content_hash = content_hash
+        self.interrupted = interrupted
+
+
+def _get_event_loop():
+    """Starts the shared background event loop thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="AsyncHttpLoop", daemon=True).start()
+        return _loop
+
+
+def _get_session():
+    """Returns the shared ClientSession. Must be called on the event loop thread."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=MAX_THREADS)
+        # Cookies are passed per request; never carry response cookies over to later requests.
+        _session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+    return _session
+
+
+def _write_and_hash(f_part, content_hasher, chunk):
+    f_part.write(chunk)
+    content_hasher.update(chunk)
+
+
+async def _stream_to_file(url, part_file_path, headers, cookies, timeout, cancellation_event,
+                          skip_event, pause_event, progress_callback):
+    connect_timeout, read_timeout = timeout
+    client_timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+    session = _get_session()
+    async with session.get(url, headers=headers, cookies=cookies, timeout=client_timeout) as response:
+        response.raise_for_status()
+        total_size_bytes = int(response.headers.get('Content-Length', 0))
+        content_hasher = new_content_hasher()
+        downloaded_bytes = 0
+        interrupted = False
+        # Disk writes and hashing run in the loop's executor so a slow disk
+        # does not stall the socket reads of every other transfer.
+        loop = asyncio.get_running_loop()
+        f_part = await loop.run_in_executor(None, open, part_file_path, 'wb')
+        try:
+            async for chunk in response.content.iter_chunked(ASYNC_STREAM_CHUNK_SIZE):
+                while pause_event and pause_event.is_set() and not cancellation_event.is_set():
+                    await asyncio.sleep(PAUSE_POLL_INTERVAL_SECONDS)
+                if cancellation_event.is_set() or (skip_event and skip_event.is_set()):
+                    interrupted = True
+                    break
+                await loop.run_in_executor(None, _write_and_hash, f_part, content_hasher, chunk)
+                downloaded_bytes += len(chunk)
+                if progress_callback:
+                    progress_callback(downloaded_bytes, total_size_bytes)
+        finally:
+            await loop.run_in_executor(None, f_part.close)
+        return AsyncStreamResult(response.status, total_size_bytes, downloaded_bytes,
+                                 content_hasher.hexdigest(), interrupted)
+
+
+def stream_file_with_aiohttp(url, part_file_path, headers, cookies=None, timeout=(15, 300),
+                             cancellation_event=None, skip_event=None, pause_event=None,
+                             progress_callback=None):
+    """
+    Streams a URL to a local .part file on the shared aiohttp event loop.
+
+    All transfers share one event loop thread and one connection pool, so
+    in-flight socket reads no longer each need their own blocked thread.
+    The calling worker thread waits for the result. aiohttp errors are
+    re-raised as the matching 'requests' exceptions so callers keep their
+    existing retry handling.
+
+    Args:
+        url (str): The file URL.
+        part_file_path (str): The path of the .part file to write.
+        headers (dict): The request headers.
+        cookies (dict, optional): Cookies to send with the request.
+        timeout (tuple): (connect, read) timeouts in seconds.
+        cancellation_event (threading.Event): Event to stop the transfer.
+        skip_event (threading.Event, optional): Event to skip the current file.
+        pause_event (threading.Event, optional): Event to pause the transfer.
+        progress_callback (callable, optional): Called with (downloaded, total) on the loop thread.
+
+    Returns:
+        AsyncStreamResult: The outcome of the attempt.
+    """
+    if not ASYNC_DOWNLOADER_AVAILABLE:
+        raise RuntimeError("aiohttp is not installed.")
+    cancellation_event = cancellation_event or threading.Event()
+    coroutine = _stream_to_file(url, part_file_path, headers, cookies, timeout, cancellation_event,
+                                skip_event, pause_event, progress_callback)
+    future = asyncio.run_coroutine_threadsafe(coroutine, _get_event_loop())
+    try:
+        return future.result()
+    except aiohttp.ClientResponseError as e:
+        raise requests.exceptions.HTTPError(f"{e.status} {e.message} for url: {url}") from e
+    except aiohttp.ClientPayloadError as e:
+        # A truncated body is retried like a dropped connection, and is chained from an
+        # IncompleteRead so the worker can still queue the file for a later retry.
+        incomplete_read = http.client.IncompleteRead(b'')
+        incomplete_read.__cause__ = e
+        raise requests.exceptions.ConnectionError(f"Connection broken: IncompleteRead ({e})") from incomplete_read
+    except aiohttp.ClientConnectionError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+    except asyncio.TimeoutError as e:
+        raise requests.exceptions.Timeout(f"Timed out while downloading {url}") from e
+
+
+def _write_at(fd, data, offset, seek_lock):
+    """Writes all of `data` at `offset`. Runs in an executor thread; `seek_lock` keeps seek+write atomic without pwrite."""
+    view = memoryview(data)
+    while view:
+        if hasattr(os, 'pwrite'):
+            written = os.pwrite(fd, view, offset)
+        else:
+            with seek_lock:
+                os.lseek(fd, offset, os.SEEK_SET)
+                written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+async def _download_range(url, fd, seek_lock, part_num, total_parts, start_byte, end_byte, headers, cookies,
+                          timeout, cancellation_event, skip_event, pause_event, logger_func, on_progress,
+                          max_retries, retry_delay):
+    loop = asyncio.get_running_loop()
+    connect_timeout, read_timeout = timeout
+    client_timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+    chunk_headers = dict(headers)
+    if end_byte != -1:
+        chunk_headers['Range'] = f"bytes={start_byte}-{end_byte}"
+    label = f"[Chunk {part_num + 1}/{total_parts}]"
+    bytes_this_chunk = 0
+
+    for attempt in range(max_retries + 1):
+        if cancellation_event.is_set() or (skip_event and skip_event.is_set()):
+            return bytes_this_chunk, False
+        while pause_event and pause_event.is_set() and not cancellation_event.is_set():
+            await asyncio.sleep(PAUSE_POLL_INTERVAL_SECONDS)
+        try:
+            if attempt > 0:
+                logger_func(f"   {label} Retrying (Attempt {attempt + 1}/{max_retries + 1})...")
+                await asyncio.sleep(retry_delay * (2 ** (attempt - 1)))
+                # The retry rewrites the range from its start.
+                on_progress(part_num, 0, -bytes_this_chunk)
+                bytes_this_chunk = 0
+
+            logger_func(f"   🚀 {label} Starting download: bytes {start_byte}-{end_byte if end_byte != -1 else 'EOF'}")
+            session = _get_session()
+            async with session.get(url, headers=chunk_headers, cookies=cookies, timeout=client_timeout) as response:
+                response.raise_for_status()
+                async for data_segment in response.content.iter_chunked(ASYNC_STREAM_CHUNK_SIZE):
+                    while pause_event and pause_event.is_set() and not cancellation_event.is_set():
+                        await asyncio.sleep(PAUSE_POLL_INTERVAL_SECONDS)
+                    if cancellation_event.is_set() or (skip_event and skip_event.is_set()):
+                        return bytes_this_chunk, False
+                    await loop.run_in_executor(None, _write_at, fd, data_segment,
+                                               start_byte + bytes_this_chunk, seek_lock)
+                    bytes_this_chunk += len(data_segment)
+                    on_progress(part_num, bytes_this_chunk, len(data_segment))
+            return bytes_this_chunk, True
+
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+            logger_func(f"   ❌ {label} Retryable error: {e or type(e).__name__}")
+        except aiohttp.ClientResponseError as e:
+            logger_func(f"   ❌ {label} Non-retryable error: {e.status} {e.message}")
+            return bytes_this_chunk, False
+        except Exception as e:
+            logger_func(f"   ❌ {label} Unexpected error: {e}")
+            return bytes_this_chunk, False
+
+    return bytes_this_chunk, False
+
+
+async def _download_ranges(url, fd, chunk_ranges, headers, cookies, timeout, cancellation_event, skip_event,
+                           pause_event, logger_func, on_progress, max_retries, retry_delay):
+    total_parts = len(chunk_ranges)
+    seek_lock = threading.Lock()
+    return await asyncio.gather(*[
+        _download_range(url, fd, seek_lock, part_num, total_parts, start_byte, end_byte, headers, cookies,
+                        timeout, cancellation_event, skip_event, pause_event, logger_func, on_progress,
+                        max_retries, retry_delay)
+        for part_num, (start_byte, end_byte) in enumerate(chunk_ranges)
+    ])
+
+
+def download_ranges_with_aiohttp(url, temp_file_path, chunk_ranges, headers, cookies, cancellation_event,
+                                 skip_event, pause_event, logger_func, on_progress, max_retries=1,
+                                 retry_delay=2, timeout=(10, 120)):
+    """
+    Downloads byte ranges of one file concurrently on the shared aiohttp event loop.
+
+    Every range is a coroutine gathered on the loop thread rather than a
+    thread of its own, and each one writes its data at its offset in the
+    pre-allocated temp file through a single file descriptor. The writes
+    run in the loop's executor so disk I/O never blocks the loop thread.
+
+    Args:
+        url (str): The file URL.
+        temp_file_path (str): The pre-allocated .part file to write into.
+        chunk_ranges (list): (start_byte, end_byte) tuples; end_byte -1 means no Range header.
+        headers (dict): The request headers.
+        cookies (dict): Cookies to send with each request.
+        cancellation_event (threading.Event): Event to stop all ranges.
+        skip_event (threading.Event): Event to skip the current file.
+        pause_event (threading.Event): Event to pause the transfer.
+        logger_func (callable): Function to log messages.
+        on_progress (callable): Called with (part_num, bytes_this_chunk, bytes_added) on the loop thread.
+        max_retries (int): Retries per range on connection errors.
+        retry_delay (float): Base delay for exponential retry backoff.
+        timeout (tuple): (connect, read) timeouts in seconds.
+
+    Returns:
+        list: (bytes_downloaded, success) for each range, in order.
+    """
+    if not ASYNC_DOWNLOADER_AVAILABLE:
+        raise RuntimeError("aiohttp is not installed.")
+    fd = os.open(temp_file_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+    try:
+        coroutine = _download_ranges(url, fd, chunk_ranges, headers, cookies, timeout, cancellation_event,
+                                     skip_event, pause_event, logger_func, on_progress, max_retries, retry_delay)
+        return asyncio.run_coroutine_threadsafe(coroutine, _get_event_loop()).result()
+    finally:
+        os.close(fd)
@@ -0,0 +1,89 @@
+# --- Standard Library Imports ---
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+# --- Third-Party Library Imports ---
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# --- Module Constants ---
+WEBP_QUALITY = 80
+WEBP_METHOD = 4
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _encode_webp(data, quality=WEBP_QUALITY):
+    """
+    Re-encodes image bytes as WebP. Runs inside a compression worker process.
+
+    Args:
+        data (bytes): The original image file contents.
+        quality (int): The WebP quality setting.
+
+    Returns:
+        bytes: The WebP-encoded image.
+    """
+    with Image.open(BytesIO(data)) as img_obj:
+        if img_obj.mode == 'P':
+            img_obj = img_obj.convert('RGBA')
+        elif img_obj.mode not in ['RGB', 'RGBA', 'L']:
+            img_obj = img_obj.convert('RGB')
+        output_io = BytesIO()
+        img_obj.save(output_io, format='WebP', quality=quality, method=WEBP_METHOD)
+        return output_io.getvalue()
+
+
+def _get_pool():
+    """Creates the shared compression process pool on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Forking a process that already runs download and Qt threads can copy held
+            # locks into the child, so the workers are started with 'spawn' instead.
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                        mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+def compress_image_to_webp(data, quality=WEBP_QUALITY):
+    """
+    Compresses image bytes to WebP in a separate process.
+
+    Pillow's encoder holds the GIL, so encoding inside the download threads
+    serializes on it. The calling thread blocks on the result while the
+    encode runs in one of os.cpu_count() worker processes. If the pool
+    breaks, it is discarded and the image is encoded in the calling thread instead.
+
+    Args:
+        data (bytes): The original image file contents.
+        quality (int): The WebP quality setting.
+
+    Returns:
+        bytes: The WebP-encoded image.
+    """
+    global _pool
+    if Image is None:
+        raise RuntimeError("Pillow is not installed.")
+    try:
+        return _get_pool().submit(_encode_webp, data, quality).result()
+    except BrokenProcessPool:
+        with _pool_lock:
+            _pool = None
+        return _encode_webp(data, quality)
+
+
+def shutdown_compression_pool():
+    """Stops the compression worker processes, if any were started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
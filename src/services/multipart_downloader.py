@@ -1,16 +1,20 @@
 # --- Standard Library Imports ---
 import os
 import time
-import hashlib
 import http.client
 import traceback
 import threading
-import queue
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Third-Party Library Imports ---
 import requests
 
+# --- Local Application Imports ---
+from ..utils.fast_queue import QUEUE_EMITTER_TYPES
+from ..utils.network_utils import get_http_session
+from ..utils.file_utils import new_content_hasher
+from .async_downloader import download_ranges_with_aiohttp, ASYNC_DOWNLOADER_AVAILABLE
+
 # --- Module Constants ---
 CHUNK_DOWNLOAD_RETRY_DELAY = 2
 MAX_CHUNK_DOWNLOAD_RETRIES = 1
@@ -21,6 +25,37 @@ DOWNLOAD_CHUNK_SIZE_ITER = 1024 * 256  # 256 KB per iteration chunk
 MULTIPART_DOWNLOADER_AVAILABLE = True
 
 
+def _record_chunk_progress(progress_data, part_num, bytes_this_chunk, bytes_added, emitter, api_original_filename):
+    """
+    Updates the shared progress state for one chunk and emits a throttled
+    progress update to the UI.
+    """
+    with progress_data['lock']:
+        progress_data['total_downloaded_so_far'] += bytes_added
+        chunk_status = progress_data['chunks_status'][part_num]
+        chunk_status['downloaded'] = bytes_this_chunk
+
+        # Calculate and update speed for this chunk
+        current_time = time.time()
+        speed_state = progress_data['speed_state'][part_num]
+        time_delta = current_time - speed_state[0]
+        if time_delta > 0.5:
+            bytes_delta = bytes_this_chunk - speed_state[1]
+            chunk_status['speed_bps'] = (bytes_delta * 8) / time_delta
+            speed_state[0] = current_time
+            speed_state[1] = bytes_this_chunk
+
+        # Emit progress signal to the UI via the queue
+        global_emit_time_ref = progress_data['last_global_emit_time']
+        if emitter and (current_time - global_emit_time_ref[0] > 0.25):
+            global_emit_time_ref[0] = current_time
+            status_list_copy = [dict(s) for s in progress_data['chunks_status']]
+            if isinstance(emitter, QUEUE_EMITTER_TYPES):
+                emitter.put({'type': 'file_progress', 'payload': (api_original_filename, status_list_copy)})
+            elif hasattr(emitter, 'file_progress_signal'):
+                emitter.file_progress_signal.emit(api_original_filename, status_list_copy)
+
+
 def _download_individual_chunk(
     chunk_url, temp_file_path, start_byte, end_byte, headers,
     part_num, total_parts, progress_data, cancellation_event,
@@ -55,8 +90,6 @@ def _download_individual_chunk(
         chunk_headers['Range'] = f"bytes={start_byte}-{end_byte}"
     
     bytes_this_chunk = 0
-    last_speed_calc_time = time.time()
-    bytes_at_last_speed_calc = 0
 
     # --- Retry Loop ---
     for attempt in range(MAX_CHUNK_DOWNLOAD_RETRIES + 1):
@@ -67,12 +100,10 @@ def _download_individual_chunk(
             if attempt > 0:
                 logger_func(f"   [Chunk {part_num + 1}/{total_parts}] Retrying (Attempt {attempt + 1}/{MAX_CHUNK_DOWNLOAD_RETRIES + 1})...")
                 time.sleep(CHUNK_DOWNLOAD_RETRY_DELAY * (2 ** (attempt - 1)))
-                last_speed_calc_time = time.time()
-                bytes_at_last_speed_calc = bytes_this_chunk
 
             logger_func(f"   🚀 [Chunk {part_num + 1}/{total_parts}] Starting download: bytes {start_byte}-{end_byte if end_byte != -1 else 'EOF'}")
             
-            response = requests.get(chunk_url, headers=chunk_headers, timeout=(10, 120), stream=True, cookies=cookies_for_chunk)
+            response = get_http_session().get(chunk_url, headers=chunk_headers, timeout=(10, 120), stream=True, cookies=cookies_for_chunk)
             response.raise_for_status()
 
             # --- Data Writing Loop ---
@@ -92,30 +123,8 @@ def _download_individual_chunk(
                     if data_segment:
                         f.write(data_segment)
                         bytes_this_chunk += len(data_segment)
-                        
-                        # Update shared progress data structure
-                        with progress_data['lock']:
-                            progress_data['total_downloaded_so_far'] += len(data_segment)
-                            progress_data['chunks_status'][part_num]['downloaded'] = bytes_this_chunk
-                            
-                            # Calculate and update speed for this chunk
-                            current_time = time.time()
-                            time_delta = current_time - last_speed_calc_time
-                            if time_delta > 0.5:
-                                bytes_delta = bytes_this_chunk - bytes_at_last_speed_calc
-                                current_speed_bps = (bytes_delta * 8) / time_delta if time_delta > 0 else 0
-                                progress_data['chunks_status'][part_num]['speed_bps'] = current_speed_bps
-                                last_speed_calc_time = current_time
-                                bytes_at_last_speed_calc = bytes_this_chunk
-                            
-                            # Emit progress signal to the UI via the queue
-                            if emitter and (current_time - global_emit_time_ref[0] > 0.25):
-                                global_emit_time_ref[0] = current_time
-                                status_list_copy = [dict(s) for s in progress_data['chunks_status']]
-                                if isinstance(emitter, queue.Queue):
-                                    emitter.put({'type': 'file_progress', 'payload': (api_original_filename, status_list_copy)})
-                                elif hasattr(emitter, 'file_progress_signal'):
-                                    emitter.file_progress_signal.emit(api_original_filename, status_list_copy)
+                        _record_chunk_progress(progress_data, part_num, bytes_this_chunk, len(data_segment),
+                                               emitter, api_original_filename)
             
             # If we reach here, the download for this chunk was successful
             return bytes_this_chunk, True
@@ -132,6 +141,35 @@ def _download_individual_chunk(
     return bytes_this_chunk, False
 
 
+def _download_chunks_in_threads(file_url, temp_file_path, chunks_ranges, num_parts, headers, progress_data,
+                                cancellation_event, skip_event, pause_event, cookies_for_chunk_session,
+                                logger_func, emitter_for_multipart, api_original_filename):
+    """Downloads the chunks with one thread per chunk (used when aiohttp is not installed)."""
+    chunk_futures = []
+    all_chunks_successful = True
+    total_bytes_from_chunks = 0
+
+    with ThreadPoolExecutor(max_workers=num_parts, thread_name_prefix=f"MPChunk_{api_original_filename[:10]}_") as chunk_pool:
+        for i, (start, end) in enumerate(chunks_ranges):
+            if cancellation_event and cancellation_event.is_set(): all_chunks_successful = False; break
+            chunk_futures.append(chunk_pool.submit(
+                _download_individual_chunk, chunk_url=file_url, temp_file_path=temp_file_path,
+                start_byte=start, end_byte=end, headers=headers, part_num=i, total_parts=num_parts,
+                progress_data=progress_data, cancellation_event=cancellation_event, skip_event=skip_event, global_emit_time_ref=progress_data['last_global_emit_time'],
+                pause_event=pause_event, cookies_for_chunk=cookies_for_chunk_session, logger_func=logger_func, emitter=emitter_for_multipart,
+                api_original_filename=api_original_filename
+            ))
+
+        for future in as_completed(chunk_futures):
+            if cancellation_event and cancellation_event.is_set(): all_chunks_successful = False; break
+            bytes_downloaded_this_chunk, success_this_chunk = future.result()
+            total_bytes_from_chunks += bytes_downloaded_this_chunk
+            if not success_this_chunk:
+                all_chunks_successful = False
+
+    return all_chunks_successful, total_bytes_from_chunks
+
+
 def download_file_in_parts(file_url, save_path, total_size, num_parts, headers, api_original_filename,
                            emitter_for_multipart, cookies_for_chunk_session,
                            cancellation_event, skip_event, logger_func, pause_event):
@@ -176,30 +214,34 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
             for i in range(num_parts)
         ],
         'lock': threading.Lock(),
-        'last_global_emit_time': [time.time()]
+        'last_global_emit_time': [time.time()],
+        'speed_state': [[time.time(), 0] for _ in range(num_parts)]
     }
 
-    chunk_futures = []
     all_chunks_successful = True
     total_bytes_from_chunks = 0
 
-    with ThreadPoolExecutor(max_workers=num_parts, thread_name_prefix=f"MPChunk_{api_original_filename[:10]}_") as chunk_pool:
-        for i, (start, end) in enumerate(chunks_ranges):
-            if cancellation_event and cancellation_event.is_set(): all_chunks_successful = False; break
-            chunk_futures.append(chunk_pool.submit(
-                _download_individual_chunk, chunk_url=file_url, temp_file_path=temp_file_path,
-                start_byte=start, end_byte=end, headers=headers, part_num=i, total_parts=num_parts,
-                progress_data=progress_data, cancellation_event=cancellation_event, skip_event=skip_event, global_emit_time_ref=progress_data['last_global_emit_time'],
-                pause_event=pause_event, cookies_for_chunk=cookies_for_chunk_session, logger_func=logger_func, emitter=emitter_for_multipart,
-                api_original_filename=api_original_filename
-            ))
+    if ASYNC_DOWNLOADER_AVAILABLE:
+        # All ranges run as coroutines on the shared event loop instead of one thread each.
+        def on_progress(part_num, bytes_this_chunk, bytes_added):
+            _record_chunk_progress(progress_data, part_num, bytes_this_chunk, bytes_added,
+                                   emitter_for_multipart, api_original_filename)
 
-        for future in as_completed(chunk_futures):
-            if cancellation_event and cancellation_event.is_set(): all_chunks_successful = False; break
-            bytes_downloaded_this_chunk, success_this_chunk = future.result()
+        chunk_results = download_ranges_with_aiohttp(
+            file_url, temp_file_path, chunks_ranges, headers, cookies_for_chunk_session,
+            cancellation_event, skip_event, pause_event, logger_func, on_progress,
+            max_retries=MAX_CHUNK_DOWNLOAD_RETRIES, retry_delay=CHUNK_DOWNLOAD_RETRY_DELAY
+        )
+        for bytes_downloaded_this_chunk, success_this_chunk in chunk_results:
             total_bytes_from_chunks += bytes_downloaded_this_chunk
             if not success_this_chunk:
                 all_chunks_successful = False
+    else:
+        all_chunks_successful, total_bytes_from_chunks = _download_chunks_in_threads(
+            file_url, temp_file_path, chunks_ranges, num_parts, headers, progress_data,
+            cancellation_event, skip_event, pause_event, cookies_for_chunk_session,
+            logger_func, emitter_for_multipart, api_original_filename
+        )
 
     if cancellation_event and cancellation_event.is_set():
         logger_func(f"   Multi-part download for '{api_original_filename}' cancelled by main event.")
@@ -207,18 +249,18 @@ def download_file_in_parts(file_url, save_path, total_size, num_parts, headers,
     if emitter_for_multipart:
         with progress_data['lock']:
             status_list_copy = [dict(s) for s in progress_data['chunks_status']]
-            if isinstance(emitter_for_multipart, queue.Queue):
+            if isinstance(emitter_for_multipart, QUEUE_EMITTER_TYPES):
                 emitter_for_multipart.put({'type': 'file_progress', 'payload': (api_original_filename, status_list_copy)})
             elif hasattr(emitter_for_multipart, 'file_progress_signal'):
                 emitter_for_multipart.file_progress_signal.emit(api_original_filename, status_list_copy)
 
     if all_chunks_successful and (total_bytes_from_chunks == total_size or total_size == 0):
         logger_func(f"   ✅ Multi-part download successful for '{api_original_filename}'. Total bytes: {total_bytes_from_chunks}")
-        md5_hasher = hashlib.md5()
+        content_hasher = new_content_hasher()
         with open(temp_file_path, 'rb') as f_hash:
             for buf in iter(lambda: f_hash.read(4096*10), b''):
-                md5_hasher.update(buf)
-        calculated_hash = md5_hasher.hexdigest()
+                content_hasher.update(buf)
+        calculated_hash = content_hasher.hexdigest()
         return True, total_bytes_from_chunks, calculated_hash, open(temp_file_path, 'rb')
     else:
         logger_func(f"   ❌ Multi-part download failed for '{api_original_filename}'. Success: {all_chunks_successful}, Bytes: {total_bytes_from_chunks}/{total_size}. Cleaning up.")
@@ -0,0 +1,193 @@
+# --- Standard Library Imports ---
+import os
+import sys
+import threading
+from collections import deque
+
+# --- Third-Party Library Imports ---
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# --- Module Constants ---
+URING_QUEUE_DEPTH = 64
+URING_MAX_BATCH = 32
+URING_FLUSH_INTERVAL_SECONDS = 0.005
+URING_MAX_IN_FLIGHT_PER_FD = 32  # Writers block once this many copied chunks are queued for one file
+
+# Flag to indicate if io_uring writes can be used (Linux with the 'liburing' package).
+IO_URING_AVAILABLE = (
+    liburing is not None and sys.platform.startswith('linux')
+    and hasattr(liburing, 'io_uring_queue_init')
+)
+
+
+class UringOp:
+    """A single queued write: `size` bytes of `buf` to `fd` at `offset`."""
+    __slots__ = ('op', 'fd', 'buf', 'size', 'offset')
+
+    def __init__(self, op, fd, buf, size, offset):
+        self.op = op
+        self.fd = fd
+        self.buf = buf
+        self.size = size
+        self.offset = offset
+
+
+class IoUringBatchEngine:
+    """
+    Batches file writes through a single io_uring on a daemon thread.
+
+    Ops are submitted once `max_batch` are queued or `flush_interval` has
+    passed, so many chunk writes share one io_uring_submit() call. Each fd
+    may have at most `max_in_flight_per_fd` queued ops; submit() blocks
+    beyond that so a slow disk cannot grow the queue without bound. Errors
+    are recorded per file descriptor and raised by wait_for_fd().
+    """
+
+    def __init__(self, queue_depth=URING_QUEUE_DEPTH, max_batch=URING_MAX_BATCH,
+                 flush_interval=URING_FLUSH_INTERVAL_SECONDS,
+                 max_in_flight_per_fd=URING_MAX_IN_FLIGHT_PER_FD):
+        self.max_batch = min(max_batch, queue_depth)
+        self.flush_interval = flush_interval
+        self.max_in_flight_per_fd = max_in_flight_per_fd
+        self._ring = liburing.io_uring()
+        self._cqes = liburing.io_uring_cqes()
+        liburing.io_uring_queue_init(queue_depth, self._ring, 0)
+        self._pending = deque()
+        self._in_flight_per_fd = {}
+        self._errors_per_fd = {}
+        self._condition = threading.Condition()
+        self._wakeup = threading.Event()
+        self.is_broken = False
+        self._thread = threading.Thread(target=self._run, name="IoUringWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, op):
+        """Queues an op for the next batch, blocking while its fd already has too many queued."""
+        with self._condition:
+            while self._in_flight_per_fd.get(op.fd, 0) >= self.max_in_flight_per_fd and not self.is_broken:
+                self._wakeup.set()
+                self._condition.wait()
+            if self.is_broken:
+                raise OSError("io_uring writer is not available.")
+            self._pending.append(op)
+            self._in_flight_per_fd[op.fd] = self._in_flight_per_fd.get(op.fd, 0) + 1
+            batch_ready = len(self._pending) >= self.max_batch
+        if batch_ready:
+            self._wakeup.set()
+
+    def wait_for_fd(self, fd):
+        """Blocks until every queued write for `fd` has completed, then raises any write error."""
+        self._wakeup.set()
+        with self._condition:
+            while self._in_flight_per_fd.get(fd, 0) > 0 and not self.is_broken:
+                self._condition.wait()
+            unfinished = self._in_flight_per_fd.pop(fd, 0)
+            error = self._errors_per_fd.pop(fd, None)
+        if not error and unfinished > 0:
+            error = OSError(f"io_uring writer stopped with {unfinished} write(s) still queued.")
+        if error:
+            raise error
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            with self._condition:
+                batch = [self._pending.popleft() for _ in range(min(self.max_batch, len(self._pending)))]
+            if not batch:
+                continue
+            try:
+                self._submit_batch(batch)
+            except Exception as e:
+                with self._condition:
+                    self.is_broken = True
+                    # Ops still in _pending will never run, so fail every fd with queued writes.
+                    for fd, count in self._in_flight_per_fd.items():
+                        if count > 0:
+                            self._errors_per_fd.setdefault(fd, OSError(f"io_uring batch failed: {e}"))
+                    self._condition.notify_all()
+                return
+
+    def _submit_batch(self, batch):
+        for index, op in enumerate(batch):
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            liburing.io_uring_prep_write(sqe, op.fd, op.buf, op.size, op.offset)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        liburing.io_uring_submit(self._ring)
+        for _ in batch:
+            liburing.io_uring_wait_cqe(self._ring, self._cqes)
+            cqe = self._cqes[0]
+            op = batch[cqe.user_data]
+            result = cqe.res
+            liburing.io_uring_cqe_seen(self._ring, cqe)
+            with self._condition:
+                if result != op.size:
+                    reason = os.strerror(-result) if result < 0 else f"short write ({result}/{op.size} bytes)"
+                    self._errors_per_fd.setdefault(op.fd, OSError(f"io_uring write failed: {reason}"))
+                self._in_flight_per_fd[op.fd] -= 1
+                self._condition.notify_all()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_uring_engine():
+    """Returns the shared IoUringBatchEngine, or None if io_uring cannot be used."""
+    global _engine
+    if not IO_URING_AVAILABLE:
+        return None
+    with _engine_lock:
+        if _engine is None:
+            try:
+                _engine = IoUringBatchEngine()
+            except Exception:
+                _engine = False
+        return _engine if _engine and not _engine.is_broken else None
+
+
+class UringFileWriter:
+    """
+    A minimal binary file object that writes through the io_uring engine.
+
+    Buffers are copied before queuing, so callers may reuse their read
+    buffer. close() waits for all queued writes and raises on failure.
+    """
+
+    def __init__(self, path, engine):
+        self.engine = engine
+        self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self.offset = 0
+
+    def write(self, data):
+        data = bytes(data)
+        self.engine.submit(UringOp('write', self.fd, data, len(data), self.offset))
+        self.offset += len(data)
+        return len(data)
+
+    def close(self):
+        if self.fd is None:
+            return
+        try:
+            self.engine.wait_for_fd(self.fd)
+        finally:
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+def open_part_file_for_write(path, use_uring=True):
+    """Opens a .part file for writing, through io_uring when enabled and available."""
+    engine = get_uring_engine() if use_uring else None
+    if engine:
+        return UringFileWriter(path, engine)
+    return open(path, 'wb')
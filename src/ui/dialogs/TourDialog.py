@@ -71,7 +71,7 @@ class TourDialog(QDialog):
             parent (QWidget, optional): The parent widget. Defaults to None.
         """
         super().__init__(parent)
-        self.settings = QSettings(CONFIG_ORGANIZATION_NAME, self.CONFIG_APP_NAME_TOUR)
+        self.settings = TourDialog._get_tour_settings()
         self.current_step = 0
         self.parent_app = parent_app
 
@@ -110,13 +110,11 @@ class TourDialog(QDialog):
             ("tour_dialog_step8_title", "tour_dialog_step8_content"),
         ]
 
+        # Only the first page is built up front; the rest are translated and
+        # created on demand as the user pages forward, so a skipped tour never builds them.
+        self._pending_steps = steps_content
         self.tour_steps_widgets = []
-        for title_key, content_key in steps_content:
-            title = self._tr(title_key, title_key)
-            content = self._tr(content_key, "Content not found.")
-            step_widget = TourStepWidget(title, content)
-            self.tour_steps_widgets.append(step_widget)
-            self.stacked_widget.addWidget(step_widget)
+        self.step1 = self._build_step_widget(0)
 
         self.setWindowTitle(self._tr("tour_dialog_title", "Welcome to Kemono Downloader!"))
 
@@ -163,9 +161,19 @@ class TourDialog(QDialog):
         except Exception as e:
             print(f"[TourDialog] Error centering dialog: {e}")
 
+    def _build_step_widget(self, index):
+        """Creates the page for step `index` and appends it to the stacked widget."""
+        title_key, content_key = self._pending_steps[index]
+        step_widget = TourStepWidget(self._tr(title_key, title_key), self._tr(content_key, "Content not found."))
+        self.tour_steps_widgets.append(step_widget)
+        self.stacked_widget.addWidget(step_widget)
+        return step_widget
+
     def _next_step_action(self):
         """Moves to the next step or finishes the tour."""
-        if self.current_step < len(self.tour_steps_widgets) - 1:
+        if self.current_step < len(self._pending_steps) - 1:
+            if self.stacked_widget.count() < self.current_step + 2:
+                self._build_step_widget(self.current_step + 1)
             self.current_step += 1
             self.stacked_widget.setCurrentIndex(self.current_step)
         else:
@@ -181,7 +189,7 @@ class TourDialog(QDialog):
 
     def _update_button_states(self):
         """Updates the state and text of navigation buttons."""
-        is_last_step = self.current_step == len(self.tour_steps_widgets) - 1
+        is_last_step = self.current_step == len(self._pending_steps) - 1
         self.next_button.setText(self._tr("tour_dialog_finish_button", "Finish") if is_last_step else self._tr("tour_dialog_next_button", "Next"))
         self.back_button.setEnabled(self.current_step > 0)
 
@@ -199,15 +207,47 @@ class TourDialog(QDialog):
 
     def _save_settings_if_checked(self):
         """Saves the 'never show again' preference to QSettings."""
-        self.settings.setValue(self.TOUR_SHOWN_KEY, self.never_show_again_checkbox.isChecked())
-        self.settings.sync()
+        never_show = self.never_show_again_checkbox.isChecked()
+        if never_show == TourDialog._get_never_show_flag():
+            return
+        # No explicit sync(): QSettings flushes from the event loop and on destruction.
+        self.settings.setValue(self.TOUR_SHOWN_KEY, never_show)
+        TourDialog._never_show_cached = never_show
+
+    _tour_settings = None
+    _never_show_cached = None
+
+    @staticmethod
+    def _get_tour_settings():
+        """Returns the tour's QSettings, created once and shared by the startup check and the dialog."""
+        if TourDialog._tour_settings is None:
+            TourDialog._tour_settings = QSettings(TourDialog.CONFIG_ORGANIZATION_NAME, TourDialog.CONFIG_APP_NAME_TOUR)
+        return TourDialog._tour_settings
+
+    @staticmethod
+    def _get_never_show_flag():
+        """Returns the stored 'never show again' preference, reading QSettings only once."""
+        if TourDialog._never_show_cached is None:
+            TourDialog._never_show_cached = TourDialog._get_tour_settings().value(TourDialog.TOUR_SHOWN_KEY, False, type=bool)
+        return TourDialog._never_show_cached
 
     @staticmethod
     def should_show_tour():
         """Checks QSettings to see if the tour should be shown on startup."""
-        settings = QSettings(TourDialog.CONFIG_ORGANIZATION_NAME, TourDialog.CONFIG_APP_NAME_TOUR)
-        never_show = settings.value(TourDialog.TOUR_SHOWN_KEY, False, type=bool)
-        return not never_show
+        return not TourDialog._get_never_show_flag()
+
+    @staticmethod
+    def run_tour_if_needed(parent_app):
+        """
+        Shows the tour modally unless the user opted out. The dialog is not
+        constructed at all when the tour is disabled.
+
+        Returns:
+            int or None: The dialog result, or None if the tour was not shown.
+        """
+        if not TourDialog.should_show_tour():
+            return None
+        return TourDialog(parent_app=parent_app).exec_()
 
     CONFIG_ORGANIZATION_NAME = CONFIG_ORGANIZATION_NAME
 
@@ -10,35 +10,43 @@ import json
 import re
 import subprocess
 import datetime
+import bisect
 import requests
 import unicodedata
 from collections import deque
+from types import MappingProxyType
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor ,CancelledError
+from concurrent.futures import Future, ThreadPoolExecutor ,CancelledError, wait as wait_futures
 from urllib .parse import urlparse 
 
 # --- PyQt5 Imports ---
-from PyQt5.QtGui import QIcon, QIntValidator, QDesktopServices
+from PyQt5.QtGui import QIcon, QIntValidator, QDesktopServices, QTextCursor, QTextCharFormat
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QLabel, QLineEdit, QTextEdit, QPushButton,
+    QApplication, QWidget, QLabel, QLineEdit, QTextEdit, QPlainTextEdit, QPushButton,
     QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QListWidget, QRadioButton,
     QButtonGroup, QCheckBox, QSplitter, QGroupBox, QDialog, QStackedWidget,
     QScrollArea, QListWidgetItem, QSizePolicy, QProgressBar, QAbstractItemView, QFrame,
     QMainWindow, QAction
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer, QSettings, QStandardPaths, QUrl, QSize, QProcess, QMutex, QMutexLocker
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer, QSettings, QStandardPaths, QUrl, QSize, QProcess, QMutex, QMutexLocker, QEventLoop
 
 # --- Local Application Imports ---
 from ..services.drive_downloader import download_mega_file as drive_download_mega_file ,download_gdrive_file ,download_dropbox_file 
+from ..services.image_compressor import shutdown_compression_pool 
 from ..core.workers import DownloadThread as BackendDownloadThread
 from ..core.workers import PostProcessorWorker  
 from ..core.workers import PostProcessorSignals
 from ..core.api_client import download_from_api
 from ..core.manager import DownloadManager
+from ..core.thread_pool import create_post_worker_pool
+from ..core.download_controller import create_download_controller
 from .assets import get_app_icon_object
 from ..config.constants import *
-from ..utils.file_utils import KNOWN_NAMES, clean_folder_name
+from ..utils.file_utils import KNOWN_NAMES, clean_folder_name, iter_text_file_lines
 from ..utils.network_utils import extract_post_info, prepare_cookies_for_request
+from ..utils.text_utils import compile_skip_words_pattern
+from ..utils.fast_queue import FastQueue
+from ..utils.settings_cache import SettingsCache
 from ..i18n.translator import get_translation
 from .dialogs.EmptyPopupDialog import EmptyPopupDialog
 from .dialogs.CookieHelpDialog import CookieHelpDialog
@@ -53,19 +61,121 @@ from .dialogs.FavoritePostsDialog import FavoritePostsDialog
 from .dialogs.FavoriteArtistsDialog import FavoriteArtistsDialog
 from .dialogs.ConfirmAddAllDialog import ConfirmAddAllDialog
 
+# --- CORRECT PATH DEFINITION ---
+# The application's base directory, whether running from source or as a frozen
+# executable. It cannot change while the process runs, so it is resolved once.
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    # Path for PyInstaller one-file bundle
+    APP_BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # Path for running from source code
+    APP_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+KNOWN_NAMES_FILE_PATH = os.path.join(APP_BASE_DIR, "appdata", "Known.txt")
+SESSION_FILE_PATH = os.path.join(APP_BASE_DIR, "appdata", "session.json")
+PERSISTENT_HISTORY_FILE_PATH = os.path.join(APP_BASE_DIR, "appdata", "download_history.json")
+
+# A top-level comma-separated part of the character filter input; commas inside (...) do not split.
+_CHARACTER_FILTER_PART_RE = re.compile(r'(?:\([^)]*\)?|[^,(])+')
+# A part that is entirely a group: "(a, b)" or the "(a, b)~" variant. Also used for the
+# Known Names input box, which accepts the same two forms.
+_CHARACTER_FILTER_GROUP_RE = re.compile(r'\((.*)\)(~?)$', re.DOTALL)
+# Used by _extract_key_term_from_title to drop [tags] and (notes) and find candidate words.
+_TITLE_BRACKETS_RE = re.compile(r'\[.*?\]')
+_TITLE_PARENS_RE = re.compile(r'\(.*?\)')
+_TITLE_WORD_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9_-]*\b')
+
+# Fixed pieces of the link and missed character log output.
+_LINK_TITLE_HTML = '<b style="color: #87CEEB;">{}</b><br>'
+_LINK_GROUP_SEPARATOR_HTML = "<br>" + "-" * 45 + "<br>"
+_LINK_EXPORT_SEPARATOR = "-" * 60 + "\n"
+_MISSED_TERM_SEPARATOR = "-" * 40
+_MISSED_TERM_HTML = '<p align="center"><b><font style="font-size: 12.4pt; color: #87CEEB;">{}</font></b></p>'
+
+# Translation keys and default texts for the scope and style toggle buttons:
+# value -> (text key, default text, tooltip key, default tooltip).
+_SKIP_SCOPE_BUTTON_TEXTS = {
+    SKIP_SCOPE_FILES: ("skip_scope_files_text", "Scope: Files", "skip_scope_files_tooltip", "Tooltip for skip scope files"),
+    SKIP_SCOPE_POSTS: ("skip_scope_posts_text", "Scope: Posts", "skip_scope_posts_tooltip", "Tooltip for skip scope posts"),
+    SKIP_SCOPE_BOTH: ("skip_scope_both_text", "Scope: Both", "skip_scope_both_tooltip", "Tooltip for skip scope both"),
+}
+_SKIP_SCOPE_UNKNOWN_TEXTS = ("skip_scope_unknown_text", "Scope: Unknown", "skip_scope_unknown_tooltip", "Tooltip for skip scope unknown")
+_CHAR_SCOPE_BUTTON_TEXTS = {
+    CHAR_SCOPE_FILES: ("char_filter_scope_files_text", "Filter: Files", "char_filter_scope_files_tooltip", "Tooltip for char filter files"),
+    CHAR_SCOPE_TITLE: ("char_filter_scope_title_text", "Filter: Title", "char_filter_scope_title_tooltip", "Tooltip for char filter title"),
+    CHAR_SCOPE_BOTH: ("char_filter_scope_both_text", "Filter: Both", "char_filter_scope_both_tooltip", "Tooltip for char filter both"),
+    CHAR_SCOPE_COMMENTS: ("char_filter_scope_comments_text", "Filter: Comments (Beta)", "char_filter_scope_comments_tooltip", "Tooltip for char filter comments"),
+}
+_CHAR_SCOPE_UNKNOWN_TEXTS = ("char_filter_scope_unknown_text", "Filter: Unknown", "char_filter_scope_unknown_tooltip", "Tooltip for char filter unknown")
+# The manga style button has one fixed tooltip, so only the text is looked up.
+_MANGA_STYLE_BUTTON_TEXTS = {
+    STYLE_POST_TITLE: ("manga_style_post_title_text", "Name: Post Title"),
+    STYLE_ORIGINAL_NAME: ("manga_style_original_file_text", "Name: Original File"),
+    STYLE_POST_TITLE_GLOBAL_NUMBERING: ("manga_style_title_global_num_text", "Name: Title+G.Num"),
+    STYLE_DATE_BASED: ("manga_style_date_based_text", "Name: Date Based"),
+    STYLE_POST_ID: ("manga_style_post_id_text", "Name: Post ID"),
+    STYLE_DATE_POST_TITLE: ("manga_style_date_post_title_text", "Name: Date + Title"),
+}
+_MANGA_STYLE_UNKNOWN_TEXT = ("manga_style_unknown_text", "Name: Unknown Style")
+_MANGA_STYLE_BUTTON_TOOLTIP = "Click to cycle Manga Filename Style (when Manga Mode is active for a creator feed)."
+
+# Manga filename styles that take the optional filename prefix input.
+_MANGA_DATE_PREFIX_STYLES = frozenset((STYLE_DATE_BASED, STYLE_ORIGINAL_NAME))
+
+# Next value for each click of the scope and style toggle buttons.
+_SKIP_SCOPE_NEXT = {
+    SKIP_SCOPE_POSTS: SKIP_SCOPE_FILES,
+    SKIP_SCOPE_FILES: SKIP_SCOPE_BOTH,
+    SKIP_SCOPE_BOTH: SKIP_SCOPE_POSTS,
+}
+_CHAR_SCOPE_NEXT = {
+    CHAR_SCOPE_TITLE: CHAR_SCOPE_FILES,
+    CHAR_SCOPE_FILES: CHAR_SCOPE_BOTH,
+    CHAR_SCOPE_BOTH: CHAR_SCOPE_COMMENTS,
+    CHAR_SCOPE_COMMENTS: CHAR_SCOPE_TITLE,
+}
+_MANGA_STYLE_NEXT = {
+    STYLE_POST_TITLE: STYLE_ORIGINAL_NAME,
+    STYLE_ORIGINAL_NAME: STYLE_DATE_POST_TITLE,
+    STYLE_DATE_POST_TITLE: STYLE_POST_TITLE_GLOBAL_NUMBERING,
+    STYLE_POST_TITLE_GLOBAL_NUMBERING: STYLE_DATE_BASED,
+    STYLE_DATE_BASED: STYLE_POST_ID,
+    STYLE_POST_ID: STYLE_POST_TITLE,
+}
+
+# Byte counts in file progress updates are scaled to MB by multiplying with this.
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+
+def _known_name_sort_key(entry):
+    """Sort key for Known.txt entries: case-insensitive by name."""
+    return entry["name"].lower()
+
+
 class DynamicFilterHolder:
-    """A thread-safe class to hold and update character filters during a download."""
+    """
+    A thread-safe class to hold and update character filters during a download.
+
+    Readers share one immutable snapshot (a tuple of read-only mappings) that
+    is rebuilt only when the filters change, so get_filters() copies nothing.
+    Callers that need to modify a filter must copy it first.
+    """
+    __slots__ = ('lock', '_filters')
+
     def __init__(self, initial_filters=None):
         self.lock = threading.Lock()
-        self._filters = initial_filters if initial_filters is not None else []
+        self._filters = self._make_snapshot(initial_filters)
+
+    @staticmethod
+    def _make_snapshot(filters):
+        return tuple(MappingProxyType(dict(f)) for f in (filters or []))
 
     def get_filters(self):
-        with self.lock:
-            return [dict(f) for f in self._filters]
+        return self._filters
 
     def set_filters(self, new_filters):
+        snapshot = self._make_snapshot(new_filters)
         with self.lock:
-            self._filters = [dict(f) for f in (new_filters if new_filters else [])]
+            self._filters = snapshot
 
 
 class PostProcessorSignals(QObject):
@@ -83,6 +193,7 @@ class PostProcessorSignals(QObject):
 class DownloaderApp (QWidget ):
     character_prompt_response_signal =pyqtSignal (bool )
     log_signal =pyqtSignal (str )
+    log_html_signal =pyqtSignal (str )
     add_character_prompt_signal =pyqtSignal (str )
     overall_progress_signal =pyqtSignal (int ,int )
     file_successfully_downloaded_signal =pyqtSignal (dict )
@@ -90,26 +201,18 @@ class DownloaderApp (QWidget ):
     finished_signal =pyqtSignal (int ,int ,bool ,list )
     external_link_signal =pyqtSignal (str ,str ,str ,str ,str )
     file_progress_signal =pyqtSignal (str ,object )
+    worker_queue_ready_signal =pyqtSignal ()
 
 
     def __init__(self):
         super().__init__()
-        self.settings = QSettings(CONFIG_ORGANIZATION_NAME, CONFIG_APP_NAME_MAIN)
+        self.settings = SettingsCache(QSettings(CONFIG_ORGANIZATION_NAME, CONFIG_APP_NAME_MAIN))
         
-        # --- CORRECT PATH DEFINITION ---
-        # This block correctly determines the application's base directory whether
-        # it's running from source or as a frozen executable.
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-             # Path for PyInstaller one-file bundle
-            self.app_base_dir = os.path.dirname(sys.executable)
-        else:
-            # Path for running from source code
-            self.app_base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-
-        # All file paths will now correctly use the single, correct app_base_dir
-        self.config_file = os.path.join(self.app_base_dir, "appdata", "Known.txt")
-        self.session_file_path = os.path.join(self.app_base_dir, "appdata", "session.json")
-        self.persistent_history_file = os.path.join(self.app_base_dir, "appdata", "download_history.json")
+        # All file paths use the single app base directory resolved at import time
+        self.app_base_dir = APP_BASE_DIR
+        self.config_file = KNOWN_NAMES_FILE_PATH
+        self.session_file_path = SESSION_FILE_PATH
+        self.persistent_history_file = PERSISTENT_HISTORY_FILE_PATH
 
         self.download_thread = None
         self.thread_pool = None
@@ -120,6 +223,9 @@ class DownloaderApp (QWidget ):
         self.external_link_download_thread = None
         self.pause_event = threading.Event()
         self.active_futures = []
+        # Post futures submitted and not yet finished; decremented by _handle_future_result.
+        self._active_future_count = 0
+        self._active_future_count_lock = threading.Lock()
         self.total_posts_to_process = 0
         self.dynamic_character_filter_holder = DynamicFilterHolder()
         self.processed_posts_count = 0
@@ -148,8 +254,36 @@ class DownloaderApp (QWidget ):
         self.selected_cookie_filepath = None
         self.retryable_failed_files_info = []
         self.is_paused = False
-        self.worker_to_gui_queue = queue.Queue()
-        self.gui_update_timer = QTimer(self)
+        self.worker_to_gui_queue = FastQueue(notify=self.worker_queue_ready_signal.emit)
+        self._last_file_progress_update = 0.0
+        self._pending_file_progress = None
+        self.file_progress_flush_timer = QTimer(self)
+        self.file_progress_flush_timer.setSingleShot(True)
+        self.main_log_buffer = deque(maxlen=MAIN_LOG_BUFFER_MAX_LINES)
+        self.main_log_buffer_mutex = QMutex()
+        self.main_log_flush_timer = QTimer(self)
+        self.main_log_flush_timer.setSingleShot(True)
+        self.main_log_flush_timer.setInterval(MAIN_LOG_FLUSH_INTERVAL_MS)
+        self.character_filter_debounce_timer = QTimer(self)
+        self.character_filter_debounce_timer.setSingleShot(True)
+        self.character_filter_debounce_timer.setInterval(CHARACTER_FILTER_DEBOUNCE_MS)
+        self.external_log_pending_lines = []
+        self.external_log_flush_timer = QTimer(self)
+        self.external_log_flush_timer.setSingleShot(True)
+        self.external_log_flush_timer.setInterval(EXTERNAL_LOG_FLUSH_INTERVAL_MS)
+        self.missed_character_log_refresh_timer = QTimer(self)
+        self.missed_character_log_refresh_timer.setSingleShot(True)
+        self.missed_character_log_refresh_timer.setInterval(MISSED_CHARACTER_LOG_REFRESH_MS)
+        self.link_input_debounce_timer = QTimer(self)
+        self.link_input_debounce_timer.setSingleShot(True)
+        self.link_input_debounce_timer.setInterval(TEXT_INPUT_DEBOUNCE_MS)
+        self.character_search_debounce_timer = QTimer(self)
+        self.character_search_debounce_timer.setSingleShot(True)
+        self.character_search_debounce_timer.setInterval(TEXT_INPUT_DEBOUNCE_MS)
+        self.link_search_debounce_timer = QTimer(self)
+        self.link_search_debounce_timer.setSingleShot(True)
+        self.link_search_debounce_timer.setInterval(TEXT_INPUT_DEBOUNCE_MS)
+        self.download_controller, self.download_controller_thread = create_download_controller()
         self.actual_gui_signals = PostProcessorSignals()
         self.worker_signals = PostProcessorSignals()
         self.prompt_mutex = QMutex()
@@ -164,7 +298,8 @@ class DownloaderApp (QWidget ):
         self.downloaded_file_hashes_lock = threading.Lock()
         self.show_external_links = False
         self.external_link_queue = deque()
-        self._is_processing_external_link_queue = False
+        self.external_link_drain_timer = QTimer(self)
+        self.external_link_drain_timer.setInterval(EXTERNAL_LINK_DRAIN_INTERVAL_MS)
         self._current_link_post_title = None
         self.extracted_links_cache = []
         self.manga_rename_toggle_button = None
@@ -190,24 +325,55 @@ class DownloaderApp (QWidget ):
         self.link_search_input = None
         self.link_search_button = None
         self.export_links_button = None
+        self.log_title_layout = None
+        self.export_button_layout = None
         self.radio_only_links = None
         self.radio_only_archives = None
+        self.radio_only_audio = None
+        self.multipart_toggle_button = None
+        self.download_extracted_links_button = None
+        self.remove_from_filename_input = None
+        self.use_cookie_checkbox = None
+        self.cookie_text_input = None
+        # Mirrors of the two radio states, read on every external link and log update.
+        self._mode_only_links = False
+        self._mode_only_archives = False
+        self._last_subfolder_ui_state = None
+        # (URL text, extract_post_info result) of the last parse done by _parse_link_url.
+        self._link_url_parse_cache = ("", (None, None, None))
         self.missed_title_key_terms_count = {}
         self.missed_title_key_terms_examples = {}
         self.logged_summary_for_key_term = set()
-        self.STOP_WORDS = set(["a", "an", "the", "is", "was", "were", "of", "for", "with", "in", "on", "at", "by", "to", "and", "or", "but", "i", "you", "he", "she", "it", "we", "they", "my", "your", "his", "her", "its", "our", "their", "com", "net", "org", "www"])
         self.already_logged_bold_key_terms = set()
         self.missed_key_terms_buffer = []
+        self.missed_key_terms_sort_keys = []
+        # (primary name, lowercased aliases) for each KNOWN_NAMES entry; see _rebuild_known_name_index.
+        self._known_alias_index = []
+        # Lowercased text of each character_list row, so filtering does not re-lowercase them.
+        self._character_list_lower = []
+        self._name_input_warning_box = None
+        # Built on demand by _get_character_char_index; reset whenever rows move.
+        self._character_char_index = None
+        # Rows left visible by the last filter_character_list call, or None if unknown.
+        self._character_rows_shown = None
+        # _known_name_sort_key of each KNOWN_NAMES entry, in list order, for bisect.
+        self._known_sorted_keys = []
+        self._known_primary_lower = set()
+        # Lowercased alias -> primary name of the first entry that has it.
+        self._known_alias_to_primary = {}
         self.char_filter_scope_toggle_button = None
         self.skip_words_scope = SKIP_SCOPE_POSTS
         self.char_filter_scope = CHAR_SCOPE_TITLE
-        self.manga_filename_style = self.settings.value(MANGA_FILENAME_STYLE_KEY, STYLE_POST_TITLE, type=str)
+        # Interned so later comparisons and table lookups against the STYLE_*/SCOPE_* constants
+        # (already interned as identifier-like literals) match on identity.
+        self.manga_filename_style = sys.intern(self.settings.value(MANGA_FILENAME_STYLE_KEY, STYLE_POST_TITLE, type=str))
         self.current_theme = self.settings.value(THEME_KEY, "dark", type=str)
         self.only_links_log_display_mode = LOG_DISPLAY_LINKS
         self.mega_download_log_preserved_once = False
         self.allow_multipart_download_setting = False
         self.use_cookie_setting = False
         self.scan_content_images_setting = self.settings.value(SCAN_CONTENT_IMAGES_KEY, False, type=bool)
+        self.use_async_http_setting = self.settings.value(USE_ASYNC_HTTP_KEY, False, type=bool)
         self.cookie_text_setting = ""
         self.current_selected_language = self.settings.value(LANGUAGE_KEY, "en", type=str)
 
@@ -244,18 +410,19 @@ class DownloaderApp (QWidget ):
         self.setWindowTitle("Kemono Downloader v5.5.0")
         self.init_ui()
         self._connect_signals()
-        self.log_signal.emit("ℹ️ Local API server functionality has been removed.")
-        self.log_signal.emit("ℹ️ 'Skip Current File' button has been removed.")
-        if hasattr(self, 'character_input'):
-            self.character_input.setToolTip(self._tr("character_input_tooltip", "Enter character names (comma-separated)..."))
-        self.log_signal.emit(f"ℹ️ Manga filename style loaded: '{self.manga_filename_style}'")
-        self.log_signal.emit(f"ℹ️ Skip words scope loaded: '{self.skip_words_scope}'")
-        self.log_signal.emit(f"ℹ️ Character filter scope set to default: '{self.char_filter_scope}'")
-        self.log_signal.emit(f"ℹ️ Multi-part download defaults to: {'Enabled' if self.allow_multipart_download_setting else 'Disabled'}")
-        self.log_signal.emit(f"ℹ️ Cookie text defaults to: Empty on launch")
-        self.log_signal.emit(f"ℹ️ 'Use Cookie' setting defaults to: Disabled on launch")
-        self.log_signal.emit(f"ℹ️ Scan post content for images defaults to: {'Enabled' if self.scan_content_images_setting else 'Disabled'}")
-        self.log_signal.emit(f"ℹ️ Application language loaded: '{self.current_selected_language.upper()}' (UI may not reflect this yet).")
+        # One emit for the whole startup banner rather than one per line.
+        self.log_signal.emit("\n".join([
+            "ℹ️ Local API server functionality has been removed.",
+            "ℹ️ 'Skip Current File' button has been removed.",
+            f"ℹ️ Manga filename style loaded: '{self.manga_filename_style}'",
+            f"ℹ️ Skip words scope loaded: '{self.skip_words_scope}'",
+            f"ℹ️ Character filter scope set to default: '{self.char_filter_scope}'",
+            f"ℹ️ Multi-part download defaults to: {'Enabled' if self.allow_multipart_download_setting else 'Disabled'}",
+            "ℹ️ Cookie text defaults to: Empty on launch",
+            "ℹ️ 'Use Cookie' setting defaults to: Disabled on launch",
+            f"ℹ️ Scan post content for images defaults to: {'Enabled' if self.scan_content_images_setting else 'Disabled'}",
+            f"ℹ️ Application language loaded: '{self.current_selected_language.upper()}' (UI may not reflect this yet).",
+        ]))
         self._retranslate_main_ui()
         self._load_persistent_history()
         self._load_saved_download_location()
@@ -471,9 +638,9 @@ class DownloaderApp (QWidget ):
         if hasattr (self ,'radio_all'):self .radio_all .setText (self ._tr ("filter_all_radio","All"))
         if hasattr (self ,'radio_images'):self .radio_images .setText (self ._tr ("filter_images_radio","Images/GIFs"))
         if hasattr (self ,'radio_videos'):self .radio_videos .setText (self ._tr ("filter_videos_radio","Videos"))
-        if hasattr (self ,'radio_only_archives'):self .radio_only_archives .setText (self ._tr ("filter_archives_radio","📦 Only Archives"))
+        if self .radio_only_archives is not None :self .radio_only_archives .setText (self ._tr ("filter_archives_radio","📦 Only Archives"))
         if hasattr (self ,'radio_only_links'):self .radio_only_links .setText (self ._tr ("filter_links_radio","🔗 Only Links"))
-        if hasattr (self ,'radio_only_audio'):self .radio_only_audio .setText (self ._tr ("filter_audio_radio","🎧 Only Audio"))
+        if self .radio_only_audio is not None :self .radio_only_audio .setText (self ._tr ("filter_audio_radio","🎧 Only Audio"))
         if hasattr (self ,'favorite_mode_checkbox'):self .favorite_mode_checkbox .setText (self ._tr ("favorite_mode_checkbox_label","⭐ Favorite Mode"))
         if hasattr (self ,'dir_button'):self .dir_button .setText (self ._tr ("browse_button_text","Browse..."))
         self ._update_char_filter_scope_button_text ()
@@ -486,7 +653,7 @@ class DownloaderApp (QWidget ):
         if hasattr (self ,'compress_images_checkbox'):self .compress_images_checkbox .setText (self ._tr ("compress_images_checkbox_label","Compress to WebP"))
         if hasattr (self ,'use_subfolders_checkbox'):self .use_subfolders_checkbox .setText (self ._tr ("separate_folders_checkbox_label","Separate Folders by Name/Title"))
         if hasattr (self ,'use_subfolder_per_post_checkbox'):self .use_subfolder_per_post_checkbox .setText (self ._tr ("subfolder_per_post_checkbox_label","Subfolder per Post"))
-        if hasattr (self ,'use_cookie_checkbox'):self .use_cookie_checkbox .setText (self ._tr ("use_cookie_checkbox_label","Use Cookie"))
+        if self .use_cookie_checkbox is not None :self .use_cookie_checkbox .setText (self ._tr ("use_cookie_checkbox_label","Use Cookie"))
         if hasattr (self ,'use_multithreading_checkbox'):self .update_multithreading_label (self .thread_count_input .text ()if hasattr (self ,'thread_count_input')else "1")
         if hasattr (self ,'external_links_checkbox'):self .external_links_checkbox .setText (self ._tr ("show_external_links_checkbox_label","Show External Links in Log"))
         if hasattr (self ,'manga_mode_checkbox'):self .manga_mode_checkbox .setText (self ._tr ("manga_comic_mode_checkbox_label","Manga/Comic Mode"))
@@ -533,22 +700,22 @@ class DownloaderApp (QWidget ):
         if hasattr (self ,'cookie_browse_button'):
             self .cookie_browse_button .setToolTip (self ._tr ("cookie_browse_button_tooltip","Browse for a cookie file..."))
         self ._update_manga_filename_style_button_text ()
-        if hasattr (self ,'export_links_button'):self .export_links_button .setText (self ._tr ("export_links_button_text","Export Links"))
-        if hasattr (self ,'download_extracted_links_button'):self .download_extracted_links_button .setText (self ._tr ("download_extracted_links_button_text","Download"))
+        if self .export_links_button is not None :self .export_links_button .setText (self ._tr ("export_links_button_text","Export Links"))
+        if self .download_extracted_links_button is not None :self .download_extracted_links_button .setText (self ._tr ("download_extracted_links_button_text","Download"))
         self ._update_log_display_mode_button_text ()
 
 
         if hasattr (self ,'radio_all'):self .radio_all .setToolTip (self ._tr ("radio_all_tooltip","Download all file types found in posts."))
         if hasattr (self ,'radio_images'):self .radio_images .setToolTip (self ._tr ("radio_images_tooltip","Download only common image formats (JPG, PNG, GIF, WEBP, etc.)."))
         if hasattr (self ,'radio_videos'):self .radio_videos .setToolTip (self ._tr ("radio_videos_tooltip","Download only common video formats (MP4, MKV, WEBM, MOV, etc.)."))
-        if hasattr (self ,'radio_only_archives'):self .radio_only_archives .setToolTip (self ._tr ("radio_only_archives_tooltip","Exclusively download .zip and .rar files. Other file-specific options are disabled."))
-        if hasattr (self ,'radio_only_audio'):self .radio_only_audio .setToolTip (self ._tr ("radio_only_audio_tooltip","Download only common audio formats (MP3, WAV, FLAC, etc.)."))
+        if self .radio_only_archives is not None :self .radio_only_archives .setToolTip (self ._tr ("radio_only_archives_tooltip","Exclusively download .zip and .rar files. Other file-specific options are disabled."))
+        if self .radio_only_audio is not None :self .radio_only_audio .setToolTip (self ._tr ("radio_only_audio_tooltip","Download only common audio formats (MP3, WAV, FLAC, etc.)."))
         if hasattr (self ,'radio_only_links'):self .radio_only_links .setToolTip (self ._tr ("radio_only_links_tooltip","Extract and display external links from post descriptions instead of downloading files.\nDownload-related options will be disabled."))
 
 
         if hasattr (self ,'use_subfolders_checkbox'):self .use_subfolders_checkbox .setToolTip (self ._tr ("use_subfolders_checkbox_tooltip","Create subfolders based on 'Filter by Character(s)' input..."))
         if hasattr (self ,'use_subfolder_per_post_checkbox'):self .use_subfolder_per_post_checkbox .setToolTip (self ._tr ("use_subfolder_per_post_checkbox_tooltip","Creates a subfolder for each post..."))
-        if hasattr (self ,'use_cookie_checkbox'):self .use_cookie_checkbox .setToolTip (self ._tr ("use_cookie_checkbox_tooltip","If checked, will attempt to use cookies..."))
+        if self .use_cookie_checkbox is not None :self .use_cookie_checkbox .setToolTip (self ._tr ("use_cookie_checkbox_tooltip","If checked, will attempt to use cookies..."))
         if hasattr (self ,'use_multithreading_checkbox'):self .use_multithreading_checkbox .setToolTip (self ._tr ("use_multithreading_checkbox_tooltip","Enables concurrent operations..."))
         if hasattr (self ,'thread_count_input'):self .thread_count_input .setToolTip (self ._tr ("thread_count_input_tooltip","Number of concurrent operations..."))
         if hasattr (self ,'external_links_checkbox'):self .external_links_checkbox .setToolTip (self ._tr ("external_links_checkbox_tooltip","If checked, a secondary log panel appears..."))
@@ -563,7 +730,7 @@ class DownloaderApp (QWidget ):
             "- Scope: Files: Skips individual files if their names contain any of these words.\n"
             "- Scope: Posts: Skips entire posts if their titles contain any of these words.\n"
             "- Scope: Both: Applies both (post title first, then individual files if post title is okay).")))
-        if hasattr (self ,'remove_from_filename_input'):
+        if self .remove_from_filename_input is not None :
             self .remove_from_filename_input .setToolTip (self ._tr ("remove_words_input_tooltip",
             ("Enter words, comma-separated, to remove from downloaded filenames (case-insensitive).\n"
             "Useful for cleaning up common prefixes/suffixes.\nExample: patreon, kemono, [HD], _final")))
@@ -581,7 +748,7 @@ class DownloaderApp (QWidget ):
             self .custom_folder_input .setToolTip (self ._tr ("custom_folder_input_tooltip_text","If downloading a single post URL..."))
         if hasattr (self ,'skip_words_input'):
             self .skip_words_input .setPlaceholderText (self ._tr ("skip_words_input_placeholder_text","e.g., WM, WIP, sketch, preview"))
-        if hasattr (self ,'remove_from_filename_input'):
+        if self .remove_from_filename_input is not None :
             self .remove_from_filename_input .setPlaceholderText (self ._tr ("remove_from_filename_input_placeholder_text","e.g., patreon, HD"))
         self ._update_cookie_input_placeholders_and_tooltips ()
         if hasattr (self ,'character_search_input'):
@@ -590,7 +757,7 @@ class DownloaderApp (QWidget ):
         if hasattr (self ,'new_char_input'):
             self .new_char_input .setPlaceholderText (self ._tr ("new_char_input_placeholder_text","Add new show/character name"))
             self .new_char_input .setToolTip (self ._tr ("new_char_input_tooltip_text","Enter a new show, game, or character name..."))
-        if hasattr (self ,'link_search_input'):
+        if self .link_search_input is not None :
             self .link_search_input .setPlaceholderText (self ._tr ("link_search_input_placeholder_text","Search Links..."))
             self .link_search_input .setToolTip (self ._tr ("link_search_input_tooltip_text","When in 'Only Links' mode..."))
         if hasattr (self ,'manga_date_prefix_input'):
@@ -599,56 +766,63 @@ class DownloaderApp (QWidget ):
         if hasattr (self ,'empty_popup_button'):self .empty_popup_button .setToolTip (self ._tr ("empty_popup_button_tooltip_text","Open Creator Selection..."))
         if hasattr (self ,'known_names_help_button'):self .known_names_help_button .setToolTip (self ._tr ("known_names_help_button_tooltip_text","Open the application feature guide."))
         if hasattr (self ,'future_settings_button'):self .future_settings_button .setToolTip (self ._tr ("future_settings_button_tooltip_text","Open application settings..."))
-        if hasattr (self ,'link_search_button'):self .link_search_button .setToolTip (self ._tr ("link_search_button_tooltip_text","Filter displayed links"))
+        if self .link_search_button is not None :self .link_search_button .setToolTip (self ._tr ("link_search_button_tooltip_text","Filter displayed links"))
     def apply_theme (self ,theme_name ,initial_load =False ):
         self .current_theme =theme_name 
         if not initial_load :
             self .settings .setValue (THEME_KEY ,theme_name )
             self .settings .sync ()
 
+        # The theme is set once on the application rather than on this window, so
+        # top-level windows without their own theme call are styled from the same sheet.
         if theme_name =="dark":
-            self .setStyleSheet (self .get_dark_theme ())
+            QApplication .instance ().setStyleSheet (self .get_dark_theme ())
             if not initial_load :
                 self .log_signal .emit ("🎨 Switched to Dark Mode.")
         else :
-            self .setStyleSheet ("")
+            QApplication .instance ().setStyleSheet ("")
             if not initial_load :
                 self .log_signal .emit ("🎨 Switched to Light Mode.")
         self .update ()
 
-    def _get_tooltip_for_character_input (self ):
-        return (
-        self ._tr ("character_input_tooltip","Default tooltip if translation fails.")
-        )
     def _connect_signals (self ):
         self .actual_gui_signals .progress_signal .connect (self .handle_main_log )
         self .actual_gui_signals .file_progress_signal .connect (self .update_file_progress_display )
         self .actual_gui_signals .missed_character_post_signal .connect (self .handle_missed_character_post )
         self .actual_gui_signals .external_link_signal .connect (self .handle_external_link_signal )
         self .actual_gui_signals .file_successfully_downloaded_signal .connect (self ._handle_actual_file_downloaded )
-        self .actual_gui_signals .file_download_status_signal .connect (lambda status :None )
 
         if hasattr (self ,'character_input'):
             self .character_input .textChanged .connect (self ._on_character_input_changed_live )
-        if hasattr (self ,'use_cookie_checkbox'):
+        if self .use_cookie_checkbox is not None :
             self .use_cookie_checkbox .toggled .connect (self ._update_cookie_input_visibility )
         if hasattr (self ,'link_input'):
             self .link_input .textChanged .connect (self ._sync_queue_with_link_input )
         if hasattr (self ,'cookie_browse_button'):
             self .cookie_browse_button .clicked .connect (self ._browse_cookie_file )
-        if hasattr (self ,'cookie_text_input'):
+        if self .cookie_text_input is not None :
             self .cookie_text_input .textChanged .connect (self ._handle_cookie_text_manual_change )
         if hasattr (self ,'download_thumbnails_checkbox'):
             self .download_thumbnails_checkbox .toggled .connect (self ._handle_thumbnail_mode_change )
-        self .gui_update_timer .timeout .connect (self ._process_worker_queue )
-        self .gui_update_timer .start (100 )
+        self .worker_queue_ready_signal .connect (self ._process_worker_queue )
+        self .main_log_flush_timer .timeout .connect (self ._flush_main_log_buffer )
+        self .character_filter_debounce_timer .timeout .connect (self ._apply_dynamic_character_filter )
+        self .link_input_debounce_timer .timeout .connect (self ._on_link_input_settled )
+        self .external_log_flush_timer .timeout .connect (self ._flush_external_log_buffer )
+        self .missed_character_log_refresh_timer .timeout .connect (self ._refresh_missed_character_log )
+        self .external_link_drain_timer .timeout .connect (self ._drain_external_link_queue )
+        self .character_search_debounce_timer .timeout .connect (self ._on_character_search_settled )
+        self .link_search_debounce_timer .timeout .connect (self ._filter_links_log )
+        self .file_progress_flush_timer .timeout .connect (self ._flush_pending_file_progress )
         self .log_signal .connect (self .handle_main_log )
+        self .log_html_signal .connect (self .handle_main_log_html )
+        self .download_controller .log_signal .connect (self .handle_main_log )
         self .add_character_prompt_signal .connect (self .prompt_add_character )
         self .character_prompt_response_signal .connect (self .receive_add_character_result )
         self .overall_progress_signal .connect (self .update_progress_display )
         self .post_processed_for_history_signal .connect (self ._add_to_history_candidates )
         self .finished_signal .connect (self .download_finished )
-        if hasattr (self ,'character_search_input'):self .character_search_input .textChanged .connect (self .filter_character_list )
+        if hasattr (self ,'character_search_input'):self .character_search_input .textChanged .connect (self .character_search_debounce_timer .start )
         if hasattr (self ,'external_links_checkbox'):self .external_links_checkbox .toggled .connect (self .update_external_links_setting )
         if hasattr (self ,'thread_count_input'):self .thread_count_input .textChanged .connect (self .update_multithreading_label )
         if hasattr (self ,'use_subfolder_per_post_checkbox'):self .use_subfolder_per_post_checkbox .toggled .connect (self .update_ui_for_subfolders )
@@ -656,20 +830,15 @@ class DownloaderApp (QWidget ):
 
         if hasattr (self ,'radio_group')and self .radio_group :
             self .radio_group .buttonToggled .connect (self ._handle_filter_mode_change )
+            self ._update_filter_mode_flags ()
 
         if self .reset_button :self .reset_button .clicked .connect (self .reset_application_state )
         if self .log_verbosity_toggle_button :self .log_verbosity_toggle_button .clicked .connect (self .toggle_active_log_view )
 
-        if self .link_search_button :self .link_search_button .clicked .connect (self ._filter_links_log )
-        if self .link_search_input :
-            self .link_search_input .returnPressed .connect (self ._filter_links_log )
-            self .link_search_input .textChanged .connect (self ._filter_links_log )
-        if self .export_links_button :self .export_links_button .clicked .connect (self ._export_links_to_file )
-
         if self .manga_mode_checkbox :self .manga_mode_checkbox .toggled .connect (self .update_ui_for_manga_mode )
 
 
-        if hasattr (self ,'download_extracted_links_button'):
+        if self .download_extracted_links_button is not None :
             self .download_extracted_links_button .clicked .connect (self ._show_download_extracted_links_dialog )
 
         if hasattr (self ,'log_display_mode_toggle_button'):
@@ -677,16 +846,13 @@ class DownloaderApp (QWidget ):
 
         if self .manga_rename_toggle_button :self .manga_rename_toggle_button .clicked .connect (self ._toggle_manga_filename_style )
 
-        if hasattr (self ,'link_input'):
-            self .link_input .textChanged .connect (lambda :self .update_ui_for_manga_mode (self .manga_mode_checkbox .isChecked ()if self .manga_mode_checkbox else False ))
-
         if self .skip_scope_toggle_button :
             self .skip_scope_toggle_button .clicked .connect (self ._cycle_skip_scope )
 
         if self .char_filter_scope_toggle_button :
             self .char_filter_scope_toggle_button .clicked .connect (self ._cycle_char_filter_scope )
 
-        if hasattr (self ,'multipart_toggle_button'):self .multipart_toggle_button .clicked .connect (self ._toggle_multipart_mode )
+        if self .multipart_toggle_button is not None :self .multipart_toggle_button .clicked .connect (self ._toggle_multipart_mode )
 
 
         if hasattr (self ,'favorite_mode_checkbox'):
@@ -711,66 +877,46 @@ class DownloaderApp (QWidget ):
     def _on_character_input_changed_live (self ,text ):
         """
         Called when the character input field text changes.
-        If a download is active (running or paused), this updates the dynamic filter holder.
+        If a download is active (running or paused), the dynamic filter holder is
+        updated once typing pauses, rather than on every keystroke.
         """
         if self ._is_download_active ():
-            QCoreApplication .processEvents ()
-            raw_character_filters_text =self .character_input .text ().strip ()
-            parsed_filters =self ._parse_character_filters (raw_character_filters_text )
+            self .character_filter_debounce_timer .start ()
+
+    def _apply_dynamic_character_filter (self ):
+        """Parses the character input and publishes it to the running download."""
+        if not self ._is_download_active ():
+            return 
+        raw_character_filters_text =self .character_input .text ().strip ()
+        parsed_filters =self ._parse_character_filters (raw_character_filters_text )
 
-            self .dynamic_character_filter_holder .set_filters (parsed_filters )
+        self .dynamic_character_filter_holder .set_filters (parsed_filters )
 
     def _parse_character_filters (self ,raw_text ):
         """Helper to parse character filter string into list of objects."""
         parsed_character_filter_objects =[]
-        if raw_text :
-            raw_parts =[]
-            current_part_buffer =""
-            in_group_parsing =False 
-            for char_token in raw_text :
-                if char_token =='('and not in_group_parsing :
-                    in_group_parsing =True 
-                    current_part_buffer +=char_token 
-                elif char_token ==')'and in_group_parsing :
-                    in_group_parsing =False 
-                    current_part_buffer +=char_token 
-                elif char_token ==','and not in_group_parsing :
-                    if current_part_buffer .strip ():raw_parts .append (current_part_buffer .strip ())
-                    current_part_buffer =""
-                else :
-                    current_part_buffer +=char_token 
-            if current_part_buffer .strip ():raw_parts .append (current_part_buffer .strip ())
-
-            for part_str in raw_parts :
-                part_str =part_str .strip ()
-                if not part_str :continue 
-
-                is_tilde_group =part_str .startswith ("(")and part_str .endswith (")~")
-                is_standard_group_for_splitting =part_str .startswith ("(")and part_str .endswith (")")and not is_tilde_group 
-
-                if is_tilde_group :
-                    group_content_str =part_str [1 :-2 ].strip ()
-                    aliases_in_group =[alias .strip ()for alias in group_content_str .split (',')if alias .strip ()]
-                    if aliases_in_group :
-                        group_folder_name =" ".join (aliases_in_group )
-                        parsed_character_filter_objects .append ({"name":group_folder_name ,"is_group":True ,"aliases":aliases_in_group })
-                elif is_standard_group_for_splitting :
-                    group_content_str =part_str [1 :-1 ].strip ()
-                    aliases_in_group =[alias .strip ()for alias in group_content_str .split (',')if alias .strip ()]
-                    if aliases_in_group :
-                        group_folder_name =" ".join (aliases_in_group )
-                        parsed_character_filter_objects .append ({
-                        "name":group_folder_name ,
-                        "is_group":True ,
-                        "aliases":aliases_in_group ,
-                        "components_are_distinct_for_known_txt":True 
-                        })
-                else :
-                    parsed_character_filter_objects .append ({"name":part_str ,"is_group":False ,"aliases":[part_str ],"components_are_distinct_for_known_txt":False })
+        if not raw_text :
+            return parsed_character_filter_objects 
+        append_filter =parsed_character_filter_objects .append 
+        for part_str in _CHARACTER_FILTER_PART_RE .findall (raw_text ):
+            part_str =part_str .strip ()
+            if not part_str :continue 
+
+            group_match =_CHARACTER_FILTER_GROUP_RE .match (part_str )
+            if group_match :
+                group_content_str ,tilde_marker =group_match .groups ()
+                aliases =[alias .strip ()for alias in group_content_str .split (',')if alias .strip ()]
+                if not aliases :continue 
+                # "(a, b)" adds a and b to Known.txt separately; "(a, b)~" adds one group entry.
+                name ,is_group ,components_are_distinct =" ".join (aliases ),True ,not tilde_marker 
+            else :
+                name ,is_group ,components_are_distinct ,aliases =part_str ,False ,False ,[part_str ]
+            append_filter ({"name":name ,"is_group":is_group ,"aliases":aliases ,"components_are_distinct_for_known_txt":components_are_distinct })
         return parsed_character_filter_objects 
 
     def _process_worker_queue (self ):
         """Processes messages from the worker queue and emits Qt signals from the GUI thread."""
+        self .worker_to_gui_queue .begin_drain ()
         while not self .worker_to_gui_queue .empty ():
             try :
                 item =self .worker_to_gui_queue .get_nowait ()
@@ -804,39 +950,34 @@ class DownloaderApp (QWidget ):
         if os .path .exists (self .config_file ):
             parsed_known_objects =[]
             try :
-                with open (self .config_file ,'r',encoding ='utf-8')as f :
-                    for line_num ,line in enumerate (f ,1 ):
-                        line =line .strip ()
-                        if not line :continue 
-
-                        if line .startswith ("(")and line .endswith (")"):
-                            content =line [1 :-1 ].strip ()
-                            parts =[p .strip ()for p in content .split (',')if p .strip ()]
-                            if parts :
-                                folder_name_raw =content .replace (',',' ')
-                                folder_name_cleaned =clean_folder_name (folder_name_raw )
-
-                                unique_aliases_set ={p for p in parts }
-                                final_aliases_list =sorted (list (unique_aliases_set ),key =str .lower )
-
-                                if not folder_name_cleaned :
-                                    if hasattr (self ,'log_signal'):self .log_signal .emit (f"⚠️ Group resulted in empty folder name after cleaning in Known.txt on line {line_num }: '{line }'. Skipping entry.")
-                                    continue 
-
-                                parsed_known_objects .append ({
-                                "name":folder_name_cleaned ,
-                                "is_group":True ,
-                                "aliases":final_aliases_list 
-                                })
-                            else :
-                                if hasattr (self ,'log_signal'):self .log_signal .emit (f"⚠️ Empty group found in Known.txt on line {line_num }: '{line }'")
-                        else :
+                for line_num ,line in iter_text_file_lines (self .config_file ):
+                    if line [0 ]=='('and line [-1 ]==')':
+                        content =line [1 :-1 ].strip ()
+                        parts ={p for p in map (str .strip ,content .split (','))if p }
+                        if parts :
+                            folder_name_raw =content .replace (',',' ')
+                            folder_name_cleaned =clean_folder_name (folder_name_raw )
+
+                            final_aliases_list =sorted (parts ,key =str .lower )
+
+                            if not folder_name_cleaned :
+                                if hasattr (self ,'log_signal'):self .log_signal .emit (f"⚠️ Group resulted in empty folder name after cleaning in Known.txt on line {line_num }: '{line }'. Skipping entry.")
+                                continue 
+
                             parsed_known_objects .append ({
-                            "name":line ,
-                            "is_group":False ,
-                            "aliases":[line ]
+                            "name":folder_name_cleaned ,
+                            "is_group":True ,
+                            "aliases":final_aliases_list 
                             })
-                parsed_known_objects .sort (key =lambda x :x ["name"].lower ())
+                        else :
+                            if hasattr (self ,'log_signal'):self .log_signal .emit (f"⚠️ Empty group found in Known.txt on line {line_num }: '{line }'")
+                    else :
+                        parsed_known_objects .append ({
+                        "name":line ,
+                        "is_group":False ,
+                        "aliases":[line ]
+                        })
+                parsed_known_objects .sort (key =_known_name_sort_key )
                 KNOWN_NAMES [:]=parsed_known_objects 
                 log_msg =f"ℹ️ Loaded {len (KNOWN_NAMES )} known entries from {self .config_file }"
             except Exception as e :
@@ -844,18 +985,17 @@ class DownloaderApp (QWidget ):
                 QMessageBox .warning (self ,"Config Load Error",f"Could not load list from {self .config_file }:\n{e }")
                 KNOWN_NAMES [:]=[]
         else :
-            self .character_input .setToolTip ("Names, comma-separated. Group aliases: (alias1, alias2, alias3) becomes folder name 'alias1 alias2 alias3' (after cleaning).\nAll names in the group are used as aliases for matching.\nE.g., yor, (Boa, Hancock, Snake Princess)")
             log_msg =f"ℹ️ Config file '{self .config_file }' not found. It will be created on save."
             KNOWN_NAMES [:]=[]
 
         if hasattr (self ,'log_signal'):self .log_signal .emit (log_msg )
+        self ._rebuild_known_name_index ()
 
         if hasattr (self ,'character_list'):
-            self .character_list .clear ()
             if not KNOWN_NAMES :
                 self .log_signal .emit ("ℹ️ 'Known.txt' is empty or was not found. No default entries will be added.")
 
-            self .character_list .addItems ([entry ["name"]for entry in KNOWN_NAMES ])
+            self ._repopulate_character_list ()
 
     def save_known_names(self):
         """
@@ -873,14 +1013,21 @@ class DownloaderApp (QWidget ):
             os.makedirs(config_dir, exist_ok=True)
             # --- FIX ENDS HERE ---
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                for entry in KNOWN_NAMES:
-                    if entry["is_group"]:
-                        # For groups, write the aliases in a sorted, comma-separated format inside parentheses.
-                        f.write(f"({', '.join(sorted(entry['aliases'], key=str.lower))})\n")
-                    else:
-                        # For single entries, write the name on its own line.
-                        f.write(entry["name"] + '\n')
+            lines = []
+            for entry in KNOWN_NAMES:
+                if entry["is_group"]:
+                    # For groups, write the aliases in a sorted, comma-separated format inside parentheses.
+                    lines.append(f"({', '.join(sorted(entry['aliases'], key=str.lower))})\n")
+                else:
+                    # For single entries, write the name on its own line.
+                    lines.append(entry["name"] + '\n')
+
+            # Write the whole list once to a temp file, then swap it in, so an
+            # interrupted save never leaves a truncated Known.txt behind.
+            temp_config_file = self.config_file + '.tmp'
+            with open(temp_config_file, 'w', encoding='utf-8') as f:
+                f.write(''.join(lines))
+            os.replace(temp_config_file, self.config_file)
 
             if hasattr(self, 'log_signal'):
                 self.log_signal.emit(f"💾 Saved {len(KNOWN_NAMES)} known entries to {self.config_file}")
@@ -894,41 +1041,34 @@ class DownloaderApp (QWidget ):
 
     def closeEvent (self ,event ):
         self .save_known_names ()
-        self .settings .setValue (MANGA_FILENAME_STYLE_KEY ,self .manga_filename_style )
-        self .settings .setValue (ALLOW_MULTIPART_DOWNLOAD_KEY ,self .allow_multipart_download_setting )
-        self .settings .setValue (COOKIE_TEXT_KEY ,self .cookie_text_input .text ()if hasattr (self ,'cookie_text_input')else "")
-        self .settings .setValue (SCAN_CONTENT_IMAGES_KEY ,self .scan_content_images_checkbox .isChecked ()if hasattr (self ,'scan_content_images_checkbox')else False )
-        self .settings .setValue (USE_COOKIE_KEY ,self .use_cookie_checkbox .isChecked ()if hasattr (self ,'use_cookie_checkbox')else False )
-        self .settings .setValue (THEME_KEY ,self .current_theme )
-        self .settings .setValue (LANGUAGE_KEY ,self .current_selected_language )
-        self .settings .sync ()
+        pending_settings ={
+        MANGA_FILENAME_STYLE_KEY :self .manga_filename_style ,
+        ALLOW_MULTIPART_DOWNLOAD_KEY :self .allow_multipart_download_setting ,
+        COOKIE_TEXT_KEY :self .cookie_text_input .text ()if self .cookie_text_input is not None else "",
+        SCAN_CONTENT_IMAGES_KEY :self .scan_content_images_checkbox .isChecked ()if hasattr (self ,'scan_content_images_checkbox')else False ,
+        USE_COOKIE_KEY :self .use_cookie_checkbox .isChecked ()if self .use_cookie_checkbox is not None else False ,
+        THEME_KEY :self .current_theme ,
+        LANGUAGE_KEY :self .current_selected_language ,
+        }
+        for settings_key ,settings_value in pending_settings .items ():
+            self .settings .setValue (settings_key ,settings_value )
         self ._save_persistent_history ()
 
         should_exit =True 
         is_downloading =self ._is_download_active ()
+        # Exit messages are collected and emitted as one log entry.
+        exit_log_lines =[]
 
         if is_downloading :
             reply =QMessageBox .question (self ,"Confirm Exit",
             "Download in progress. Are you sure you want to exit and cancel?",
             QMessageBox .Yes |QMessageBox .No ,QMessageBox .No )
             if reply ==QMessageBox .Yes :
-                self .log_signal .emit ("⚠️ Cancelling active download due to application exit...")
-                self .cancellation_event .set ()
-                if self .download_thread and self .download_thread .isRunning ():
-                    self .download_thread .requestInterruption ()
-                    self .log_signal .emit ("   Signaled single download thread to interrupt.")
-                if self .download_thread and self .download_thread .isRunning ():
-                    self .log_signal .emit ("   Waiting for single download thread to finish...")
-                    self .download_thread .wait (3000 )
-                    if self .download_thread .isRunning ():
-                        self .log_signal .emit ("   ⚠️ Single download thread did not terminate gracefully.")
-
-                if self .thread_pool :
-                    self .log_signal .emit ("   Shutting down thread pool (waiting for completion)...")
-                    self .thread_pool .shutdown (wait =True ,cancel_futures =True )
-                    self .log_signal .emit ("   Thread pool shutdown complete.")
-                    self .thread_pool =None 
-                self .log_signal .emit ("   Cancellation for exit complete.")
+                exit_log_lines .append ("⚠️ Cancelling active download due to application exit...")
+                if self ._request_cancel_and_wait (EXIT_POOL_DRAIN_TIMEOUT_MS ):
+                    exit_log_lines .append ("   Cancellation for exit complete.")
+                else :
+                    exit_log_lines .append ("   ⚠️ Some download threads did not terminate gracefully.")
             else :
                 should_exit =False 
                 self .log_signal .emit ("ℹ️ Application exit cancelled.")
@@ -936,16 +1076,72 @@ class DownloaderApp (QWidget ):
                 return 
 
         if should_exit :
-            self .log_signal .emit ("ℹ️ Application closing.")
+            exit_log_lines .append ("ℹ️ Application closing.")
             if self .thread_pool :
-                self .log_signal .emit ("   Final thread pool check: Shutting down...")
-                self .cancellation_event .set ()
-                self .thread_pool .shutdown (wait =True ,cancel_futures =True )
-                self .thread_pool =None 
-            self .log_signal .emit ("👋 Exiting application.")
+                exit_log_lines .append ("   Final thread pool check: Shutting down...")
+                self ._drain_thread_pool (EXIT_POOL_DRAIN_TIMEOUT_MS )
+            shutdown_compression_pool ()
+            self .download_controller_thread .quit ()
+            if not self .download_controller_thread .wait (EXIT_POOL_DRAIN_TIMEOUT_MS ):
+                # quit() cannot interrupt a fetcher that is still running on the controller
+                # thread. Keep the window (and its reference to the thread) alive, hidden,
+                # and close again once the thread has finished.
+                exit_log_lines .append ("   ⚠️ Post fetcher is still stopping. The application will exit once it finishes.")
+                self .log_signal .emit ("\n".join (exit_log_lines ))
+                self .download_controller_thread .finished .connect (self .close )
+                self .hide ()
+                event .ignore ()
+                return 
+            # Flushed once, only when the app is really exiting; if exit is cancelled,
+            # QSettings writes the changes out from the event loop as usual.
+            self .settings .sync ()
+            exit_log_lines .append ("👋 Exiting application.")
+            self .log_signal .emit ("\n".join (exit_log_lines ))
             event .accept ()
 
 
+    def _request_cancel_and_wait (self ,timeout_ms ):
+        """
+        Cancels the running download, single-threaded or pooled, and waits up
+        to `timeout_ms` for it to stop. A timeout of 0 only signals and returns.
+
+        Returns:
+            bool: True if nothing is left running.
+        """
+        self .cancellation_event .set ()
+        stopped_cleanly =True 
+        if self .download_thread and self .download_thread .isRunning ():
+            self .download_thread .requestInterruption ()
+            if timeout_ms >0 :
+                self .download_thread .wait (timeout_ms )
+            stopped_cleanly =not self .download_thread .isRunning ()
+        if self .thread_pool :
+            stopped_cleanly =self ._drain_thread_pool (timeout_ms )and stopped_cleanly 
+        return stopped_cleanly 
+
+    def _drain_thread_pool (self ,timeout_ms ):
+        """
+        Cancels the post worker pool and waits up to `timeout_ms` for running
+        workers to stop, keeping the GUI responsive meanwhile. Workers still
+        running at the deadline are logged but not waited on here. They are
+        non-daemon threads, so on exit the process stays alive until they see
+        the cancellation, which a blocked read can delay by its full timeout.
+
+        Returns:
+            bool: True if no worker was still running at the deadline.
+        """
+        self .cancellation_event .set ()
+        self .thread_pool .shutdown (wait =False ,cancel_futures =True )
+        self .thread_pool =None 
+        pending_futures ={f for f in self .active_futures if f is not None and not f .done ()}
+        deadline =time .monotonic ()+timeout_ms /1000.0 
+        while pending_futures and time .monotonic ()<deadline :
+            _ ,pending_futures =wait_futures (pending_futures ,timeout =0.05 )
+            QApplication .processEvents (QEventLoop .ExcludeUserInputEvents ,50 )
+        if pending_futures and timeout_ms >0 :
+            self .log_signal .emit (f"   ⚠️ {len (pending_futures )} post worker(s) still running after {timeout_ms } ms. They will stop after their current network read, which can take a few minutes; the process stays alive until then.")
+        return not pending_futures 
+
     def _request_restart_application (self ):
         self .log_signal .emit ("🔄 Application restart requested by user for language change.")
         self ._restart_pending =True 
@@ -975,7 +1171,33 @@ class DownloaderApp (QWidget ):
             f"Could not automatically restart the application: {e }\n\nPlease restart it manually.")
 
 
+    @staticmethod 
+    def _configured_box_layout (layout_class ,parent ,spacing ,margins ):
+        # Margins and spacing are set before the layout is installed on its parent,
+        # so configuring it does not invalidate an attached layout.
+        layout =layout_class ()
+        layout .setContentsMargins (*margins )
+        layout .setSpacing (spacing )
+        if parent is not None :
+            parent .setLayout (layout )
+        return layout 
+
+    def _hbox (self ,parent =None ,spacing =10 ,margins =(0 ,0 ,0 ,0 )):
+        return self ._configured_box_layout (QHBoxLayout ,parent ,spacing ,margins )
+
+    def _vbox (self ,parent =None ,spacing =10 ,margins =(0 ,0 ,0 ,0 )):
+        return self ._configured_box_layout (QVBoxLayout ,parent ,spacing ,margins )
+
     def init_ui (self ):
+        # Build the whole widget tree with updates suspended, so any event processing
+        # that happens during construction cannot trigger intermediate repaints.
+        self .setUpdatesEnabled (False )
+        try :
+            self ._build_ui ()
+        finally :
+            self .setUpdatesEnabled (True )
+
+    def _build_ui (self ):
         self .main_splitter =QSplitter (Qt .Horizontal )
         left_panel_widget =QWidget ()
         right_panel_widget =QWidget ()
@@ -993,7 +1215,7 @@ class DownloaderApp (QWidget ):
         url_input_layout .addWidget (self .url_label_widget )
         self .link_input =QLineEdit ()
         self .link_input .setPlaceholderText ("e.g., https://kemono.su/patreon/user/12345 or .../post/98765")
-        self .link_input .textChanged .connect (self .update_custom_folder_visibility )
+        self .link_input .textChanged .connect (self .link_input_debounce_timer .start )
         url_input_layout .addWidget (self .link_input ,1 )
         self .empty_popup_button =QPushButton ("🎨")
         self .empty_popup_button .setStyleSheet ("padding: 4px 6px;")
@@ -1003,10 +1225,12 @@ class DownloaderApp (QWidget ):
         self .page_range_label =QLabel (self ._tr ("page_range_label_text","Page Range:"))
         self .page_range_label .setStyleSheet ("font-weight: bold; padding-left: 10px;")
         url_input_layout .addWidget (self .page_range_label )
+        # QIntValidator is stateless, so both page inputs share one instance.
+        page_number_validator =QIntValidator (1 ,99999 ,self )
         self .start_page_input =QLineEdit ()
         self .start_page_input .setPlaceholderText (self ._tr ("start_page_input_placeholder","Start"))
         self .start_page_input .setFixedWidth (50 )
-        self .start_page_input .setValidator (QIntValidator (1 ,99999 ))
+        self .start_page_input .setValidator (page_number_validator )
         url_input_layout .addWidget (self .start_page_input )
         self .to_label =QLabel (self ._tr ("page_range_to_label_text","to"))
         url_input_layout .addWidget (self .to_label )
@@ -1014,7 +1238,7 @@ class DownloaderApp (QWidget ):
         self .end_page_input .setPlaceholderText (self ._tr ("end_page_input_placeholder","End"))
         self .end_page_input .setFixedWidth (50 )
         self .end_page_input .setToolTip (self ._tr ("end_page_input_tooltip","For creator URLs: Specify the ending page number..."))
-        self .end_page_input .setValidator (QIntValidator (1 ,99999 ))
+        self .end_page_input .setValidator (page_number_validator )
         url_input_layout .addWidget (self .end_page_input )
 
         self .url_placeholder_widget =QWidget ()
@@ -1064,21 +1288,15 @@ class DownloaderApp (QWidget ):
 
 
         self .filters_and_custom_folder_container_widget =QWidget ()
-        filters_and_custom_folder_layout =QHBoxLayout (self .filters_and_custom_folder_container_widget )
-        filters_and_custom_folder_layout .setContentsMargins (0 ,5 ,0 ,0 )
-        filters_and_custom_folder_layout .setSpacing (10 )
+        filters_and_custom_folder_layout =self ._hbox (self .filters_and_custom_folder_container_widget ,spacing =10 ,margins =(0 ,5 ,0 ,0 ))
 
         self .character_filter_widget =QWidget ()
-        character_filter_v_layout =QVBoxLayout (self .character_filter_widget )
-        character_filter_v_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        character_filter_v_layout .setSpacing (2 )
+        character_filter_v_layout =self ._vbox (self .character_filter_widget ,spacing =2 )
 
         self .character_label =QLabel ("🎯 Filter by Character(s) (comma-separated):")
         character_filter_v_layout .addWidget (self .character_label )
 
-        char_input_and_button_layout =QHBoxLayout ()
-        char_input_and_button_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        char_input_and_button_layout .setSpacing (10 )
+        char_input_and_button_layout =self ._hbox (spacing =10 )
 
         self .character_input =QLineEdit ()
         self .character_input .setPlaceholderText ("e.g., Tifa, Aerith, (Cloud, Zack)")
@@ -1095,9 +1313,7 @@ class DownloaderApp (QWidget ):
 
 
         self .custom_folder_widget =QWidget ()
-        custom_folder_v_layout =QVBoxLayout (self .custom_folder_widget )
-        custom_folder_v_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        custom_folder_v_layout .setSpacing (2 )
+        custom_folder_v_layout =self ._vbox (self .custom_folder_widget ,spacing =2 )
         self .custom_folder_label =QLabel ("🗄️ Custom Folder Name (Single Post Only):")
         self .custom_folder_input =QLineEdit ()
         self .custom_folder_input .setPlaceholderText ("Optional: Save this post to specific folder")
@@ -1110,21 +1326,14 @@ class DownloaderApp (QWidget ):
 
         left_layout .addWidget (self .filters_and_custom_folder_container_widget )
         word_manipulation_container_widget =QWidget ()
-        word_manipulation_outer_layout =QHBoxLayout (word_manipulation_container_widget )
-        word_manipulation_outer_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        word_manipulation_outer_layout .setSpacing (15 )
+        word_manipulation_outer_layout =self ._hbox (word_manipulation_container_widget ,spacing =15 )
         skip_words_widget =QWidget ()
-        skip_words_vertical_layout =QVBoxLayout (skip_words_widget )
-        skip_words_vertical_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        skip_words_vertical_layout .setSpacing (2 )
+        skip_words_vertical_layout =self ._vbox (skip_words_widget ,spacing =2 )
 
         self .skip_words_label_widget =QLabel ()
         skip_words_vertical_layout .addWidget (self .skip_words_label_widget )
 
-        skip_input_and_button_layout =QHBoxLayout ()
-        skip_input_and_button_layout =QHBoxLayout ()
-        skip_input_and_button_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        skip_input_and_button_layout .setSpacing (10 )
+        skip_input_and_button_layout =self ._hbox (spacing =10 )
         self .skip_words_input =QLineEdit ()
         self .skip_words_input .setPlaceholderText ("e.g., WM, WIP, sketch, preview")
         skip_input_and_button_layout .addWidget (self .skip_words_input ,1 )
@@ -1137,9 +1346,7 @@ class DownloaderApp (QWidget ):
         skip_words_vertical_layout .addLayout (skip_input_and_button_layout )
         word_manipulation_outer_layout .addWidget (skip_words_widget ,7 )
         remove_words_widget =QWidget ()
-        remove_words_vertical_layout =QVBoxLayout (remove_words_widget )
-        remove_words_vertical_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        remove_words_vertical_layout .setSpacing (2 )
+        remove_words_vertical_layout =self ._vbox (remove_words_widget ,spacing =2 )
         self .remove_from_filename_label_widget =QLabel ()
         remove_words_vertical_layout .addWidget (self .remove_from_filename_label_widget )
         self .remove_from_filename_input =QLineEdit ()
@@ -1255,7 +1462,7 @@ class DownloaderApp (QWidget ):
         self .thread_count_input =QLineEdit ()
         self .thread_count_input .setFixedWidth (40 )
         self .thread_count_input .setText ("4")
-        self .thread_count_input .setValidator (QIntValidator (1 ,MAX_THREADS ))
+        self .thread_count_input .setValidator (QIntValidator (1 ,MAX_THREADS ,self ))
         multithreading_layout .addWidget (self .thread_count_input )
         advanced_row2_layout .addLayout (multithreading_layout )
 
@@ -1274,9 +1481,7 @@ class DownloaderApp (QWidget ):
         left_layout .addLayout (checkboxes_group_layout )
 
         self .standard_action_buttons_widget =QWidget ()
-        btn_layout =QHBoxLayout ()
-        btn_layout .setContentsMargins (0 ,0 ,0 ,0 )
-        btn_layout .setSpacing (10 )
+        btn_layout =self ._hbox (spacing =10 )
         self .download_btn =QPushButton ("⬇️ Start Download")
         self .download_btn .setStyleSheet ("padding: 4px 12px; font-weight: bold;")
         self .download_btn .clicked .connect (self .start_download )
@@ -1324,6 +1529,7 @@ class DownloaderApp (QWidget ):
 
         self .character_list =QListWidget ()
         self .character_list .setSelectionMode (QListWidget .ExtendedSelection )
+        self .character_list .setUniformItemSizes (True )
         left_layout .addWidget (self .character_list ,1 )
 
         char_manage_layout =QHBoxLayout ()
@@ -1373,20 +1579,12 @@ class DownloaderApp (QWidget ):
         left_layout .addStretch (0 )
 
         log_title_layout =QHBoxLayout ()
+        self .log_title_layout =log_title_layout 
         self .progress_log_label =QLabel ("📜 Progress Log:")
         log_title_layout .addWidget (self .progress_log_label )
         log_title_layout .addStretch (1 )
-
-        self .link_search_input =QLineEdit ()
-        self .link_search_input .setPlaceholderText ("Search Links...")
-        self .link_search_input .setVisible (False )
-
-        log_title_layout .addWidget (self .link_search_input )
-        self .link_search_button =QPushButton ("🔍")
-        self .link_search_button .setVisible (False )
-        self .link_search_button .setFixedWidth (30 )
-        self .link_search_button .setStyleSheet ("padding: 4px 4px;")
-        log_title_layout .addWidget (self .link_search_button )
+        # The link search box and button go here; _ensure_link_search_widgets()
+        # creates them the first time "Only Links" mode is selected.
 
         self .manga_rename_toggle_button =QPushButton ()
         self .manga_rename_toggle_button .setVisible (False )
@@ -1427,31 +1625,21 @@ class DownloaderApp (QWidget ):
         self .main_log_output =QTextEdit ()
         self .main_log_output .setReadOnly (True )
         self .main_log_output .setLineWrapMode (QTextEdit .NoWrap )
+        self .main_log_output .document ().setMaximumBlockCount (MAIN_LOG_MAX_BLOCKS )
         self .log_view_stack .addWidget (self .main_log_output )
+        # The missed character log page is created by _get_missed_character_log_output()
+        # the first time it is shown.
 
-        self .missed_character_log_output =QTextEdit ()
-        self .missed_character_log_output .setReadOnly (True )
-        self .missed_character_log_output .setLineWrapMode (QTextEdit .NoWrap )
-        self .log_view_stack .addWidget (self .missed_character_log_output )
-
-        self .external_log_output =QTextEdit ()
-        self .external_log_output .setReadOnly (True )
-        self .external_log_output .setLineWrapMode (QTextEdit .NoWrap )
-        self .external_log_output .hide ()
-
+        # The external links log below it is created by _get_external_log_output()
+        # the first time external links are turned on.
         self .log_splitter .addWidget (self .log_view_stack )
-        self .log_splitter .addWidget (self .external_log_output )
         self .log_splitter .setSizes ([self .height (),0 ])
         right_layout .addWidget (self .log_splitter ,1 )
 
         export_button_layout =QHBoxLayout ()
+        self .export_button_layout =export_button_layout 
         export_button_layout .addStretch (1 )
-        self .export_links_button =QPushButton (self ._tr ("export_links_button_text","Export Links"))
-        self .export_links_button .setFixedWidth (100 )
-        self .export_links_button .setStyleSheet ("padding: 4px 8px; margin-top: 5px;")
-        self .export_links_button .setEnabled (False )
-        self .export_links_button .setVisible (False )
-        export_button_layout .addWidget (self .export_links_button )
+        # The export button is created alongside the link search widgets.
 
         self .download_extracted_links_button =QPushButton (self ._tr ("download_extracted_links_button_text","Download"))
         self .download_extracted_links_button .setFixedWidth (100 )
@@ -1498,11 +1686,10 @@ class DownloaderApp (QWidget ):
         self .update_page_range_enabled_state ()
         if self .manga_mode_checkbox :
             self .update_ui_for_manga_mode (self .manga_mode_checkbox .isChecked ())
-        if hasattr (self ,'link_input'):self .link_input .textChanged .connect (lambda :self .update_ui_for_manga_mode (self .manga_mode_checkbox .isChecked ()if self .manga_mode_checkbox else False ))
 
         self ._load_creator_name_cache_from_json ()
         self .load_known_names_from_util ()
-        self ._update_cookie_input_visibility (self .use_cookie_checkbox .isChecked ()if hasattr (self ,'use_cookie_checkbox')else False )
+        self ._update_cookie_input_visibility (self .use_cookie_checkbox .isChecked ()if self .use_cookie_checkbox is not None else False )
         self ._handle_multithreading_toggle (self .use_multithreading_checkbox .isChecked ())
         if hasattr (self ,'radio_group')and self .radio_group .checkedButton ():
             self ._handle_filter_mode_change (self .radio_group .checkedButton (),True )
@@ -1674,8 +1861,8 @@ class DownloaderApp (QWidget ):
             self .last_link_input_text_for_queue_sync =self .link_input .text ()
 
     def _update_download_extracted_links_button_state (self ):
-        if hasattr (self ,'download_extracted_links_button')and self .download_extracted_links_button :
-            is_only_links =self .radio_only_links and self .radio_only_links .isChecked ()
+        if self .download_extracted_links_button is not None :
+            is_only_links =self ._mode_only_links 
             if not is_only_links :
                 self .download_extracted_links_button .setEnabled (False )
                 return 
@@ -1688,7 +1875,7 @@ class DownloaderApp (QWidget ):
 
     def _show_download_extracted_links_dialog (self ):
         """Shows the placeholder dialog for downloading extracted links."""
-        if not (self .radio_only_links and self .radio_only_links .isChecked ()):
+        if not self ._mode_only_links :
             self .log_signal .emit ("ℹ️ Download extracted links button clicked, but not in 'Only Links' mode.")
             return 
 
@@ -1719,8 +1906,8 @@ class DownloaderApp (QWidget ):
             return 
 
 
-        if self .radio_only_links and self .radio_only_links .isChecked ()and self .only_links_log_display_mode ==LOG_DISPLAY_DOWNLOAD_PROGRESS :
-            self .main_log_output .clear ()
+        if self ._mode_only_links and self .only_links_log_display_mode ==LOG_DISPLAY_DOWNLOAD_PROGRESS :
+            self ._clear_main_log ()
             self .log_signal .emit ("ℹ️ Displaying Mega download progress (extracted links hidden)...")
             self .mega_download_log_preserved_once =False 
 
@@ -1790,8 +1977,8 @@ class DownloaderApp (QWidget ):
         self .mega_download_log_preserved_once =True 
         self .log_signal .emit ("INTERNAL: mega_download_log_preserved_once SET to True.")
 
-        if self .radio_only_links and self .radio_only_links .isChecked ():
-            self .log_signal .emit (HTML_PREFIX +"<br><hr>--- End of Mega Download Log ---<br>")
+        if self ._mode_only_links :
+            self .log_html_signal .emit ("<br><hr>--- End of Mega Download Log ---<br>")
 
 
 
@@ -1813,7 +2000,6 @@ class DownloaderApp (QWidget ):
         pass 
     def _show_future_settings_dialog (self ):
         """Shows the placeholder dialog for future settings."""
-        dialog =FutureSettingsDialog (self )
         dialog =FutureSettingsDialog (self ,self )
         dialog .exec_ ()
 
@@ -1855,7 +2041,7 @@ class DownloaderApp (QWidget ):
         if filepath :
             self .selected_cookie_filepath =filepath 
             self .log_signal .emit (f"ℹ️ Selected cookie file: {filepath }")
-            if hasattr (self ,'cookie_text_input'):
+            if self .cookie_text_input is not None :
                 self .cookie_text_input .blockSignals (True )
                 self .cookie_text_input .setText (filepath )
             self .cookie_text_input .setToolTip (self ._tr ("cookie_text_input_tooltip_file_selected","Using selected cookie file: {filepath}").format (filepath =filepath ))
@@ -1865,7 +2051,7 @@ class DownloaderApp (QWidget ):
             self .cookie_text_input .blockSignals (False )
 
     def _update_cookie_input_placeholders_and_tooltips (self ):
-        if hasattr (self ,'cookie_text_input'):
+        if self .cookie_text_input is not None :
             if self .selected_cookie_filepath :
                 self .cookie_text_input .setPlaceholderText (self ._tr ("cookie_text_input_placeholder_with_file_selected_text","Using selected cookie file..."))
                 self .cookie_text_input .setToolTip (self ._tr ("cookie_text_input_tooltip_file_selected","Using selected cookie file: {filepath}").format (filepath =self .selected_cookie_filepath ))
@@ -1896,7 +2082,7 @@ class DownloaderApp (QWidget ):
 
     def _handle_cookie_text_manual_change (self ,text ):
         """Handles manual changes to the cookie text input, especially clearing a browsed path."""
-        if not hasattr (self ,'cookie_text_input')or not hasattr (self ,'use_cookie_checkbox'):
+        if self .cookie_text_input is None or self .use_cookie_checkbox is None :
             return 
         if self .selected_cookie_filepath and not text .strip ()and self .use_cookie_checkbox .isChecked ():
             self .selected_cookie_filepath =None 
@@ -1909,7 +2095,7 @@ class DownloaderApp (QWidget ):
         return """
         QWidget { background-color: #2E2E2E; color: #E0E0E0; font-family: Segoe UI, Arial, sans-serif; font-size: 10pt; }
         QLineEdit, QListWidget { background-color: #3C3F41; border: 1px solid #5A5A5A; padding: 5px; color: #F0F0F0; border-radius: 4px; }
-        QTextEdit { background-color: #3C3F41; border: 1px solid #5A5A5A; padding: 5px;
+        QTextEdit, QPlainTextEdit { background-color: #3C3F41; border: 1px solid #5A5A5A; padding: 5px;
                           color: #F0F0F0; border-radius: 4px; 
                           font-family: Consolas, Courier New, monospace; font-size: 9.5pt; }
         QPushButton { background-color: #555; color: #F0F0F0; border: 1px solid #6A6A6A; padding: 6px 12px; border-radius: 4px; min-height: 22px; }
@@ -1967,90 +2153,140 @@ class DownloaderApp (QWidget ):
             QMessageBox .critical (self ,"Dialog Error",f"An unexpected error occurred with the folder selection dialog: {e }")
 
     def handle_main_log (self ,message ):
-        is_html_message =message .startswith (HTML_PREFIX )
-        display_message =message 
-        use_html =False 
+        """Queues a log line; _flush_main_log_buffer writes queued lines to the log view in batches."""
+        with QMutexLocker (self .main_log_buffer_mutex ):
+            self .main_log_buffer .append ((False ,message ))
+        self ._schedule_main_log_flush ()
+
+    def handle_main_log_html (self ,html_fragment ):
+        """Queues an HTML fragment for the log view, written in order with the plain lines."""
+        with QMutexLocker (self .main_log_buffer_mutex ):
+            self .main_log_buffer .append ((True ,html_fragment ))
+        self ._schedule_main_log_flush ()
+
+    def _schedule_main_log_flush (self ):
+        # Single-shot and only armed by new output, so an idle log costs no timer wakeups.
+        if not self .main_log_flush_timer .isActive ():
+            self .main_log_flush_timer .start ()
+
+    def _clear_main_log (self ):
+        """Clears the log view along with any lines still waiting to be flushed."""
+        with QMutexLocker (self .main_log_buffer_mutex ):
+            self .main_log_buffer .clear ()
+        if self .main_log_output :
+            self .main_log_output .clear ()
 
-        if is_html_message :
-            display_message =message [len (HTML_PREFIX ):]
-            use_html =True 
+    def _flush_main_log_buffer (self ):
+        with QMutexLocker (self .main_log_buffer_mutex ):
+            if not self .main_log_buffer :
+                return 
+            pending_messages =list (self .main_log_buffer )
+            self .main_log_buffer .clear ()
 
+        plain_lines =[]
         try :
-            safe_message =str (display_message ).replace ('\x00','[NULL]')
-            if use_html :
-                self .main_log_output .insertHtml (safe_message )
-            else :
-                self .main_log_output .append (safe_message )
+            # Write through one cursor at the end of the document instead of append(),
+            # so each batch is inserted without moving the view's own cursor.
+            log_document =self .main_log_output .document ()
+            end_cursor =QTextCursor (log_document )
+            end_cursor .movePosition (QTextCursor .End )
+            end_cursor .beginEditBlock ()
+            for is_html ,message in pending_messages :
+                safe_message =str (message ).replace ('\x00','[NULL]')
+                if is_html :
+                    if plain_lines :
+                        self ._insert_log_text_block (end_cursor ,log_document ,'\n'.join (plain_lines ))
+                        plain_lines =[]
+                    end_cursor .insertHtml (safe_message )
+                else :
+                    plain_lines .append (safe_message )
+            if plain_lines :
+                self ._insert_log_text_block (end_cursor ,log_document ,'\n'.join (plain_lines ))
+            end_cursor .endEditBlock ()
 
             scrollbar =self .main_log_output .verticalScrollBar ()
             if scrollbar .value ()>=scrollbar .maximum ()-30 :
                 scrollbar .setValue (scrollbar .maximum ())
         except Exception as e :
-            print (f"GUI Main Log Error: {e }\nOriginal Message: {message }")
+            print (f"GUI Main Log Error: {e }\nPending Messages: {len (pending_messages )}")
+
+    @staticmethod
+    def _insert_log_text_block (cursor ,document ,text ):
+        """Inserts `text` as new paragraph(s) at `cursor`, matching QTextEdit.append()."""
+        if not document .isEmpty ():
+            cursor .insertBlock ()
+        # Plain lines must not inherit formatting from preceding HTML messages.
+        cursor .insertText (text ,QTextCharFormat ())
+
     def _extract_key_term_from_title (self ,title ):
         if not title :
             return None 
-        title_cleaned =re .sub (r'\[.*?\]','',title )
-        title_cleaned =re .sub (r'\(.*?\)','',title_cleaned )
+        title_cleaned =_TITLE_BRACKETS_RE .sub ('',title )
+        title_cleaned =_TITLE_PARENS_RE .sub ('',title_cleaned )
         title_cleaned =title_cleaned .strip ()
-        word_matches =list (re .finditer (r'\b[a-zA-Z][a-zA-Z0-9_-]*\b',title_cleaned ))
-
-        capitalized_candidates =[]
-        for match in word_matches :
+        # One pass keeps the best capitalized and the best fallback word, ranked by
+        # (length, position): the longest wins and, between equals, the later one.
+        best_capitalized =None 
+        best_capitalized_rank =None 
+        best_fallback =None 
+        best_fallback_rank =None 
+        for match in _TITLE_WORD_RE .finditer (title_cleaned ):
             word =match .group (0 )
-            if word .istitle ()and word .lower ()not in self .STOP_WORDS and len (word )>2 :
-                if not (len (word )>3 and word .isupper ()):
-                    capitalized_candidates .append ({'text':word ,'len':len (word ),'pos':match .start ()})
-
-        if capitalized_candidates :
-            capitalized_candidates .sort (key =lambda x :(x ['len'],x ['pos']),reverse =True )
-            return capitalized_candidates [0 ]['text']
-        non_capitalized_words_info =[]
-        for match in word_matches :
-            word =match .group (0 )
-            if word .lower ()not in self .STOP_WORDS and len (word )>3 :
-                non_capitalized_words_info .append ({'text':word ,'len':len (word ),'pos':match .start ()})
-
-        if non_capitalized_words_info :
-            non_capitalized_words_info .sort (key =lambda x :(x ['len'],x ['pos']),reverse =True )
-            return non_capitalized_words_info [0 ]['text']
-
-        return None 
+            word_len =len (word )
+            if word .lower ()in MISSED_TITLE_STOP_WORDS :
+                continue 
+            rank =(word_len ,match .start ())
+            if word_len >2 and word .istitle ()and not (word_len >3 and word .isupper ()):
+                if best_capitalized_rank is None or rank >best_capitalized_rank :
+                    best_capitalized ,best_capitalized_rank =word ,rank 
+            if word_len >3 and (best_fallback_rank is None or rank >best_fallback_rank ):
+                best_fallback ,best_fallback_rank =word ,rank 
+
+        return best_capitalized if best_capitalized is not None else best_fallback 
+
+    def _get_missed_character_log_output (self ):
+        if self .missed_character_log_output is None :
+            self .missed_character_log_output =QTextEdit ()
+            self .missed_character_log_output .setReadOnly (True )
+            self .missed_character_log_output .setLineWrapMode (QTextEdit .NoWrap )
+            self .missed_character_log_output .document ().setMaximumBlockCount (MISSED_CHARACTER_LOG_MAX_BLOCKS )
+            self .log_view_stack .addWidget (self .missed_character_log_output )
+            self ._refresh_missed_character_log ()
+        return self .missed_character_log_output 
 
     def handle_missed_character_post (self ,post_title ,reason ):
-        if self .missed_character_log_output :
-            key_term =self ._extract_key_term_from_title (post_title )
-
-            if key_term :
-                normalized_key_term =key_term .lower ()
-                if normalized_key_term not in self .already_logged_bold_key_terms :
-                    self .already_logged_bold_key_terms .add (normalized_key_term )
-                    self .missed_key_terms_buffer .append (key_term )
-                    self ._refresh_missed_character_log ()
-        else :
-            print (f"Debug (Missed Char Log): Title='{post_title }', Reason='{reason }'")
+        key_term =self ._extract_key_term_from_title (post_title )
+
+        if key_term :
+            normalized_key_term =key_term .lower ()
+            if normalized_key_term not in self .already_logged_bold_key_terms :
+                self .already_logged_bold_key_terms .add (normalized_key_term )
+                # The buffer is kept in display order, so a redraw never has to sort it.
+                insert_index =bisect .bisect_right (self .missed_key_terms_sort_keys ,normalized_key_term )
+                self .missed_key_terms_sort_keys .insert (insert_index ,normalized_key_term )
+                self .missed_key_terms_buffer .insert (insert_index ,key_term )
+                # The view only exists once it has been shown; bursts of new terms are redrawn together.
+                if self .missed_character_log_output is not None and not self .missed_character_log_refresh_timer .isActive ():
+                    self .missed_character_log_refresh_timer .start ()
 
     def _refresh_missed_character_log (self ):
         if self .missed_character_log_output :
+            self .missed_character_log_output .setUpdatesEnabled (False )
             self .missed_character_log_output .clear ()
-            sorted_terms =sorted (self .missed_key_terms_buffer ,key =str .lower )
-            separator_line ="-"*40 
-
-            for term in sorted_terms :
-                display_term =term .capitalize ()
-
-                self .missed_character_log_output .append (separator_line )
-                self .missed_character_log_output .append (f'<p align="center"><b><font style="font-size: 12.4pt; color: #87CEEB;">{display_term }</font></b></p>')
-                self .missed_character_log_output .append (separator_line )
+            for term in self .missed_key_terms_buffer :
+                self .missed_character_log_output .append (_MISSED_TERM_SEPARATOR )
+                self .missed_character_log_output .append (_MISSED_TERM_HTML .format (term .capitalize ()))
+                self .missed_character_log_output .append (_MISSED_TERM_SEPARATOR )
                 self .missed_character_log_output .append ("")
 
+            self .missed_character_log_output .setUpdatesEnabled (True )
             scrollbar =self .missed_character_log_output .verticalScrollBar ()
             scrollbar .setValue (0 )
 
     def _is_download_active (self ):
         single_thread_active =self .download_thread and self .download_thread .isRunning ()
         fetcher_active =hasattr (self ,'is_fetcher_thread_running')and self .is_fetcher_thread_running 
-        pool_has_active_tasks =self .thread_pool is not None and any (not f .done ()for f in self .active_futures if f is not None )
+        pool_has_active_tasks =self .thread_pool is not None and self ._active_future_count >0 
         retry_pool_active =hasattr (self ,'retry_thread_pool')and self .retry_thread_pool is not None and hasattr (self ,'active_retry_futures')and any (not f .done ()for f in self .active_retry_futures if f is not None )
 
 
@@ -2059,53 +2295,45 @@ class DownloaderApp (QWidget ):
         return single_thread_active or fetcher_active or pool_has_active_tasks or retry_pool_active or external_dl_thread_active 
 
     def handle_external_link_signal (self ,post_title ,link_text ,link_url ,platform ,decryption_key ):
+        is_only_links_mode =self ._mode_only_links 
         link_data =(post_title ,link_text ,link_url ,platform ,decryption_key )
         self .external_link_queue .append (link_data )
-        if self .radio_only_links and self .radio_only_links .isChecked ():
+        if is_only_links_mode :
             self .extracted_links_cache .append (link_data )
             self ._update_download_extracted_links_button_state ()
-
-        is_only_links_mode =self .radio_only_links and self .radio_only_links .isChecked ()
-        should_display_in_external_log =self .show_external_links and not is_only_links_mode 
-
-        if not (is_only_links_mode or should_display_in_external_log ):
-            self ._is_processing_external_link_queue =False 
-            if self .external_link_queue :
-                QTimer .singleShot (0 ,self ._try_process_next_external_link )
-            return 
-
-
-        if link_data not in self .extracted_links_cache :
+        elif link_data not in self .extracted_links_cache :
             self .extracted_links_cache .append (link_data )
+        self ._try_process_next_external_link ()
 
     def _try_process_next_external_link (self ):
-        if self ._is_processing_external_link_queue or not self .external_link_queue :
+        if not self .external_link_queue :
             return 
 
-        is_only_links_mode =self .radio_only_links and self .radio_only_links .isChecked ()
+        is_only_links_mode =self ._mode_only_links 
         should_display_in_external_log =self .show_external_links and not is_only_links_mode 
 
         if not (is_only_links_mode or should_display_in_external_log ):
-            self ._is_processing_external_link_queue =False 
-            if self .external_link_queue :
-                QTimer .singleShot (0 ,self ._try_process_next_external_link )
+            # Leave the queue for when a link view is turned back on.
             return 
 
-        self ._is_processing_external_link_queue =True 
-        link_data =self .external_link_queue .popleft ()
+        if not self .external_link_drain_timer .isActive ():
+            self .external_link_drain_timer .start ()
 
-        if is_only_links_mode :
-            QTimer .singleShot (0 ,lambda data =link_data :self ._display_and_schedule_next (data ))
-        elif self ._is_download_active ():
-            delay_ms =random .randint (4000 ,8000 )
-            QTimer .singleShot (delay_ms ,lambda data =link_data :self ._display_and_schedule_next (data ))
-        else :
-            QTimer .singleShot (0 ,lambda data =link_data :self ._display_and_schedule_next (data ))
+    def _drain_external_link_queue (self ):
+        """Displays up to EXTERNAL_LINK_DRAIN_BATCH_SIZE queued links; stops the timer once the queue is empty."""
+        is_only_links_mode =self ._mode_only_links 
+        if not (is_only_links_mode or self .show_external_links ):
+            self .external_link_drain_timer .stop ()
+            return 
 
+        for _ in range (min (EXTERNAL_LINK_DRAIN_BATCH_SIZE ,len (self .external_link_queue ))):
+            self ._display_external_link (self .external_link_queue .popleft ())
+        if not self .external_link_queue :
+            self .external_link_drain_timer .stop ()
 
-    def _display_and_schedule_next (self ,link_data ):
+    def _display_external_link (self ,link_data ):
         post_title ,link_text ,link_url ,platform ,decryption_key =link_data 
-        is_only_links_mode =self .radio_only_links and self .radio_only_links .isChecked ()
+        is_only_links_mode =self ._mode_only_links 
 
         max_link_text_len =50 
         display_text =(link_text [:max_link_text_len ].strip ()+"..."
@@ -2117,39 +2345,71 @@ class DownloaderApp (QWidget ):
 
         if is_only_links_mode :
             if post_title !=self ._current_link_post_title :
-                separator_html ="<br>"+"-"*45 +"<br>"
                 if self ._current_link_post_title is not None :
-                    self .log_signal .emit (HTML_PREFIX +separator_html )
-                title_html =f'<b style="color: #87CEEB;">{html .escape (post_title )}</b><br>'
-                self .log_signal .emit (HTML_PREFIX +title_html )
+                    self .log_html_signal .emit (_LINK_GROUP_SEPARATOR_HTML )
+                self .log_html_signal .emit (_LINK_TITLE_HTML .format (html .escape (post_title )))
                 self ._current_link_post_title =post_title 
 
             self .log_signal .emit (formatted_link_info )
         elif self .show_external_links :
-            separator ="-"*45 
-            self ._append_to_external_log (formatted_link_info ,separator )
-
-        self ._is_processing_external_link_queue =False 
-        self ._try_process_next_external_link ()
+            self ._append_to_external_log (formatted_link_info )
 
 
-    def _append_to_external_log (self ,formatted_link_text ,separator ):
+    def _append_to_external_log (self ,formatted_link_text ):
         if not (self .external_log_output and self .external_log_output .isVisible ()):
             return 
 
+        # Lines are collected and written by _flush_external_log_buffer in one append per interval.
+        self .external_log_pending_lines .append (formatted_link_text )
+        if not self .external_log_flush_timer .isActive ():
+            self .external_log_flush_timer .start ()
+
+    def _flush_external_log_buffer (self ):
+        if not self .external_log_pending_lines :
+            return 
+        pending_lines =self .external_log_pending_lines 
+        self .external_log_pending_lines =[]
         try :
-            self .external_log_output .append (formatted_link_text )
-            self .external_log_output .append ("")
+            # Each link is followed by a blank line, as when they were appended one by one.
+            self .external_log_output .appendPlainText ("\n\n".join (pending_lines )+"\n")
 
             scrollbar =self .external_log_output .verticalScrollBar ()
             if scrollbar .value ()>=scrollbar .maximum ()-50 :
                 scrollbar .setValue (scrollbar .maximum ())
         except Exception as e :
-            self .log_signal .emit (f"GUI External Log Append Error: {e }\nOriginal Message: {formatted_link_text }")
-            print (f"GUI External Log Error (Append): {e }\nOriginal Message: {formatted_link_text }")
+            self .log_signal .emit (f"GUI External Log Append Error: {e }\nPending Lines: {len (pending_lines )}")
+            print (f"GUI External Log Error (Append): {e }\nPending Lines: {len (pending_lines )}")
 
+    def _clear_external_log (self ):
+        self .external_log_pending_lines =[]
+        if self .external_log_output is not None :
+            self .external_log_output .clear ()
+
+
+    def _flush_pending_file_progress (self ):
+        """Draws the newest progress tick that the throttle in update_file_progress_display held back."""
+        if self ._pending_file_progress is None :
+            return 
+        filename ,progress_info =self ._pending_file_progress 
+        self ._last_file_progress_update =0.0 
+        self .update_file_progress_display (filename ,progress_info )
 
     def update_file_progress_display (self ,filename ,progress_info ):
+        if filename and progress_info is not None :
+            # Progress ticks arrive per chunk; redraw the label at most ~10 times a second.
+            # A skipped tick is kept and drawn when the interval ends, so the label never
+            # stays on an older value than the last one received.
+            now =time .monotonic ()
+            elapsed =now -self ._last_file_progress_update 
+            if elapsed <FILE_PROGRESS_UPDATE_INTERVAL_S :
+                self ._pending_file_progress =(filename ,progress_info )
+                if not self .file_progress_flush_timer .isActive ():
+                    self .file_progress_flush_timer .start (int ((FILE_PROGRESS_UPDATE_INTERVAL_S -elapsed )*1000 )+1 )
+                return 
+            self ._last_file_progress_update =now 
+        self ._pending_file_progress =None 
+        self .file_progress_flush_timer .stop ()
+
         if not filename and progress_info is None :
             self .file_progress_label .setText ("")
             return 
@@ -2159,19 +2419,20 @@ class DownloaderApp (QWidget ):
                 self .file_progress_label .setText (self ._tr ("downloading_multipart_initializing_text","File: {filename} - Initializing parts...").format (filename =filename ))
                 return 
 
-            total_downloaded_overall =sum (cs .get ('downloaded',0 )for cs in progress_info )
-            total_file_size_overall =sum (cs .get ('total',0 )for cs in progress_info )
-
+            total_downloaded_overall =0 
+            total_file_size_overall =0 
             active_chunks_count =0 
             combined_speed_bps =0 
             for cs in progress_info :
+                total_downloaded_overall +=cs .get ('downloaded',0 )
+                total_file_size_overall +=cs .get ('total',0 )
                 if cs .get ('active',False ):
                     active_chunks_count +=1 
                     combined_speed_bps +=cs .get ('speed_bps',0 )
 
-            dl_mb =total_downloaded_overall /(1024 *1024 )
-            total_mb =total_file_size_overall /(1024 *1024 )
-            speed_MBps =(combined_speed_bps /8 )/(1024 *1024 )
+            dl_mb =total_downloaded_overall *_BYTES_TO_MB 
+            total_mb =total_file_size_overall *_BYTES_TO_MB 
+            speed_MBps =combined_speed_bps *0.125 *_BYTES_TO_MB 
 
             progress_text =self ._tr ("downloading_multipart_text","DL '{filename}...': {downloaded_mb:.1f}/{total_mb:.1f} MB ({parts} parts @ {speed:.2f} MB/s)").format (filename =filename [:20 ],downloaded_mb =dl_mb ,total_mb =total_mb ,parts =active_chunks_count ,speed =speed_MBps )
             self .file_progress_label .setText (progress_text )
@@ -2186,9 +2447,9 @@ class DownloaderApp (QWidget ):
             max_fn_len =25 
             disp_fn =filename if len (filename )<=max_fn_len else filename [:max_fn_len -3 ].strip ()+"..."
 
-            dl_mb =downloaded_bytes /(1024 *1024 )
+            dl_mb =downloaded_bytes *_BYTES_TO_MB 
             if total_bytes >0 :
-                tot_mb =total_bytes /(1024 *1024 )
+                tot_mb =total_bytes *_BYTES_TO_MB 
                 prog_text_base =self ._tr ("downloading_file_known_size_text","Downloading '{filename}' ({downloaded_mb:.1f}MB / {total_mb:.1f}MB)").format (filename =disp_fn ,downloaded_mb =dl_mb ,total_mb =tot_mb )
             else :
                 prog_text_base =self ._tr ("downloading_file_unknown_size_text","Downloading '{filename}' ({downloaded_mb:.1f}MB)").format (filename =disp_fn ,downloaded_mb =dl_mb )
@@ -2200,9 +2461,21 @@ class DownloaderApp (QWidget ):
             self .file_progress_label .setText ("")
 
 
+    def _get_external_log_output (self ):
+        if self .external_log_output is None :
+            # The external links log only ever holds plain lines, so it uses the lighter
+            # line-oriented QPlainTextEdit; the other logs render HTML lists and alignment.
+            self .external_log_output =QPlainTextEdit ()
+            self .external_log_output .setReadOnly (True )
+            self .external_log_output .setLineWrapMode (QPlainTextEdit .NoWrap )
+            self .external_log_output .setMaximumBlockCount (EXTERNAL_LOG_MAX_BLOCKS )
+            self .external_log_output .hide ()
+            self .log_splitter .addWidget (self .external_log_output )
+        return self .external_log_output 
+
     def update_external_links_setting (self ,checked ):
-        is_only_links_mode =self .radio_only_links and self .radio_only_links .isChecked ()
-        is_only_archives_mode =self .radio_only_archives and self .radio_only_archives .isChecked ()
+        is_only_links_mode =self ._mode_only_links 
+        is_only_archives_mode =self ._mode_only_archives 
 
         if is_only_links_mode or is_only_archives_mode :
             if self .external_log_output :self .external_log_output .hide ()
@@ -2211,45 +2484,80 @@ class DownloaderApp (QWidget ):
 
         self .show_external_links =checked 
         if checked :
-            if self .external_log_output :self .external_log_output .show ()
+            self ._get_external_log_output ().show ()
             if self .log_splitter :self .log_splitter .setSizes ([self .height ()//2 ,self .height ()//2 ])
             if self .main_log_output :self .main_log_output .setMinimumHeight (50 )
             if self .external_log_output :self .external_log_output .setMinimumHeight (50 )
             self .log_signal .emit ("\n"+"="*40 +"\n🔗 External Links Log Enabled\n"+"="*40 )
             if self .external_log_output :
-                self .external_log_output .clear ()
-                self .external_log_output .append ("🔗 External Links Found:")
+                self ._clear_external_log ()
+                self .external_log_output .appendPlainText ("🔗 External Links Found:")
             self ._try_process_next_external_link ()
         else :
             if self .external_log_output :self .external_log_output .hide ()
             if self .log_splitter :self .log_splitter .setSizes ([self .height (),0 ])
             if self .main_log_output :self .main_log_output .setMinimumHeight (0 )
             if self .external_log_output :self .external_log_output .setMinimumHeight (0 )
-            if self .external_log_output :self .external_log_output .clear ()
+            if self .external_log_output :self ._clear_external_log ()
             self .log_signal .emit ("\n"+"="*40 +"\n🔗 External Links Log Disabled\n"+"="*40 )
 
 
+    def _ensure_link_search_widgets (self ):
+        if self .link_search_input is not None :
+            return 
+        self .link_search_input =QLineEdit ()
+        self .link_search_input .setPlaceholderText (self ._tr ("link_search_input_placeholder_text","Search Links..."))
+        self .link_search_input .setToolTip (self ._tr ("link_search_input_tooltip_text","When in 'Only Links' mode..."))
+        self .link_search_input .setVisible (False )
+        self .link_search_button =QPushButton ("🔍")
+        self .link_search_button .setToolTip (self ._tr ("link_search_button_tooltip_text","Filter displayed links"))
+        self .link_search_button .setVisible (False )
+        self .link_search_button .setFixedWidth (30 )
+        self .link_search_button .setStyleSheet ("padding: 4px 4px;")
+        # Right after the "Progress Log" label and its stretch.
+        self .log_title_layout .insertWidget (2 ,self .link_search_input )
+        self .log_title_layout .insertWidget (3 ,self .link_search_button )
+
+        self .export_links_button =QPushButton (self ._tr ("export_links_button_text","Export Links"))
+        self .export_links_button .setFixedWidth (100 )
+        self .export_links_button .setStyleSheet ("padding: 4px 8px; margin-top: 5px;")
+        self .export_links_button .setEnabled (False )
+        self .export_links_button .setVisible (False )
+        self .export_button_layout .insertWidget (1 ,self .export_links_button )
+
+        self .link_search_button .clicked .connect (self ._filter_links_log )
+        self .link_search_input .returnPressed .connect (self ._filter_links_log )
+        self .link_search_input .textChanged .connect (self .link_search_debounce_timer .start )
+        self .export_links_button .clicked .connect (self ._export_links_to_file )
+
+    def _update_filter_mode_flags (self ):
+        self ._mode_only_links =bool (self .radio_only_links and self .radio_only_links .isChecked ())
+        self ._mode_only_archives =bool (self .radio_only_archives and self .radio_only_archives .isChecked ())
+
     def _handle_filter_mode_change (self ,button ,checked ):
         if not button or not checked :
             return 
+        self ._update_filter_mode_flags ()
 
 
         is_only_links =(button ==self .radio_only_links )
-        is_only_audio =(hasattr (self ,'radio_only_audio')and self .radio_only_audio is not None and button ==self .radio_only_audio )
-        is_only_archives =(hasattr (self ,'radio_only_archives')and self .radio_only_archives is not None and button ==self .radio_only_archives )
+        is_only_audio =(self .radio_only_audio is not None and button ==self .radio_only_audio )
+        is_only_archives =(self .radio_only_archives is not None and button ==self .radio_only_archives )
 
         if self .skip_scope_toggle_button :
             self .skip_scope_toggle_button .setVisible (not (is_only_links or is_only_archives or is_only_audio ))
-        if hasattr (self ,'multipart_toggle_button')and self .multipart_toggle_button :
+        if self .multipart_toggle_button is not None :
             self .multipart_toggle_button .setVisible (not (is_only_links or is_only_archives or is_only_audio ))
 
+        if is_only_links :
+            self ._ensure_link_search_widgets ()
         if self .link_search_input :self .link_search_input .setVisible (is_only_links )
         if self .link_search_button :self .link_search_button .setVisible (is_only_links )
         if self .export_links_button :
             self .export_links_button .setVisible (is_only_links )
             self .export_links_button .setEnabled (is_only_links and bool (self .extracted_links_cache ))
 
-        if hasattr (self ,'download_extracted_links_button')and self .download_extracted_links_button :
+        if self .download_extracted_links_button is not None :
             self .download_extracted_links_button .setVisible (is_only_links )
             self ._update_download_extracted_links_button_state ()
 
@@ -2267,7 +2575,7 @@ class DownloaderApp (QWidget ):
         if self .use_subfolders_checkbox :self .use_subfolders_checkbox .setEnabled (file_download_mode_active )
         if self .skip_words_input :self .skip_words_input .setEnabled (file_download_mode_active )
         if self .skip_scope_toggle_button :self .skip_scope_toggle_button .setEnabled (file_download_mode_active )
-        if hasattr (self ,'remove_from_filename_input'):self .remove_from_filename_input .setEnabled (file_download_mode_active )
+        if self .remove_from_filename_input is not None :self .remove_from_filename_input .setEnabled (file_download_mode_active )
 
         if self .skip_zip_checkbox :
             can_skip_zip =file_download_mode_active and not is_only_archives 
@@ -2304,7 +2612,7 @@ class DownloaderApp (QWidget ):
 
             if self .main_log_output and do_clear_log_in_filter_change :
                 self .log_signal .emit ("INTERNAL: _handle_filter_mode_change - About to clear log.")
-                self .main_log_output .clear ()
+                self ._clear_main_log ()
                 self .log_signal .emit ("INTERNAL: _handle_filter_mode_change - Log cleared by _handle_filter_mode_change.")
 
             if self .main_log_output :self .main_log_output .setMinimumHeight (0 )
@@ -2314,13 +2622,13 @@ class DownloaderApp (QWidget ):
             self .progress_log_label .setText ("📜 Progress Log (Archives Only):")
             if self .external_log_output :self .external_log_output .hide ()
             if self .log_splitter :self .log_splitter .setSizes ([self .height (),0 ])
-            if self .main_log_output :self .main_log_output .clear ()
+            if self .main_log_output :self ._clear_main_log ()
             self .log_signal .emit ("="*20 +" Mode changed to: Only Archives "+"="*20 )
         elif is_only_audio :
             self .progress_log_label .setText (self ._tr ("progress_log_label_text","📜 Progress Log:")+f" ({self ._tr ('filter_audio_radio','🎧 Only Audio')})")
             if self .external_log_output :self .external_log_output .hide ()
             if self .log_splitter :self .log_splitter .setSizes ([self .height (),0 ])
-            if self .main_log_output :self .main_log_output .clear ()
+            if self .main_log_output :self ._clear_main_log ()
             self .log_signal .emit ("="*20 +f" Mode changed to: {self ._tr ('filter_audio_radio','🎧 Only Audio')} "+"="*20 )
         else :
             self .progress_log_label .setText (self ._tr ("progress_log_label_text","📜 Progress Log:"))
@@ -2353,13 +2661,17 @@ class DownloaderApp (QWidget ):
         if self .char_filter_scope_toggle_button :
             self .char_filter_scope_toggle_button .setEnabled (enable_character_filter_related_widgets )
 
-        self .update_ui_for_subfolders (subfolders_on )
-        self .update_custom_folder_visibility ()
-        self .update_ui_for_manga_mode (self .manga_mode_checkbox .isChecked ()if self .manga_mode_checkbox else False )
+        # update_ui_for_subfolders (and the custom folder check it runs) only reads the
+        # links/archives/audio distinction, so All/Images/Videos switches can skip it.
+        subfolder_ui_state =(is_only_links ,is_only_archives ,is_only_audio ,subfolders_on ,self .link_input .text ())
+        if subfolder_ui_state !=self ._last_subfolder_ui_state :
+            self ._last_subfolder_ui_state =subfolder_ui_state 
+            self .update_ui_for_subfolders (subfolders_on )
+        self .update_ui_for_manga_mode (manga_on )
 
 
     def _filter_links_log (self ):
-        if not (self .radio_only_links and self .radio_only_links .isChecked ()):return 
+        if not self ._mode_only_links :return 
 
         search_term =self .link_search_input .text ().lower ().strip ()if self .link_search_input else ""
 
@@ -2372,7 +2684,7 @@ class DownloaderApp (QWidget ):
 
 
             self .log_signal .emit ("INTERNAL: _filter_links_log - In Progress View. Clearing for placeholder.")
-            if self .main_log_output :self .main_log_output .clear ()
+            if self .main_log_output :self ._clear_main_log ()
             self .log_signal .emit ("INTERNAL: _filter_links_log - Cleared for progress placeholder.")
             self .log_signal .emit ("ℹ️ Switched to Mega download progress view. Extracted links are hidden.\n"
             "   Perform a Mega download to see its progress here, or switch back to 🔗 view.")
@@ -2381,12 +2693,14 @@ class DownloaderApp (QWidget ):
         else :
 
             self .log_signal .emit ("INTERNAL: _filter_links_log - In links view branch. About to clear.")
-            if self .main_log_output :self .main_log_output .clear ()
+            if self .main_log_output :self ._clear_main_log ()
             self .log_signal .emit ("INTERNAL: _filter_links_log - Cleared for links view.")
 
             current_title_for_display =None 
             any_links_displayed_this_call =False 
-            separator_html ="<br>"+"-"*45 +"<br>"
+            # The filtered view is built as one HTML string and queued as a single fragment,
+            # instead of one insertHtml()/append() per title and link.
+            html_parts =[]
 
             for post_title ,link_text ,link_url ,platform ,decryption_key in self .extracted_links_cache :
                 matches_search =(not search_term or 
@@ -2400,10 +2714,9 @@ class DownloaderApp (QWidget ):
                 any_links_displayed_this_call =True 
                 if post_title !=current_title_for_display :
                     if current_title_for_display is not None :
-                        if self .main_log_output :self .main_log_output .insertHtml (separator_html )
+                        html_parts .append (_LINK_GROUP_SEPARATOR_HTML )
 
-                    title_html =f'<b style="color: #87CEEB;">{html .escape (post_title )}</b><br>'
-                    if self .main_log_output :self .main_log_output .insertHtml (title_html )
+                    html_parts .append (_LINK_TITLE_HTML .format (html .escape (post_title )))
                     current_title_for_display =post_title 
 
                 max_link_text_len =50 
@@ -2412,11 +2725,11 @@ class DownloaderApp (QWidget ):
                 plain_link_info_line =f"{display_text } - {link_url } - {platform }"
                 if decryption_key :
                     plain_link_info_line +=f" (Decryption Key: {decryption_key })"
-                if self .main_log_output :
-                    self .main_log_output .append (plain_link_info_line )
+                html_parts .append (html .escape (plain_link_info_line )+"<br>")
 
             if any_links_displayed_this_call :
-                if self .main_log_output :self .main_log_output .append ("")
+                # Queued through the log buffer so it lands after the lines emitted above.
+                self .log_html_signal .emit ("".join (html_parts ))
             elif not search_term and self .main_log_output :
                  self .log_signal .emit ("   (No links extracted yet or all filtered out in links view)")
 
@@ -2425,7 +2738,7 @@ class DownloaderApp (QWidget ):
 
 
     def _export_links_to_file (self ):
-        if not (self .radio_only_links and self .radio_only_links .isChecked ()):
+        if not self ._mode_only_links :
             QMessageBox .information (self ,"Export Links","Link export is only available in 'Only Links' mode.")
             return 
         if not self .extracted_links_cache :
@@ -2437,19 +2750,20 @@ class DownloaderApp (QWidget ):
 
         if filepath :
             try :
+                export_parts =[]
+                current_title_for_export =None 
+                for post_title ,link_text ,link_url ,platform ,decryption_key in self .extracted_links_cache :
+                    if post_title !=current_title_for_export :
+                        if current_title_for_export is not None :
+                            export_parts .append ("\n"+_LINK_EXPORT_SEPARATOR +"\n")
+                        export_parts .append (f"Post Title: {post_title }\n\n")
+                        current_title_for_export =post_title 
+                    line_to_write =f"  {link_text } - {link_url } - {platform }"
+                    if decryption_key :
+                        line_to_write +=f" (Decryption Key: {decryption_key })"
+                    export_parts .append (line_to_write +"\n")
                 with open (filepath ,'w',encoding ='utf-8')as f :
-                    current_title_for_export =None 
-                    separator ="-"*60 +"\n"
-                    for post_title ,link_text ,link_url ,platform ,decryption_key in self .extracted_links_cache :
-                        if post_title !=current_title_for_export :
-                            if current_title_for_export is not None :
-                                f .write ("\n"+separator +"\n")
-                            f .write (f"Post Title: {post_title }\n\n")
-                            current_title_for_export =post_title 
-                        line_to_write =f"  {link_text } - {link_url } - {platform }"
-                        if decryption_key :
-                            line_to_write +=f" (Decryption Key: {decryption_key })"
-                        f .write (line_to_write +"\n")
+                    f .write ("".join (export_parts ))
                 self .log_signal .emit (f"✅ Links successfully exported to: {filepath }")
                 QMessageBox .information (self ,"Export Successful",f"Links exported to:\n{filepath }")
             except Exception as e :
@@ -2458,15 +2772,15 @@ class DownloaderApp (QWidget ):
 
 
     def get_filter_mode (self ):
-        if self .radio_only_links and self .radio_only_links .isChecked ():
+        if self ._mode_only_links :
             return 'all'
         elif self .radio_images .isChecked ():
             return 'image'
         elif self .radio_videos .isChecked ():
             return 'video'
-        elif self .radio_only_archives and self .radio_only_archives .isChecked ():
+        elif self ._mode_only_archives :
             return 'archive'
-        elif hasattr (self ,'radio_only_audio')and self .radio_only_audio .isChecked ():
+        elif self .radio_only_audio is not None and self .radio_only_audio .isChecked ():
             return 'audio'
         elif self .radio_all .isChecked ():
             return 'all'
@@ -2479,29 +2793,13 @@ class DownloaderApp (QWidget ):
 
     def _update_skip_scope_button_text (self ):
         if self .skip_scope_toggle_button :
-            if self .skip_words_scope ==SKIP_SCOPE_FILES :
-                self .skip_scope_toggle_button .setText (self ._tr ("skip_scope_files_text","Scope: Files"))
-                self .skip_scope_toggle_button .setToolTip (self ._tr ("skip_scope_files_tooltip","Tooltip for skip scope files"))
-            elif self .skip_words_scope ==SKIP_SCOPE_POSTS :
-                self .skip_scope_toggle_button .setText (self ._tr ("skip_scope_posts_text","Scope: Posts"))
-                self .skip_scope_toggle_button .setToolTip (self ._tr ("skip_scope_posts_tooltip","Tooltip for skip scope posts"))
-            elif self .skip_words_scope ==SKIP_SCOPE_BOTH :
-                self .skip_scope_toggle_button .setText (self ._tr ("skip_scope_both_text","Scope: Both"))
-                self .skip_scope_toggle_button .setToolTip (self ._tr ("skip_scope_both_tooltip","Tooltip for skip scope both"))
-            else :
-                self .skip_scope_toggle_button .setText (self ._tr ("skip_scope_unknown_text","Scope: Unknown"))
-                self .skip_scope_toggle_button .setToolTip (self ._tr ("skip_scope_unknown_tooltip","Tooltip for skip scope unknown"))
+            text_key ,text ,tooltip_key ,tooltip =_SKIP_SCOPE_BUTTON_TEXTS .get (self .skip_words_scope ,_SKIP_SCOPE_UNKNOWN_TEXTS )
+            self .skip_scope_toggle_button .setText (self ._tr (text_key ,text ))
+            self .skip_scope_toggle_button .setToolTip (self ._tr (tooltip_key ,tooltip ))
 
 
     def _cycle_skip_scope (self ):
-        if self .skip_words_scope ==SKIP_SCOPE_POSTS :
-            self .skip_words_scope =SKIP_SCOPE_FILES 
-        elif self .skip_words_scope ==SKIP_SCOPE_FILES :
-            self .skip_words_scope =SKIP_SCOPE_BOTH 
-        elif self .skip_words_scope ==SKIP_SCOPE_BOTH :
-            self .skip_words_scope =SKIP_SCOPE_POSTS 
-        else :
-            self .skip_words_scope =SKIP_SCOPE_POSTS 
+        self .skip_words_scope =_SKIP_SCOPE_NEXT .get (self .skip_words_scope ,SKIP_SCOPE_POSTS )
 
         self ._update_skip_scope_button_text ()
         self .settings .setValue (SKIP_WORDS_SCOPE_KEY ,self .skip_words_scope )
@@ -2512,33 +2810,12 @@ class DownloaderApp (QWidget ):
 
     def _update_char_filter_scope_button_text (self ):
         if self .char_filter_scope_toggle_button :
-            if self .char_filter_scope ==CHAR_SCOPE_FILES :
-                self .char_filter_scope_toggle_button .setText (self ._tr ("char_filter_scope_files_text","Filter: Files"))
-                self .char_filter_scope_toggle_button .setToolTip (self ._tr ("char_filter_scope_files_tooltip","Tooltip for char filter files"))
-            elif self .char_filter_scope ==CHAR_SCOPE_TITLE :
-                self .char_filter_scope_toggle_button .setText (self ._tr ("char_filter_scope_title_text","Filter: Title"))
-                self .char_filter_scope_toggle_button .setToolTip (self ._tr ("char_filter_scope_title_tooltip","Tooltip for char filter title"))
-            elif self .char_filter_scope ==CHAR_SCOPE_BOTH :
-                self .char_filter_scope_toggle_button .setText (self ._tr ("char_filter_scope_both_text","Filter: Both"))
-                self .char_filter_scope_toggle_button .setToolTip (self ._tr ("char_filter_scope_both_tooltip","Tooltip for char filter both"))
-            elif self .char_filter_scope ==CHAR_SCOPE_COMMENTS :
-                self .char_filter_scope_toggle_button .setText (self ._tr ("char_filter_scope_comments_text","Filter: Comments (Beta)"))
-                self .char_filter_scope_toggle_button .setToolTip (self ._tr ("char_filter_scope_comments_tooltip","Tooltip for char filter comments"))
-            else :
-                self .char_filter_scope_toggle_button .setText (self ._tr ("char_filter_scope_unknown_text","Filter: Unknown"))
-                self .char_filter_scope_toggle_button .setToolTip (self ._tr ("char_filter_scope_unknown_tooltip","Tooltip for char filter unknown"))
+            text_key ,text ,tooltip_key ,tooltip =_CHAR_SCOPE_BUTTON_TEXTS .get (self .char_filter_scope ,_CHAR_SCOPE_UNKNOWN_TEXTS )
+            self .char_filter_scope_toggle_button .setText (self ._tr (text_key ,text ))
+            self .char_filter_scope_toggle_button .setToolTip (self ._tr (tooltip_key ,tooltip ))
 
     def _cycle_char_filter_scope (self ):
-        if self .char_filter_scope ==CHAR_SCOPE_TITLE :
-            self .char_filter_scope =CHAR_SCOPE_FILES 
-        elif self .char_filter_scope ==CHAR_SCOPE_FILES :
-            self .char_filter_scope =CHAR_SCOPE_BOTH 
-        elif self .char_filter_scope ==CHAR_SCOPE_BOTH :
-            self .char_filter_scope =CHAR_SCOPE_COMMENTS 
-        elif self .char_filter_scope ==CHAR_SCOPE_COMMENTS :
-            self .char_filter_scope =CHAR_SCOPE_TITLE 
-        else :
-            self .char_filter_scope =CHAR_SCOPE_TITLE 
+        self .char_filter_scope =_CHAR_SCOPE_NEXT .get (self .char_filter_scope ,CHAR_SCOPE_TITLE )
 
         self ._update_char_filter_scope_button_text ()
         self .settings .setValue (CHAR_FILTER_SCOPE_KEY ,self .char_filter_scope )
@@ -2550,12 +2827,14 @@ class DownloaderApp (QWidget ):
         successfully_added_any =False 
 
         if not name_from_ui_input :
-            QMessageBox .warning (self ,"Input Error","Name cannot be empty.")
+            self ._show_name_input_warning ("Input Error","Name cannot be empty.")
             return 
 
-        if name_from_ui_input .startswith ("(")and name_from_ui_input .endswith (")~"):
-            content =name_from_ui_input [1 :-2 ].strip ()
-            aliases =[alias .strip ()for alias in content .split (',')if alias .strip ()]
+        group_match =_CHARACTER_FILTER_GROUP_RE .match (name_from_ui_input )
+        group_parts =[part for part in map (str .strip ,group_match .group (1 ).split (','))if part ]if group_match else None 
+
+        if group_match and group_match .group (2 ):
+            aliases =group_parts 
             if aliases :
                 folder_name =" ".join (aliases )
                 if self .add_new_character (name_to_add =folder_name ,
@@ -2564,11 +2843,10 @@ class DownloaderApp (QWidget ):
                 suppress_similarity_prompt =False ):
                     successfully_added_any =True 
             else :
-                QMessageBox .warning (self ,"Input Error","Empty group content for `~` format.")
+                self ._show_name_input_warning ("Input Error","Empty group content for `~` format.")
 
-        elif name_from_ui_input .startswith ("(")and name_from_ui_input .endswith (")"):
-            content =name_from_ui_input [1 :-1 ].strip ()
-            names_to_add_separately =[name .strip ()for name in content .split (',')if name .strip ()]
+        elif group_match :
+            names_to_add_separately =group_parts 
             if names_to_add_separately :
                 for name_item in names_to_add_separately :
                     if self .add_new_character (name_to_add =name_item ,
@@ -2577,7 +2855,7 @@ class DownloaderApp (QWidget ):
                     suppress_similarity_prompt =False ):
                         successfully_added_any =True 
             else :
-                QMessageBox .warning (self ,"Input Error","Empty group content for standard group format.")
+                self ._show_name_input_warning ("Input Error","Empty group content for standard group format.")
         else :
             if self .add_new_character (name_to_add =name_from_ui_input ,
             is_group_to_add =False ,
@@ -2590,68 +2868,80 @@ class DownloaderApp (QWidget ):
             self .save_known_names ()
 
 
-    def add_new_character (self ,name_to_add ,is_group_to_add ,aliases_to_add ,suppress_similarity_prompt =False ):
+    def _show_name_input_warning (self ,title ,text ):
+        """Shows a Known Names validation warning, reusing one message box for all of them."""
+        if self ._name_input_warning_box is None :
+            self ._name_input_warning_box =QMessageBox (self )
+            self ._name_input_warning_box .setIcon (QMessageBox .Warning )
+            self ._name_input_warning_box .setStandardButtons (QMessageBox .Ok )
+        self ._name_input_warning_box .setWindowTitle (title )
+        self ._name_input_warning_box .setText (text )
+        self ._name_input_warning_box .exec_ ()
+
+    def add_new_character (self ,name_to_add ,is_group_to_add ,aliases_to_add ,suppress_similarity_prompt =False ,refresh_list =True ):
         global KNOWN_NAMES ,clean_folder_name 
         if not name_to_add :
-            QMessageBox .warning (self ,"Input Error","Name cannot be empty.");return False 
+            self ._show_name_input_warning ("Input Error","Name cannot be empty.");return False 
 
         name_to_add_lower =name_to_add .lower ()
-        for kn_entry in KNOWN_NAMES :
-            if kn_entry ["name"].lower ()==name_to_add_lower :
-                QMessageBox .warning (self ,"Duplicate Name",f"The primary folder name '{name_to_add }' already exists.");return False 
-            if not is_group_to_add and name_to_add_lower in [a .lower ()for a in kn_entry ["aliases"]]:
-                QMessageBox .warning (self ,"Duplicate Alias",f"The name '{name_to_add }' already exists as an alias for '{kn_entry ['name']}'.");return False 
-
-        similar_names_details =[]
-        for kn_entry in KNOWN_NAMES :
-            for term_to_check_similarity_against in kn_entry ["aliases"]:
-                term_lower =term_to_check_similarity_against .lower ()
-                if name_to_add_lower !=term_lower and (name_to_add_lower in term_lower or term_lower in name_to_add_lower ):
-                    similar_names_details .append ((name_to_add ,kn_entry ["name"]))
-                    break 
-            for new_alias in aliases_to_add :
-                if new_alias .lower ()!=term_to_check_similarity_against .lower ()and (new_alias .lower ()in term_to_check_similarity_against .lower ()or term_to_check_similarity_against .lower ()in new_alias .lower ()):
-                    similar_names_details .append ((new_alias ,kn_entry ["name"]))
-                    break 
+        if name_to_add_lower in self ._known_primary_lower :
+            self ._show_name_input_warning ("Duplicate Name",f"The primary folder name '{name_to_add }' already exists.");return False 
+        if not is_group_to_add and name_to_add_lower in self ._known_alias_to_primary :
+            self ._show_name_input_warning ("Duplicate Alias",f"The name '{name_to_add }' already exists as an alias for '{self ._known_alias_to_primary [name_to_add_lower ]}'.");return False 
 
-        if similar_names_details and not suppress_similarity_prompt :
-            if similar_names_details :
-                first_similar_new ,first_similar_existing =similar_names_details [0 ]
-                shorter ,longer =sorted ([first_similar_new ,first_similar_existing ],key =len )
-
-                msg_box =QMessageBox (self )
-                msg_box .setIcon (QMessageBox .Warning )
-                msg_box .setWindowTitle ("Potential Name Conflict")
-                msg_box .setText (
-                f"The name '{first_similar_new }' is very similar to an existing name: '{first_similar_existing }'.\n\n"
-                f"This could lead to unexpected folder grouping (e.g., under '{clean_folder_name (shorter )}' instead of a more specific '{clean_folder_name (longer )}' or vice-versa).\n\n"
-                "Do you want to change the name you are adding, or proceed anyway?"
-                )
-                change_button =msg_box .addButton ("Change Name",QMessageBox .RejectRole )
-                proceed_button =msg_box .addButton ("Proceed Anyway",QMessageBox .AcceptRole )
-                msg_box .setDefaultButton (proceed_button )
-                msg_box .setEscapeButton (change_button )
-                msg_box .exec_ ()
-
-                if msg_box .clickedButton ()==change_button :
-                    self .log_signal .emit (f"ℹ️ User chose to change '{first_similar_new }' due to similarity with an alias of '{first_similar_existing }'.")
-                    return False 
-                self .log_signal .emit (f"⚠️ User proceeded with adding '{first_similar_new }' despite similarity with an alias of '{first_similar_existing }'.")
+        similar_name_match =None if suppress_similarity_prompt else self ._find_similar_known_name ([name_to_add ]+list (aliases_to_add ))
+
+        if similar_name_match :
+            first_similar_new ,first_similar_existing =similar_name_match 
+            shorter ,longer =sorted ([first_similar_new ,first_similar_existing ],key =len )
+
+            msg_box =QMessageBox (self )
+            msg_box .setIcon (QMessageBox .Warning )
+            msg_box .setWindowTitle ("Potential Name Conflict")
+            msg_box .setText (
+            f"The name '{first_similar_new }' is very similar to an existing name: '{first_similar_existing }'.\n\n"
+            f"This could lead to unexpected folder grouping (e.g., under '{clean_folder_name (shorter )}' instead of a more specific '{clean_folder_name (longer )}' or vice-versa).\n\n"
+            "Do you want to change the name you are adding, or proceed anyway?"
+            )
+            change_button =msg_box .addButton ("Change Name",QMessageBox .RejectRole )
+            proceed_button =msg_box .addButton ("Proceed Anyway",QMessageBox .AcceptRole )
+            msg_box .setDefaultButton (proceed_button )
+            msg_box .setEscapeButton (change_button )
+            msg_box .exec_ ()
+
+            if msg_box .clickedButton ()==change_button :
+                self .log_signal .emit (f"ℹ️ User chose to change '{first_similar_new }' due to similarity with an alias of '{first_similar_existing }'.")
+                return False 
+            self .log_signal .emit (f"⚠️ User proceeded with adding '{first_similar_new }' despite similarity with an alias of '{first_similar_existing }'.")
+        if len (aliases_to_add )<=1 :
+            new_aliases =list (aliases_to_add )
+        else :
+            new_aliases =list (dict .fromkeys (aliases_to_add ))
+            new_aliases .sort (key =str .lower )
         new_entry ={
         "name":name_to_add ,
         "is_group":is_group_to_add ,
-        "aliases":sorted (list (set (aliases_to_add )),key =str .lower )
+        "aliases":new_aliases 
         }
         if is_group_to_add :
             for new_alias in new_entry ["aliases"]:
-                if any (new_alias .lower ()==kn_entry ["name"].lower ()for kn_entry in KNOWN_NAMES if kn_entry ["name"].lower ()!=name_to_add_lower ):
-                    QMessageBox .warning (self ,"Alias Conflict",f"Alias '{new_alias }' (for group '{name_to_add }') conflicts with an existing primary name.");return False 
-        KNOWN_NAMES .append (new_entry )
-        KNOWN_NAMES .sort (key =lambda x :x ["name"].lower ())
-
-        self .character_list .clear ()
-        self .character_list .addItems ([entry ["name"]for entry in KNOWN_NAMES ])
-        self .filter_character_list (self .character_search_input .text ())
+                new_alias_lower =new_alias .lower ()
+                if new_alias_lower !=name_to_add_lower and new_alias_lower in self ._known_primary_lower :
+                    self ._show_name_input_warning ("Alias Conflict",f"Alias '{new_alias }' (for group '{name_to_add }') conflicts with an existing primary name.");return False 
+        # Insert at the sorted position (after equal keys, as a stable sort would) instead of
+        # re-sorting KNOWN_NAMES and rebuilding the whole list widget.
+        insert_index =bisect .bisect_right (self ._known_sorted_keys ,name_to_add_lower )
+        KNOWN_NAMES .insert (insert_index ,new_entry )
+        self ._index_known_name_entry (insert_index ,new_entry )
+
+        if refresh_list :
+            self .character_list .insertItem (insert_index ,name_to_add )
+            self ._character_list_lower .insert (insert_index ,name_to_add_lower )
+            # Row numbers after the insert point shifted.
+            self ._character_char_index =None 
+            self ._character_rows_shown =None 
+            search_text_lower =self .character_search_input .text ().lower ()
+            self .character_list .item (insert_index ).setHidden (search_text_lower not in name_to_add_lower )
 
         log_msg_suffix =f" (as group with aliases: {', '.join (new_entry ['aliases'])})"if is_group_to_add and len (new_entry ['aliases'])>1 else ""
         self .log_signal .emit (f"✅ Added '{name_to_add }' to known names list{log_msg_suffix }.")
@@ -2659,6 +2949,80 @@ class DownloaderApp (QWidget ):
         return True 
 
 
+    def _rebuild_known_name_index (self ):
+        """Recomputes the lowercase lookups over KNOWN_NAMES used when adding names."""
+        self ._known_alias_index =[]
+        self ._known_sorted_keys =[]
+        self ._known_primary_lower =set ()
+        self ._known_alias_to_primary ={}
+        for index ,entry in enumerate (KNOWN_NAMES ):
+            self ._index_known_name_entry (index ,entry )
+
+    def _index_known_name_entry (self ,index ,entry ):
+        """Adds the KNOWN_NAMES entry now at `index` to the lowercase lookups."""
+        entry_name =entry ["name"]
+        aliases_lower =tuple (alias .lower ()for alias in entry ["aliases"])
+        self ._known_alias_index .insert (index ,(entry_name ,aliases_lower ))
+        self ._known_sorted_keys .insert (index ,entry_name .lower ())
+        self ._known_primary_lower .add (entry_name .lower ())
+        for alias_lower in aliases_lower :
+            self ._known_alias_to_primary .setdefault (alias_lower ,entry_name )
+
+    def _unindex_known_name_entry (self ,index ):
+        """Removes the KNOWN_NAMES entry that was at `index` from the lowercase lookups."""
+        entry_name ,aliases_lower =self ._known_alias_index .pop (index )
+        del self ._known_sorted_keys [index ]
+        entry_name_lower =entry_name .lower ()
+        # Another entry may share the lowercase primary name; only drop it when none is left.
+        if not any (other_name .lower ()==entry_name_lower for other_name ,_ in self ._known_alias_index ):
+            self ._known_primary_lower .discard (entry_name_lower )
+        for alias_lower in aliases_lower :
+            if self ._known_alias_to_primary .get (alias_lower )==entry_name :
+                del self ._known_alias_to_primary [alias_lower ]
+                # Another entry may share the alias; keep it pointing at the first one left.
+                for other_name ,other_aliases in self ._known_alias_index :
+                    if alias_lower in other_aliases :
+                        self ._known_alias_to_primary [alias_lower ]=other_name 
+                        break 
+
+    def _find_similar_known_name (self ,terms ):
+        """
+        Finds the first known entry with an alias that contains, or is contained in,
+        one of `terms` (case-insensitive, exact matches excluded).
+
+        Returns:
+            tuple or None: (matching term, existing primary name), or None if nothing is similar.
+        """
+        terms_lower =[(term ,term .lower ())for term in terms ]
+        for entry_name ,aliases_lower in self ._known_alias_index :
+            for term ,term_lower in terms_lower :
+                for alias_lower in aliases_lower :
+                    if term_lower !=alias_lower and (term_lower in alias_lower or alias_lower in term_lower ):
+                        return term ,entry_name 
+        return None 
+
+    def _repopulate_character_list (self ,search_text =""):
+        """
+        Replaces the Known Names list contents with KNOWN_NAMES and applies `search_text`,
+        repainting once.
+        """
+        self .character_list .setUpdatesEnabled (False )
+        self .character_list .blockSignals (True )
+        try :
+            self .character_list .clear ()
+            self .character_list .addItems ([entry ["name"]for entry in KNOWN_NAMES ])
+            self ._character_list_lower =[entry ["name"].lower ()for entry in KNOWN_NAMES ]
+            self ._character_char_index =None 
+            self ._character_rows_shown =set (range (len (self ._character_list_lower )))
+            if search_text :
+                self ._apply_character_filter (search_text )
+        finally :
+            self .character_list .blockSignals (False )
+            self .character_list .setUpdatesEnabled (True )
+
+    def _refresh_character_list (self ):
+        self ._repopulate_character_list (self .character_search_input .text ())
+
     def delete_selected_character (self ):
         global KNOWN_NAMES 
         selected_items =self .character_list .selectedItems ()
@@ -2670,33 +3034,53 @@ class DownloaderApp (QWidget ):
         f"Are you sure you want to delete {len (primary_names_to_remove )} selected entry/entries (and their aliases)?",
         QMessageBox .Yes |QMessageBox .No ,QMessageBox .No )
         if confirm ==QMessageBox .Yes :
-            original_count =len (KNOWN_NAMES )
-            KNOWN_NAMES [:]=[entry for entry in KNOWN_NAMES if entry ["name"]not in primary_names_to_remove ]
-            removed_count =original_count -len (KNOWN_NAMES )
+            indices_to_remove =[i for i ,entry in enumerate (KNOWN_NAMES )if entry ["name"]in primary_names_to_remove ]
+            removed_count =len (indices_to_remove )
 
             if removed_count >0 :
+                # The list rows mirror KNOWN_NAMES, so the same indices are removed from the
+                # entries, their lookups and the widget, back to front so none shift.
+                self .character_list .setUpdatesEnabled (False )
+                try :
+                    for i in reversed (indices_to_remove ):
+                        del KNOWN_NAMES [i ]
+                        self ._unindex_known_name_entry (i )
+                        self .character_list .takeItem (i )
+                        del self ._character_list_lower [i ]
+                finally :
+                    self .character_list .setUpdatesEnabled (True )
+                self ._character_char_index =None 
+                self ._character_rows_shown =None 
                 self .log_signal .emit (f"🗑️ Removed {removed_count } name(s).")
-                self .character_list .clear ()
-                self .character_list .addItems ([entry ["name"]for entry in KNOWN_NAMES ])
-                self .filter_character_list (self .character_search_input .text ())
                 self .save_known_names ()
             else :
                 self .log_signal .emit ("ℹ️ No names were removed (they might not have been in the list).")
 
 
+    def _on_link_input_settled (self ):
+        """Updates the URL-dependent parts of the UI once typing in the URL field pauses."""
+        self .update_custom_folder_visibility ()
+        self .update_ui_for_manga_mode (self .manga_mode_checkbox .isChecked ()if self .manga_mode_checkbox else False )
+
+    def _parse_link_url (self ,url_text ):
+        """extract_post_info() for the URL field, reusing the last result while the text is unchanged."""
+        if url_text !=self ._link_url_parse_cache [0 ]:
+            self ._link_url_parse_cache =(url_text ,extract_post_info (url_text ))
+        return self ._link_url_parse_cache [1 ]
+
     def update_custom_folder_visibility (self ,url_text =None ):
         if url_text is None :
             url_text =self .link_input .text ()
 
-        _ ,_ ,post_id =extract_post_info (url_text .strip ())
+        _ ,_ ,post_id =self ._parse_link_url (url_text .strip ())
 
         is_single_post_url =bool (post_id )
         subfolders_enabled =self .use_subfolders_checkbox .isChecked ()if self .use_subfolders_checkbox else False 
 
         not_only_links_or_archives_mode =not (
-        (self .radio_only_links and self .radio_only_links .isChecked ())or 
-        (self .radio_only_archives and self .radio_only_archives .isChecked ())or 
-        (hasattr (self ,'radio_only_audio')and self .radio_only_audio .isChecked ())
+        self ._mode_only_links or 
+        self ._mode_only_archives or 
+        (self .radio_only_audio is not None and self .radio_only_audio .isChecked ())
         )
 
         should_show_custom_folder =is_single_post_url and subfolders_enabled and not_only_links_or_archives_mode 
@@ -2709,9 +3093,9 @@ class DownloaderApp (QWidget ):
 
 
     def update_ui_for_subfolders (self ,separate_folders_by_name_title_checked :bool ):
-        is_only_links =self .radio_only_links and self .radio_only_links .isChecked ()
-        is_only_archives =self .radio_only_archives and self .radio_only_archives .isChecked ()
-        is_only_audio =hasattr (self ,'radio_only_audio')and self .radio_only_audio .isChecked ()
+        is_only_links =self ._mode_only_links 
+        is_only_archives =self ._mode_only_archives 
+        is_only_audio =self .radio_only_audio is not None and self .radio_only_audio .isChecked ()
 
         can_enable_subfolder_per_post_checkbox =not is_only_links 
 
@@ -2725,38 +3109,36 @@ class DownloaderApp (QWidget ):
 
 
     def _update_cookie_input_visibility (self ,checked ):
-        cookie_text_input_exists =hasattr (self ,'cookie_text_input')
-        cookie_browse_button_exists =hasattr (self ,'cookie_browse_button')
+        cookie_text_input =self .cookie_text_input 
+        cookie_browse_button =getattr (self ,'cookie_browse_button',None )
 
-        if cookie_text_input_exists or cookie_browse_button_exists :
-            is_only_links =self .radio_only_links and self .radio_only_links .isChecked ()
-            if cookie_text_input_exists :self .cookie_text_input .setVisible (checked )
-            if cookie_browse_button_exists :self .cookie_browse_button .setVisible (checked )
+        if cookie_text_input is not None or cookie_browse_button is not None :
+            enable_state_for_fields =checked and not self ._mode_only_links and (self .download_btn .isEnabled ()or self .is_paused )
 
-            can_enable_cookie_text =checked and not is_only_links 
-            enable_state_for_fields =can_enable_cookie_text and (self .download_btn .isEnabled ()or self .is_paused )
-
-            if cookie_text_input_exists :
-                self .cookie_text_input .setEnabled (enable_state_for_fields )
+            if cookie_text_input is not None :
+                cookie_text_input .setVisible (checked )
+                cookie_text_input .setEnabled (enable_state_for_fields )
                 if self .selected_cookie_filepath and checked :
-                    self .cookie_text_input .setText (self .selected_cookie_filepath )
-                    self .cookie_text_input .setReadOnly (True )
-                    self .cookie_text_input .setPlaceholderText ("")
+                    cookie_text_input .setText (self .selected_cookie_filepath )
+                    cookie_text_input .setReadOnly (True )
+                    cookie_text_input .setPlaceholderText ("")
                 elif checked :
-                    self .cookie_text_input .setReadOnly (False )
-                    self .cookie_text_input .setPlaceholderText ("Cookie string (if no cookies.txt)")
+                    cookie_text_input .setReadOnly (False )
+                    cookie_text_input .setPlaceholderText ("Cookie string (if no cookies.txt)")
 
-            if cookie_browse_button_exists :self .cookie_browse_button .setEnabled (enable_state_for_fields )
+            if cookie_browse_button is not None :
+                cookie_browse_button .setVisible (checked )
+                cookie_browse_button .setEnabled (enable_state_for_fields )
 
             if not checked :
                 self .selected_cookie_filepath =None 
 
 
-    def update_page_range_enabled_state (self ):
-        url_text =self .link_input .text ().strip ()if self .link_input else ""
-        _ ,_ ,post_id =extract_post_info (url_text )
-
-        is_creator_feed =not post_id if url_text else False 
+    def update_page_range_enabled_state (self ,is_creator_feed =None ):
+        if is_creator_feed is None :
+            url_text =self .link_input .text ().strip ()if self .link_input else ""
+            _ ,_ ,post_id =self ._parse_link_url (url_text )
+            is_creator_feed =not post_id if url_text else False 
         enable_page_range =is_creator_feed 
 
         for widget in [self .page_range_label ,self .start_page_input ,self .to_label ,self .end_page_input ]:
@@ -2769,49 +3151,14 @@ class DownloaderApp (QWidget ):
 
     def _update_manga_filename_style_button_text (self ):
         if self .manga_rename_toggle_button :
-            if self .manga_filename_style ==STYLE_POST_TITLE :
-                self .manga_rename_toggle_button .setText (self ._tr ("manga_style_post_title_text","Name: Post Title"))
-
-            elif self .manga_filename_style ==STYLE_ORIGINAL_NAME :
-                self .manga_rename_toggle_button .setText (self ._tr ("manga_style_original_file_text","Name: Original File"))
-
-            elif self .manga_filename_style ==STYLE_POST_TITLE_GLOBAL_NUMBERING :
-                self .manga_rename_toggle_button .setText (self ._tr ("manga_style_title_global_num_text","Name: Title+G.Num"))
-
-            elif self .manga_filename_style ==STYLE_DATE_BASED :
-                self .manga_rename_toggle_button .setText (self ._tr ("manga_style_date_based_text","Name: Date Based"))
-            
-            elif self .manga_filename_style ==STYLE_POST_ID: # Add this block
-                self .manga_rename_toggle_button .setText (self ._tr ("manga_style_post_id_text","Name: Post ID"))
-
-            elif self .manga_filename_style ==STYLE_DATE_POST_TITLE :
-                self .manga_rename_toggle_button .setText (self ._tr ("manga_style_date_post_title_text","Name: Date + Title"))
-
-            else :
-                self .manga_rename_toggle_button .setText (self ._tr ("manga_style_unknown_text","Name: Unknown Style"))
-
-
-            self .manga_rename_toggle_button .setToolTip ("Click to cycle Manga Filename Style (when Manga Mode is active for a creator feed).")
-
-
-# In main_window.py
+            text_key ,text =_MANGA_STYLE_BUTTON_TEXTS .get (self .manga_filename_style ,_MANGA_STYLE_UNKNOWN_TEXT )
+            self .manga_rename_toggle_button .setText (self ._tr (text_key ,text ))
+            self .manga_rename_toggle_button .setToolTip (_MANGA_STYLE_BUTTON_TOOLTIP )
 
     def _toggle_manga_filename_style (self ):
         current_style =self .manga_filename_style 
-        new_style =""
-        if current_style ==STYLE_POST_TITLE :
-            new_style =STYLE_ORIGINAL_NAME 
-        elif current_style ==STYLE_ORIGINAL_NAME :
-            new_style =STYLE_DATE_POST_TITLE 
-        elif current_style ==STYLE_DATE_POST_TITLE :
-            new_style =STYLE_POST_TITLE_GLOBAL_NUMBERING 
-        elif current_style ==STYLE_POST_TITLE_GLOBAL_NUMBERING :
-            new_style =STYLE_DATE_BASED 
-        elif current_style ==STYLE_DATE_BASED :
-            new_style =STYLE_POST_ID # Change this line
-        elif current_style ==STYLE_POST_ID: # Add this block
-            new_style =STYLE_POST_TITLE
-        else :
+        new_style =_MANGA_STYLE_NEXT .get (current_style )
+        if new_style is None :
             self .log_signal .emit (f"⚠️ Unknown current manga filename style: {current_style }. Resetting to default ('{STYLE_POST_TITLE }').")
             new_style =STYLE_POST_TITLE 
 
@@ -2843,10 +3190,10 @@ class DownloaderApp (QWidget ):
             if self .manga_mode_checkbox :
                 self .manga_mode_checkbox .setChecked (False )
                 self .manga_mode_checkbox .setEnabled (False )
-            if hasattr (self ,'use_cookie_checkbox'):
+            if self .use_cookie_checkbox is not None :
                 self .use_cookie_checkbox .setChecked (True )
                 self .use_cookie_checkbox .setEnabled (False )
-            if hasattr (self ,'use_cookie_checkbox'):
+            if self .use_cookie_checkbox is not None :
                 self ._update_cookie_input_visibility (True )
             self .update_ui_for_manga_mode (False )
 
@@ -2861,9 +3208,9 @@ class DownloaderApp (QWidget ):
             self .update_custom_folder_visibility ()
             self .update_ui_for_manga_mode (self .manga_mode_checkbox .isChecked ()if self .manga_mode_checkbox else False )
 
-            if hasattr (self ,'use_cookie_checkbox'):
+            if self .use_cookie_checkbox is not None :
                 self .use_cookie_checkbox .setEnabled (True )
-            if hasattr (self ,'use_cookie_checkbox'):
+            if self .use_cookie_checkbox is not None :
                 self ._update_cookie_input_visibility (self .use_cookie_checkbox .isChecked ())
 
             if hasattr (self ,'favorite_mode_artists_button'):
@@ -2872,12 +3219,12 @@ class DownloaderApp (QWidget ):
                 self .favorite_mode_posts_button .setEnabled (False )
 
     def update_ui_for_manga_mode (self ,checked ):
-        is_only_links_mode =self .radio_only_links and self .radio_only_links .isChecked ()
-        is_only_archives_mode =self .radio_only_archives and self .radio_only_archives .isChecked ()
-        is_only_audio_mode =hasattr (self ,'radio_only_audio')and self .radio_only_audio .isChecked ()
+        is_only_links_mode =self ._mode_only_links 
+        is_only_archives_mode =self ._mode_only_archives 
+        is_only_audio_mode =self .radio_only_audio is not None and self .radio_only_audio .isChecked ()
 
         url_text =self .link_input .text ().strip ()if self .link_input else ""
-        _ ,_ ,post_id =extract_post_info (url_text )
+        _ ,_ ,post_id =self ._parse_link_url (url_text )
 
         is_creator_feed =not post_id if url_text else False 
         is_favorite_mode_on =self .favorite_mode_checkbox .isChecked ()if self .favorite_mode_checkbox else False 
@@ -2889,13 +3236,14 @@ class DownloaderApp (QWidget ):
                 checked =self .manga_mode_checkbox .isChecked ()
 
         manga_mode_effectively_on =is_creator_feed and checked 
+        # Links, archives and audio modes hide every manga and multipart control.
+        file_options_restricted =is_only_links_mode or is_only_archives_mode or is_only_audio_mode 
+        manga_controls_shown =manga_mode_effectively_on and not file_options_restricted 
 
         if self .manga_rename_toggle_button :
-            self .manga_rename_toggle_button .setVisible (manga_mode_effectively_on and not (is_only_links_mode or is_only_archives_mode or is_only_audio_mode ))
+            self .manga_rename_toggle_button .setVisible (manga_controls_shown )
 
-        self .update_page_range_enabled_state ()
-
-        current_filename_style =self .manga_filename_style 
+        self .update_page_range_enabled_state (is_creator_feed )
 
         enable_char_filter_widgets =not is_only_links_mode and not is_only_archives_mode 
 
@@ -2907,12 +3255,7 @@ class DownloaderApp (QWidget ):
         if self .character_filter_widget :
             self .character_filter_widget .setVisible (enable_char_filter_widgets )
 
-        show_date_prefix_input =(
-        manga_mode_effectively_on and 
-        (current_filename_style ==STYLE_DATE_BASED or 
-        current_filename_style ==STYLE_ORIGINAL_NAME )and 
-        not (is_only_links_mode or is_only_archives_mode or is_only_audio_mode )
-        )
+        show_date_prefix_input =manga_controls_shown and self .manga_filename_style in _MANGA_DATE_PREFIX_STYLES 
         if hasattr (self ,'manga_date_prefix_input'):
             self .manga_date_prefix_input .setVisible (show_date_prefix_input )
             if show_date_prefix_input :
@@ -2923,20 +3266,51 @@ class DownloaderApp (QWidget ):
                 self .manga_date_prefix_input .setMaximumWidth (16777215 )
                 self .manga_date_prefix_input .setMinimumWidth (0 )
 
-        if hasattr (self ,'multipart_toggle_button'):
-
-            hide_multipart_button_due_mode =is_only_links_mode or is_only_archives_mode or is_only_audio_mode 
-            hide_multipart_button_due_manga_mode =manga_mode_effectively_on 
-            self .multipart_toggle_button .setVisible (not (hide_multipart_button_due_mode or hide_multipart_button_due_manga_mode ))
+        if self .multipart_toggle_button is not None :
+            self .multipart_toggle_button .setVisible (not (file_options_restricted or manga_mode_effectively_on ))
 
         self ._update_multithreading_for_date_mode ()
 
 
+    def _on_character_search_settled (self ):
+        self .filter_character_list (self .character_search_input .text ())
+
+    def _get_character_char_index (self ):
+        """Returns a dict of character -> rows whose lowercased name contains it, building it if needed."""
+        if self ._character_char_index is None :
+            char_index ={}
+            for i ,name_lower in enumerate (self ._character_list_lower ):
+                for ch in set (name_lower ):
+                    char_index .setdefault (ch ,[]).append (i )
+            self ._character_char_index =char_index 
+        return self ._character_char_index 
+
     def filter_character_list (self ,search_text ):
+        self .character_list .setUpdatesEnabled (False )
+        try :
+            self ._apply_character_filter (search_text )
+        finally :
+            self .character_list .setUpdatesEnabled (True )
+
+    def _apply_character_filter (self ,search_text ):
+        """Shows only the rows matching `search_text`; callers batch the repaint."""
         search_text_lower =search_text .lower ()
-        for i in range (self .character_list .count ()):
-            item =self .character_list .item (i )
-            item .setHidden (search_text_lower not in item .text ().lower ())
+        if search_text_lower :
+            # Only rows containing the search text's rarest character can match.
+            char_index =self ._get_character_char_index ()
+            candidate_rows =min ((char_index .get (ch ,())for ch in set (search_text_lower )),key =len )
+            rows_to_show ={i for i in candidate_rows if search_text_lower in self ._character_list_lower [i ]}
+        else :
+            rows_to_show =set (range (len (self ._character_list_lower )))
+
+        # Only rows whose visibility changes since the last filter need a setHidden() call.
+        if self ._character_rows_shown is None :
+            rows_to_update =range (len (self ._character_list_lower ))
+        else :
+            rows_to_update =rows_to_show ^self ._character_rows_shown 
+        for i in rows_to_update :
+            self .character_list .item (i ).setHidden (i not in rows_to_show )
+        self ._character_rows_shown =rows_to_show 
 
 
     def update_multithreading_label (self ,text ):
@@ -3007,6 +3381,11 @@ class DownloaderApp (QWidget ):
             QMessageBox.warning(self, "Busy", "A download is already in progress.")
             return False 
 
+        if self .link_input_debounce_timer .isActive ():
+            # A URL edit is still waiting on its debounce; apply it before reading the UI state.
+            self .link_input_debounce_timer .stop ()
+            self ._on_link_input_settled ()
+
 
 
         if not direct_api_url and self .favorite_download_queue and not self .is_processing_favorites_queue :
@@ -3098,13 +3477,13 @@ class DownloaderApp (QWidget ):
         raw_skip_words =self .skip_words_input .text ().strip ()
         skip_words_list =[word .strip ().lower ()for word in raw_skip_words .split (',')if word .strip ()]
 
-        raw_remove_filename_words =self .remove_from_filename_input .text ().strip ()if hasattr (self ,'remove_from_filename_input')else ""
+        raw_remove_filename_words =self .remove_from_filename_input .text ().strip ()if self .remove_from_filename_input is not None else ""
         allow_multipart =self .allow_multipart_download_setting 
         remove_from_filename_words_list =[word .strip ()for word in raw_remove_filename_words .split (',')if word .strip ()]
         scan_content_for_images =self .scan_content_images_checkbox .isChecked ()if hasattr (self ,'scan_content_images_checkbox')else False 
-        use_cookie_from_checkbox =self .use_cookie_checkbox .isChecked ()if hasattr (self ,'use_cookie_checkbox')else False 
+        use_cookie_from_checkbox =self .use_cookie_checkbox .isChecked ()if self .use_cookie_checkbox is not None else False 
         app_base_dir_for_cookies =os .path .dirname (self .config_file )
-        cookie_text_from_input =self .cookie_text_input .text ().strip ()if hasattr (self ,'cookie_text_input')and use_cookie_from_checkbox else ""
+        cookie_text_from_input =self .cookie_text_input .text ().strip ()if self .cookie_text_input is not None and use_cookie_from_checkbox else ""
 
         use_cookie_for_this_run =use_cookie_from_checkbox 
         selected_cookie_file_path_for_backend =self .selected_cookie_filepath if use_cookie_from_checkbox and self .selected_cookie_filepath else None 
@@ -3134,7 +3513,7 @@ class DownloaderApp (QWidget ):
         current_skip_words_scope =self .get_skip_words_scope ()
         manga_mode_is_checked =self .manga_mode_checkbox .isChecked ()if self .manga_mode_checkbox else False 
 
-        extract_links_only =(self .radio_only_links and self .radio_only_links .isChecked ())
+        extract_links_only =self ._mode_only_links 
         backend_filter_mode =self .get_filter_mode ()
         checked_radio_button =self .radio_group .checkedButton ()
         user_selected_filter_text =checked_radio_button .text ()if checked_radio_button else "All"
@@ -3272,13 +3651,13 @@ class DownloaderApp (QWidget ):
         raw_skip_words =self .skip_words_input .text ().strip ()
         skip_words_list =[word .strip ().lower ()for word in raw_skip_words .split (',')if word .strip ()]
 
-        raw_remove_filename_words =self .remove_from_filename_input .text ().strip ()if hasattr (self ,'remove_from_filename_input')else ""
+        raw_remove_filename_words =self .remove_from_filename_input .text ().strip ()if self .remove_from_filename_input is not None else ""
         allow_multipart =self .allow_multipart_download_setting 
         remove_from_filename_words_list =[word .strip ()for word in raw_remove_filename_words .split (',')if word .strip ()]
         scan_content_for_images =self .scan_content_images_checkbox .isChecked ()if hasattr (self ,'scan_content_images_checkbox')else False 
-        use_cookie_from_checkbox =self .use_cookie_checkbox .isChecked ()if hasattr (self ,'use_cookie_checkbox')else False 
+        use_cookie_from_checkbox =self .use_cookie_checkbox .isChecked ()if self .use_cookie_checkbox is not None else False 
         app_base_dir_for_cookies =os .path .dirname (self .config_file )
-        cookie_text_from_input =self .cookie_text_input .text ().strip ()if hasattr (self ,'cookie_text_input')and use_cookie_from_checkbox else ""
+        cookie_text_from_input =self .cookie_text_input .text ().strip ()if self .cookie_text_input is not None and use_cookie_from_checkbox else ""
 
         use_cookie_for_this_run =use_cookie_from_checkbox 
         selected_cookie_file_path_for_backend =self .selected_cookie_filepath if use_cookie_from_checkbox and self .selected_cookie_filepath else None 
@@ -3308,7 +3687,7 @@ class DownloaderApp (QWidget ):
         current_skip_words_scope =self .get_skip_words_scope ()
         manga_mode_is_checked =self .manga_mode_checkbox .isChecked ()if self .manga_mode_checkbox else False 
 
-        extract_links_only =(self .radio_only_links and self .radio_only_links .isChecked ())
+        extract_links_only =self ._mode_only_links 
         backend_filter_mode =self .get_filter_mode ()
         checked_radio_button =self .radio_group .checkedButton ()
         user_selected_filter_text =checked_radio_button .text ()if checked_radio_button else "All"
@@ -3435,7 +3814,7 @@ class DownloaderApp (QWidget ):
             except ValueError as e :
                 QMessageBox .critical (self ,"Page Range Error",f"Invalid page range: {e }")
                 return False 
-        self .external_link_queue .clear ();self .extracted_links_cache =[];self ._is_processing_external_link_queue =False ;self ._current_link_post_title =None 
+        self .external_link_queue .clear ();self .extracted_links_cache =[];self .external_link_drain_timer .stop ();self ._current_link_post_title =None 
 
         raw_character_filters_text =self .character_input .text ().strip ()
         parsed_character_filter_objects =self ._parse_character_filters (raw_character_filters_text )
@@ -3499,15 +3878,19 @@ class DownloaderApp (QWidget ):
                                         name_to_add =alias_component ,
                                         is_group_to_add =False ,
                                         aliases_to_add =[alias_component ],
-                                        suppress_similarity_prompt =True 
+                                        suppress_similarity_prompt =True ,
+                                        refresh_list =False 
                                         )
                                 else :
                                     self .add_new_character (
                                     name_to_add =filter_obj_to_add ["name"],
                                     is_group_to_add =filter_obj_to_add ["is_group"],
                                     aliases_to_add =filter_obj_to_add ["aliases"],
-                                    suppress_similarity_prompt =True 
+                                    suppress_similarity_prompt =True ,
+                                    refresh_list =False 
                                     )
+                            self ._refresh_character_list ()
+                            self .save_known_names ()
                         else :
                             self .log_signal .emit ("ℹ️ User confirmed adding, but no names were selected in the dialog. No new names added to Known.txt.")
                     elif dialog_result ==CONFIRM_ADD_ALL_SKIP_ADDING :
@@ -3552,13 +3935,13 @@ class DownloaderApp (QWidget ):
                 else :self .log_signal .emit (f"⚠️ Invalid custom folder name ignored: '{raw_custom_name }' (resulted in empty string after cleaning).")
 
 
-        self .main_log_output .clear ()
+        self ._clear_main_log ()
         if extract_links_only :self .main_log_output .append ("🔗 Extracting Links...");
         elif backend_filter_mode =='archive':self .main_log_output .append ("📦 Downloading Archives Only...")
 
-        if self .external_log_output :self .external_log_output .clear ()
+        if self .external_log_output :self ._clear_external_log ()
         if self .show_external_links and not extract_links_only and backend_filter_mode !='archive':
-            self .external_log_output .append ("🔗 External Links Found:")
+            self .external_log_output .appendPlainText ("🔗 External Links Found:")
 
         self .file_progress_label .setText ("");self .cancellation_event .clear ();self .active_futures =[]
         self .total_posts_to_process =0 ;self .processed_posts_count =0 ;self .download_counter =0 ;self .skip_counter =0 
@@ -3690,6 +4073,7 @@ class DownloaderApp (QWidget ):
         'downloaded_file_hashes':self .downloaded_file_hashes ,
         'downloaded_file_hashes_lock':self .downloaded_file_hashes_lock ,
         'skip_words_list':skip_words_list ,
+        'skip_words_pattern':compile_skip_words_pattern (skip_words_list ),
         'skip_words_scope':current_skip_words_scope ,
         'remove_from_filename_words_list':remove_from_filename_words_list ,
         'char_filter_scope':current_char_filter_scope ,
@@ -3718,6 +4102,9 @@ class DownloaderApp (QWidget ):
         'session_file_path': self.session_file_path,
         'session_lock': self.session_lock,
         'creator_download_folder_ignore_words':creator_folder_ignore_words_for_run ,
+        'sync_file_io':True ,
+        'use_uring':True ,
+        'use_async_http':self .use_async_http_setting ,
         }
 
         args_template ['override_output_dir']=override_output_dir 
@@ -3742,7 +4129,8 @@ class DownloaderApp (QWidget ):
                 'manga_date_file_counter_ref',
                 'manga_global_file_counter_ref','manga_date_prefix',
                 'manga_mode_active','unwanted_keywords','manga_filename_style','scan_content_for_images',
-                'allow_multipart_download','use_cookie','cookie_text','app_base_dir','selected_cookie_file','override_output_dir'
+                'allow_multipart_download','use_cookie','cookie_text','app_base_dir','selected_cookie_file','override_output_dir',
+                'sync_file_io','use_uring','use_async_http','skip_words_pattern'
                 ]
                 args_template ['skip_current_file_flag']=None 
                 single_thread_args ={key :args_template [key ]for key in dt_expected_keys if key in args_template }
@@ -3854,7 +4242,9 @@ class DownloaderApp (QWidget ):
         try :
             worker_instance =PostProcessorWorker (**worker_init_args )
             if self .thread_pool :
-                future =self .thread_pool .submit (worker_instance .process )
+                future =self .thread_pool .submit_for_post (post_data_item .get ('id'),worker_instance .process )
+                with self ._active_future_count_lock :
+                    self ._active_future_count +=1 
                 future .add_done_callback (self ._handle_future_result )
                 self .active_futures .append (future )
                 return True 
@@ -3910,9 +4300,9 @@ class DownloaderApp (QWidget ):
             else: self.radio_all.setChecked(True)
 
         # Toggle button states
-        self.skip_words_scope = settings.get('skip_words_scope', SKIP_SCOPE_POSTS)
-        self.char_filter_scope = settings.get('char_filter_scope', CHAR_SCOPE_TITLE)
-        self.manga_filename_style = settings.get('manga_filename_style', STYLE_POST_TITLE)
+        self.skip_words_scope = sys.intern(str(settings.get('skip_words_scope', SKIP_SCOPE_POSTS)))
+        self.char_filter_scope = sys.intern(str(settings.get('char_filter_scope', CHAR_SCOPE_TITLE)))
+        self.manga_filename_style = sys.intern(str(settings.get('manga_filename_style', STYLE_POST_TITLE)))
         self.allow_multipart_download_setting = settings.get('allow_multipart_download', False)
         
         # Update button texts after setting states
@@ -3926,21 +4316,15 @@ class DownloaderApp (QWidget ):
         if self .thread_pool is None :
             if self .pause_event :self .pause_event .clear ()
             self .is_paused =False 
-            self .thread_pool =ThreadPoolExecutor (max_workers =num_post_workers ,thread_name_prefix ='PostWorker_')
+            self .thread_pool =create_post_worker_pool (num_post_workers ,thread_name_prefix ='PostWorker_')
 
         self .active_futures =[]
         self .processed_posts_count =0 ;self .total_posts_to_process =0 ;self .download_counter =0 ;self .skip_counter =0 
         self .all_kept_original_filenames =[]
         self .is_fetcher_thread_running =True 
 
-        fetcher_thread =threading .Thread (
-        target =self ._fetch_and_queue_posts ,
-        args =(kwargs ['api_url_input'],kwargs ,num_post_workers ),
-        daemon =True ,
-        name ="PostFetcher"
-        )
-        fetcher_thread .start ()
-        self .log_signal .emit (f"✅ Post fetcher thread started. {num_post_workers } post worker threads initializing...")
+        self .download_controller .start_download (self ._fetch_and_queue_posts ,kwargs ['api_url_input'],kwargs ,num_post_workers )
+        self .log_signal .emit (f"✅ Post fetcher started. {num_post_workers } post worker threads initializing...")
         self._update_button_states_and_connections() # Update buttons after fetcher thread starts
 
     def _fetch_and_queue_posts (self ,api_url_input_for_fetcher ,worker_args_template ,num_post_workers ):
@@ -4085,13 +4469,15 @@ class DownloaderApp (QWidget ):
         'manga_global_file_counter_ref'
         ,'creator_download_folder_ignore_words'
         , 'session_file_path', 'session_lock'
+        ,'sync_file_io','use_uring','use_async_http','skip_words_pattern'
         ]
 
         ppw_optional_keys_with_defaults ={
         'skip_words_list','skip_words_scope','char_filter_scope','remove_from_filename_words_list',
         'show_external_links','extract_links_only','duplicate_file_mode',
         'num_file_threads','skip_current_file_flag','manga_mode_active','manga_filename_style','manga_date_prefix',
-        'manga_date_file_counter_ref','use_cookie','cookie_text','app_base_dir','selected_cookie_file'
+        'manga_date_file_counter_ref','use_cookie','cookie_text','app_base_dir','selected_cookie_file',
+        'sync_file_io','use_uring','use_async_http','skip_words_pattern'
         }
         if num_post_workers >POST_WORKER_BATCH_THRESHOLD and self .total_posts_to_process >POST_WORKER_NUM_BATCHES :
             self .log_signal .emit (f"    High thread count ({num_post_workers }) detected. Batching post submissions into {POST_WORKER_NUM_BATCHES } parts.")
@@ -4176,6 +4562,8 @@ class DownloaderApp (QWidget ):
             if self .thread_pool :self .thread_pool .shutdown (wait =False ,cancel_futures =True );self .thread_pool =None 
 
     def _handle_future_result (self ,future :Future ):
+        with self ._active_future_count_lock :
+            self ._active_future_count -=1 
         self .processed_posts_count +=1 
         downloaded_files_from_future ,skipped_files_from_future =0 ,0 
         kept_originals_from_future =[]
@@ -4348,14 +4736,14 @@ class DownloaderApp (QWidget ):
 
 
         if self .external_links_checkbox :
-            is_only_links =self .radio_only_links and self .radio_only_links .isChecked ()
-            is_only_archives =self .radio_only_archives and self .radio_only_archives .isChecked ()
-            is_only_audio =hasattr (self ,'radio_only_audio')and self .radio_only_audio .isChecked ()
+            is_only_links =self ._mode_only_links 
+            is_only_archives =self ._mode_only_archives 
+            is_only_audio =self .radio_only_audio is not None and self .radio_only_audio .isChecked ()
             can_enable_ext_links =enabled and not is_only_links and not is_only_archives and not is_only_audio 
             self .external_links_checkbox .setEnabled (can_enable_ext_links )
             if self .is_paused and not is_only_links and not is_only_archives and not is_only_audio :
                 self .external_links_checkbox .setEnabled (True )
-        if hasattr (self ,'use_cookie_checkbox'):
+        if self .use_cookie_checkbox is not None :
             self ._update_cookie_input_visibility (self .use_cookie_checkbox .isChecked ())
 
         if self .log_verbosity_toggle_button :self .log_verbosity_toggle_button .setEnabled (True )
@@ -4408,7 +4796,7 @@ class DownloaderApp (QWidget ):
         self .dir_input .clear ()
         self .custom_folder_input .clear ();self .character_input .clear ();
         self .skip_words_input .clear ();self .start_page_input .clear ();self .end_page_input .clear ();self .new_char_input .clear ();
-        if hasattr (self ,'remove_from_filename_input'):self .remove_from_filename_input .clear ()
+        if self .remove_from_filename_input is not None :self .remove_from_filename_input .clear ()
         self .character_search_input .clear ();self .thread_count_input .setText ("4");self .radio_all .setChecked (True );
         self .skip_zip_checkbox .setChecked (True );self .skip_rar_checkbox .setChecked (True );self .download_thumbnails_checkbox .setChecked (False );
         self .compress_images_checkbox .setChecked (False );self .use_subfolders_checkbox .setChecked (True );
@@ -4417,10 +4805,10 @@ class DownloaderApp (QWidget ):
         if hasattr (self ,'scan_content_images_checkbox'):self .scan_content_images_checkbox .setChecked (False )
         self .external_links_checkbox .setChecked (False )
         if self .manga_mode_checkbox :self .manga_mode_checkbox .setChecked (False )
-        if hasattr (self ,'use_cookie_checkbox'):self .use_cookie_checkbox .setChecked (self .use_cookie_setting )
-        if not (hasattr (self ,'use_cookie_checkbox')and self .use_cookie_checkbox .isChecked ()):
+        if self .use_cookie_checkbox is not None :self .use_cookie_checkbox .setChecked (self .use_cookie_setting )
+        if not (self .use_cookie_checkbox is not None and self .use_cookie_checkbox .isChecked ()):
             self .selected_cookie_filepath =None 
-        if hasattr (self ,'cookie_text_input'):self .cookie_text_input .setText (self .cookie_text_setting if self .use_cookie_setting else "")
+        if self .cookie_text_input is not None :self .cookie_text_input .setText (self .cookie_text_setting if self .use_cookie_setting else "")
         self .allow_multipart_download_setting =False 
         self ._update_multipart_toggle_button_text ()
 
@@ -4439,7 +4827,7 @@ class DownloaderApp (QWidget ):
         if preserve_dir is not None :
             self .dir_input .setText (preserve_dir )
         self .external_link_queue .clear ();self .extracted_links_cache =[]
-        self ._is_processing_external_link_queue =False ;self ._current_link_post_title =None 
+        self .external_link_drain_timer .stop ();self ._current_link_post_title =None 
         if self .pause_event :self .pause_event .clear ()
         self.is_restore_pending = False
         self .total_posts_to_process =0 ;self .processed_posts_count =0 
@@ -4468,7 +4856,7 @@ class DownloaderApp (QWidget ):
         self.interrupted_session_data = None # Clear session data from memory      
         self .update_custom_folder_visibility (self .link_input .text ())
         self .update_page_range_enabled_state ()
-        self ._update_cookie_input_visibility (self .use_cookie_checkbox .isChecked ()if hasattr (self ,'use_cookie_checkbox')else False )
+        self ._update_cookie_input_visibility (self .use_cookie_checkbox .isChecked ()if self .use_cookie_checkbox is not None else False )
         if hasattr (self ,'favorite_mode_checkbox'):
             self ._handle_favorite_mode_toggle (False )
 
@@ -4508,16 +4896,15 @@ class DownloaderApp (QWidget ):
         current_url =self .link_input .text ()
         current_dir =self .dir_input .text ()
 
-        self .cancellation_event .set ()
         self .is_fetcher_thread_running =False 
-        if self .download_thread and self .download_thread .isRunning ():self .download_thread .requestInterruption ();self .log_signal .emit ("    Signaled single download thread to interrupt.")
-        if self .thread_pool :
-            self .log_signal .emit ("    Initiating non-blocking shutdown and cancellation of worker pool tasks...")
-            self .thread_pool .shutdown (wait =False ,cancel_futures =True )
-            self .thread_pool =None 
+        had_thread_pool =self .thread_pool is not None 
+        if self .download_thread and self .download_thread .isRunning ():self .log_signal .emit ("    Signaled single download thread to interrupt.")
+        if had_thread_pool :self .log_signal .emit ("    Initiating non-blocking shutdown and cancellation of worker pool tasks...")
+        self ._request_cancel_and_wait (0 )
+        if had_thread_pool :
             self .active_futures =[]
 
-        self .external_link_queue .clear ();self ._is_processing_external_link_queue =False ;self ._current_link_post_title =None 
+        self .external_link_queue .clear ();self .external_link_drain_timer .stop ();self ._current_link_post_title =None 
 
         self ._perform_soft_ui_reset (preserve_url =current_url ,preserve_dir =current_dir )
 
@@ -4573,18 +4960,17 @@ class DownloaderApp (QWidget ):
 
         if kept_original_names_list :
             intro_msg =(
-            HTML_PREFIX +
             "<p>ℹ️ The following files from multi-file manga posts "
             "(after the first file) kept their <b>original names</b>:</p>"
             )
-            self .log_signal .emit (intro_msg )
+            self .log_html_signal .emit (intro_msg )
 
             html_list_items ="<ul>"
             for name in kept_original_names_list :
                 html_list_items +=f"<li><b>{name }</b></li>"
             html_list_items +="</ul>"
 
-            self .log_signal .emit (HTML_PREFIX +html_list_items )
+            self .log_html_signal .emit (html_list_items )
             self .log_signal .emit ("="*40 )
 
         if self .download_thread :
@@ -4727,7 +5113,7 @@ class DownloaderApp (QWidget ):
         'skip_words_list':[word .strip ().lower ()for word in self .skip_words_input .text ().strip ().split (',')if word .strip ()],
         'skip_words_scope':self .get_skip_words_scope (),
         'char_filter_scope':self .get_char_filter_scope (),
-        'remove_from_filename_words_list':[word .strip ()for word in self .remove_from_filename_input .text ().strip ().split (',')if word .strip ()]if hasattr (self ,'remove_from_filename_input')else [],
+        'remove_from_filename_words_list':[word .strip ()for word in self .remove_from_filename_input .text ().strip ().split (',')if word .strip ()]if self .remove_from_filename_input is not None else [],
         'allow_multipart_download':self .allow_multipart_download_setting ,
         'filter_character_list':None ,
         'dynamic_character_filter_holder':None ,
@@ -4847,7 +5233,7 @@ class DownloaderApp (QWidget ):
     def toggle_active_log_view (self ):
         if self .current_log_view =='progress':
             self .current_log_view ='missed_character'
-            if self .log_view_stack :self .log_view_stack .setCurrentIndex (1 )
+            if self .log_view_stack :self .log_view_stack .setCurrentWidget (self ._get_missed_character_log_output ())
             if self .log_verbosity_toggle_button :
                 self .log_verbosity_toggle_button .setText (self .CLOSED_EYE_ICON )
                 self .log_verbosity_toggle_button .setToolTip ("Current View: Missed Character Log. Click to switch to Progress Log.")
@@ -4907,8 +5293,8 @@ class DownloaderApp (QWidget ):
         # --- Reset UI and all state ---
         self.log_signal.emit("🔄 Resetting application state to defaults...")
         self._reset_ui_to_defaults()
-        self.main_log_output.clear()
-        self.external_log_output.clear()
+        self._clear_main_log()
+        self._clear_external_log()
         if self.missed_character_log_output:
             self.missed_character_log_output.clear()
     
@@ -4924,7 +5310,7 @@ class DownloaderApp (QWidget ):
         # Clear all download-related state
         self.external_link_queue.clear()
         self.extracted_links_cache = []
-        self._is_processing_external_link_queue = False
+        self.external_link_drain_timer.stop()
         self._current_link_post_title = None
         self.progress_label.setText(self._tr("progress_idle_text", "Progress: Idle"))
         self.file_progress_label.setText("")
@@ -4937,6 +5323,7 @@ class DownloaderApp (QWidget ):
         self.logged_summary_for_key_term.clear()
         self.already_logged_bold_key_terms.clear()
         self.missed_key_terms_buffer.clear()
+        self.missed_key_terms_sort_keys.clear()
         self.favorite_download_queue.clear()
         self.only_links_log_display_mode = LOG_DISPLAY_LINKS
         self.mega_download_log_preserved_once = False
@@ -5012,9 +5399,9 @@ class DownloaderApp (QWidget ):
     
         # Reset log and progress displays
         if self.main_log_output:
-            self.main_log_output.clear()
+            self._clear_main_log()
         if self.external_log_output:
-            self.external_log_output.clear()
+            self._clear_external_log()
         if self.missed_character_log_output:
             self.missed_character_log_output.clear()
         self.progress_label.setText(self._tr("progress_idle_text", "Progress: Idle"))
@@ -5026,6 +5413,7 @@ class DownloaderApp (QWidget ):
         self.logged_summary_for_key_term.clear()
         self.already_logged_bold_key_terms.clear()
         self.missed_key_terms_buffer.clear()
+        self.missed_key_terms_sort_keys.clear()
         self.permanently_failed_files_for_dialog.clear()
         self.only_links_log_display_mode = LOG_DISPLAY_LINKS
         self.cancellation_message_logged_this_session = False
@@ -5048,7 +5436,7 @@ class DownloaderApp (QWidget ):
         # Reset extracted/external links state
         self.external_link_queue.clear()
         self.extracted_links_cache = []
-        self._is_processing_external_link_queue = False
+        self.external_link_drain_timer.stop()
         self._current_link_post_title = None
         if self.download_extracted_links_button:
             self.download_extracted_links_button.setEnabled(False)
@@ -5151,7 +5539,7 @@ class DownloaderApp (QWidget ):
         self .log_signal .emit (f"    Main thread received character prompt response: {'Action resulted in addition/confirmation'if result else 'Action resulted in no addition/declined'}")
 
     def _update_multipart_toggle_button_text (self ):
-        if hasattr (self ,'multipart_toggle_button'):
+        if self .multipart_toggle_button is not None :
             if self .allow_multipart_download_setting :
                 self .multipart_toggle_button .setText (self ._tr ("multipart_on_button_text","Multi-part: ON"))
                 self .multipart_toggle_button .setToolTip (self ._tr ("multipart_on_button_tooltip","Tooltip for multipart ON"))
@@ -5313,8 +5701,8 @@ class DownloaderApp (QWidget ):
             return 
 
         cookies_config ={
-        'use_cookie':self .use_cookie_checkbox .isChecked ()if hasattr (self ,'use_cookie_checkbox')else False ,
-        'cookie_text':self .cookie_text_input .text ()if hasattr (self ,'cookie_text_input')else "",
+        'use_cookie':self .use_cookie_checkbox .isChecked ()if self .use_cookie_checkbox is not None else False ,
+        'cookie_text':self .cookie_text_input .text ()if self .cookie_text_input is not None else "",
         'selected_cookie_file':self .selected_cookie_filepath ,
         'app_base_dir':self .app_base_dir 
         }
@@ -5353,8 +5741,8 @@ class DownloaderApp (QWidget ):
             return 
 
         cookies_config ={
-        'use_cookie':self .use_cookie_checkbox .isChecked ()if hasattr (self ,'use_cookie_checkbox')else False ,
-        'cookie_text':self .cookie_text_input .text ()if hasattr (self ,'cookie_text_input')else "",
+        'use_cookie':self .use_cookie_checkbox .isChecked ()if self .use_cookie_checkbox is not None else False ,
+        'cookie_text':self .cookie_text_input .text ()if self .cookie_text_input is not None else "",
         'selected_cookie_file':self .selected_cookie_filepath ,
         'app_base_dir':self .app_base_dir 
         }
@@ -0,0 +1,91 @@
+# --- Standard Library Imports ---
+import queue
+import threading
+import time
+from collections import deque
+
+
+class FastQueue:
+    """
+    A minimal unbounded FIFO for handing worker messages to the GUI thread.
+
+    queue.Queue takes a mutex and notifies a Condition on every put and get,
+    and its empty()/Empty checks are only advisory under contention. Here
+    deque.append() and deque.popleft() are atomic on their own, and an Event
+    wakes blocked consumers, so the put path taken by every worker log line
+    does no locking at all.
+
+    The methods used by the existing call sites keep their queue.Queue
+    names and raise queue.Empty, so code written against queue.Queue keeps
+    working. task_done() is accepted but there is no join() support.
+
+    If `notify` is given, it is called from the producing thread when an
+    item arrives and no drain is pending, so a consumer can be woken on
+    demand instead of polling. The consumer calls begin_drain() right
+    before emptying the queue to re-arm the notification.
+    """
+
+    def __init__(self, notify=None):
+        self._items = deque()
+        self._not_empty = threading.Event()
+        self._closed = False
+        self._notify = notify
+        self._notify_pending = False
+
+    def put(self, item, block=True, timeout=None):
+        if self._closed:
+            raise RuntimeError("put() on a closed FastQueue")
+        self._items.append(item)
+        self._not_empty.set()
+        if self._notify is not None and not self._notify_pending:
+            self._notify_pending = True
+            self._notify()
+
+    def begin_drain(self):
+        """Re-arms `notify`; items put after this call trigger a new notification."""
+        self._notify_pending = False
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            if not block or self._closed:
+                raise queue.Empty
+            # Clear, then re-check, so a put() between the two pops is never missed.
+            self._not_empty.clear()
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            if not self._not_empty.wait(remaining):
+                raise queue.Empty
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def task_done(self):
+        pass
+
+    def empty(self):
+        return not self._items
+
+    def qsize(self):
+        return len(self._items)
+
+    def close(self):
+        """Rejects further puts and wakes any blocked consumers."""
+        self._closed = True
+        self._not_empty.set()
+
+
+# Emitter types that take {'type': ..., 'payload': ...} messages instead of Qt signals.
+QUEUE_EMITTER_TYPES = (queue.Queue, FastQueue)
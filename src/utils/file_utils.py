@@ -1,7 +1,14 @@
 # --- Standard Library Imports ---
+import hashlib
 import os
 import re
 
+# --- Third-Party Library Imports ---
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # --- Module Constants ---
 
 # This will be populated at runtime by the main application,
@@ -36,6 +43,21 @@ FOLDER_NAME_STOP_WORDS = {
     "to", "ve", "was", "we", "well", "were", "with", "www", "year", "you", "your",
 }
 
+# --- Content Hashing ---
+
+def new_content_hasher():
+    """
+    Returns a streaming hasher for duplicate-content detection.
+
+    The hash is only compared against other hashes from the same session,
+    so it does not need to be cryptographic: xxh3_64 is used when 'xxhash'
+    is installed, MD5 otherwise. Both have the hashlib update()/hexdigest() API.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.md5()
+
+
 # --- File and Folder Name Utilities ---
 
 def clean_folder_name(name):
@@ -105,6 +127,37 @@ def clean_filename(name):
     return base_name + ext
 
 
+# --- Text File Reading ---
+
+def iter_text_file_lines(filepath, comment_prefix=None):
+    """
+    Yields the non-empty, stripped lines of a UTF-8 text file.
+
+    The file is read in a single call and split as bytes; only lines that
+    are kept are decoded, so blank lines and comments never become str
+    objects.
+
+    Args:
+        filepath (str): The file to read.
+        comment_prefix (str, optional): Lines starting with this are skipped.
+
+    Yields:
+        tuple: (line_number, line) with 1-based line numbers.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    if data.startswith(b'\xef\xbb\xbf'):
+        data = data[3:]
+    comment_bytes = comment_prefix.encode('utf-8') if comment_prefix else None
+    for line_num, raw_line in enumerate(data.splitlines(), 1):
+        raw_line = raw_line.strip()
+        if not raw_line or (comment_bytes and raw_line.startswith(comment_bytes)):
+            continue
+        line = raw_line.decode('utf-8').strip()
+        if line:
+            yield line_num, line
+
+
 # --- File Type Identification Functions ---
 
 def is_image(filename):
@@ -1,12 +1,50 @@
 # --- Standard Library Imports ---
 import os
 import re
+import threading
+from http.cookiejar import DefaultCookiePolicy
 from urllib.parse import urlparse
 
 # --- Third-Party Library Imports ---
-# This module might not require third-party libraries directly,
-# but 'requests' is a common dependency for network operations.
-# import requests
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# --- Local Application Imports ---
+from ..config.constants import MAX_THREADS
+from .file_utils import iter_text_file_lines
+
+_http_session = None
+_http_session_lock = threading.Lock()
+_cookie_file_cache = {}
+_cookie_file_cache_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Returns the shared requests.Session used for API calls and file downloads.
+
+    The session keeps keep-alive connections (and their TLS handshakes) for
+    reuse across all worker threads. Its connection pool is sized to
+    MAX_THREADS, since the default pool of 10 connections per host would make
+    most workers wait for a free connection. Transient 502/503/504 responses
+    are retried with backoff before they reach the caller. Connect and read
+    errors are not retried here, since callers already retry those with
+    their own logging and backoff.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            retry_policy = Retry(total=3, connect=0, read=0, backoff_factor=0.5,
+                                 status_forcelist=[502, 503, 504], raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=MAX_THREADS, pool_maxsize=MAX_THREADS, max_retries=retry_policy)
+            session = requests.Session()
+            # Cookies are passed per request; never carry response cookies over to later requests.
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _http_session = session
+        return _http_session
 
 
 def parse_cookie_string(cookie_string):
@@ -31,6 +69,32 @@ def parse_cookie_string(cookie_string):
     return cookies if cookies else None
 
 
+def _read_netscape_cookie_entries(filepath):
+    """
+    Returns the (lowercased domain, name, value) entries of a cookies.txt file.
+
+    The parsed entries are cached per path and reused until the file's
+    modification time or size changes, so repeated requests with the same
+    cookie file do not re-read and re-parse it.
+    """
+    file_stat = os.stat(filepath)
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    with _cookie_file_cache_lock:
+        cached = _cookie_file_cache.get(filepath)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    entries = []
+    for _, line in iter_text_file_lines(filepath, comment_prefix='#'):
+        parts = line.split('\t')
+        if len(parts) == 7 and parts[5]:
+            entries.append((parts[0].lower(), parts[5], parts[6]))
+    entries = tuple(entries)
+    with _cookie_file_cache_lock:
+        _cookie_file_cache[filepath] = (signature, entries)
+    return entries
+
+
 def load_cookies_from_netscape_file(filepath, logger_func, target_domain_filter=None):
     """
     Loads cookies from a Netscape-formatted cookies.txt file.
@@ -48,30 +112,15 @@ def load_cookies_from_netscape_file(filepath, logger_func, target_domain_filter=
     """
     cookies = {}
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                parts = line.split('\t')
-                if len(parts) == 7:
-                    cookie_domain = parts[0]
-                    name = parts[5]
-                    value = parts[6]
-
-                    if not name:
-                        continue
-
-                    if target_domain_filter:
-                        # Match domain exactly or as a subdomain
-                        host_to_match = target_domain_filter.lower()
-                        cookie_domain_norm = cookie_domain.lower()
-                        if (cookie_domain_norm.startswith('.') and host_to_match.endswith(cookie_domain_norm)) or \
-                           (host_to_match == cookie_domain_norm):
-                            cookies[name] = value
-                    else:
-                        cookies[name] = value
+        host_to_match = target_domain_filter.lower() if target_domain_filter else None
+        for cookie_domain_norm, name, value in _read_netscape_cookie_entries(filepath):
+            if host_to_match:
+                # Match domain exactly or as a subdomain
+                if (cookie_domain_norm.startswith('.') and host_to_match.endswith(cookie_domain_norm)) or \
+                   (host_to_match == cookie_domain_norm):
+                    cookies[name] = value
+            else:
+                cookies[name] = value
 
         logger_func(f"   🍪 Loaded {len(cookies)} cookies from '{os.path.basename(filepath)}' for domain '{target_domain_filter or 'any'}'.")
         return cookies if cookies else None
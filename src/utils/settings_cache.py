@@ -0,0 +1,67 @@
+# --- Module Constants ---
+_MISSING = object()
+
+
+class SettingsCache:
+    """
+    A write-through cache in front of a QSettings object.
+
+    On Windows every QSettings read and write goes to the registry. This
+    wrapper keeps the values it has read or written in a dict, skips
+    setValue() calls that would store the value already held, and turns
+    sync() into a no-op when nothing was written since the last sync.
+    Any other attribute is forwarded to the wrapped QSettings.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+        self._values = {}
+        self._dirty = False
+
+    def value(self, key, defaultValue=None, type=None):
+        """Returns the setting for `key`, reading QSettings only on the first request."""
+        cache_key = (key, type)
+        cached = self._values.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        if not self._settings.contains(key):
+            return defaultValue
+        if type is None:
+            result = self._settings.value(key, defaultValue)
+        else:
+            result = self._settings.value(key, defaultValue, type=type)
+        self._values[cache_key] = result
+        return result
+
+    def setValue(self, key, value):
+        """Stores `value` for `key` unless it is already the stored value."""
+        cached = self._values.get((key, None), _MISSING)
+        if cached is _MISSING:
+            cached = next((v for (k, _), v in self._values.items() if k == key), _MISSING)
+        if cached is _MISSING and type(value) in (bool, int, str) and self._settings.contains(key):
+            # Not read this session: compare against the stored value, since
+            # a read is far cheaper than a write plus sync.
+            cached = self.value(key, None, type=type(value))
+        if cached is not _MISSING and cached == value and type(cached) is type(value):
+            return
+        self._settings.setValue(key, value)
+        for cache_key in [ck for ck in self._values if ck[0] == key]:
+            del self._values[cache_key]
+        self._values[(key, None)] = value
+        self._dirty = True
+
+    def remove(self, key):
+        """Removes `key` from the settings and the cache."""
+        self._settings.remove(key)
+        for cache_key in [ck for ck in self._values if ck[0] == key]:
+            del self._values[cache_key]
+        self._dirty = True
+
+    def sync(self):
+        """Flushes pending writes to storage, if there are any."""
+        if self._dirty:
+            self._settings.sync()
+            self._dirty = False
+
+    def __getattr__(self, name):
+        return getattr(self._settings, name)
@@ -1,6 +1,7 @@
 # --- Standard Library Imports ---
 import re
 import html
+from functools import lru_cache
 
 # --- Local Application Imports ---
 # Import from file_utils within the same package
@@ -43,9 +44,54 @@ def is_title_match_for_character(post_title, character_name_filter):
     if not post_title or not character_name_filter:
         return False
         
+    return bool(_compile_whole_word_pattern(str(character_name_filter).strip()).search(post_title))
+
+
+@lru_cache(maxsize=1024)
+def _compile_whole_word_pattern(term):
+    """Compiles (once per term) a case-insensitive whole-word pattern for a character name."""
     # Use word boundaries (\b) to match whole words only
-    pattern = r"(?i)\b" + re.escape(str(character_name_filter).strip()) + r"\b"
-    return bool(re.search(pattern, post_title))
+    return re.compile(r"\b" + re.escape(term) + r"\b", re.IGNORECASE)
+
+
+def compile_skip_words_pattern(skip_words):
+    """
+    Compiles a list of skip words into a single case-insensitive alternation.
+
+    Matching is a plain substring search, like checking each word with `in`,
+    but the text is scanned once instead of once per word.
+
+    Args:
+        skip_words (list): The skip words.
+
+    Returns:
+        re.Pattern or None: The compiled pattern, or None if there are no words.
+    """
+    words = tuple(word for word in (skip_words or []) if word)
+    if not words:
+        return None
+    return _compile_skip_words_pattern(words)
+
+
+def compile_remove_words_pattern(remove_words):
+    """
+    Compiles the "Remove Words from name" list into one case-insensitive
+    alternation, so a filename is rewritten with a single `sub` call.
+
+    Args:
+        remove_words (list): The words to strip from filenames.
+
+    Returns:
+        re.Pattern or None: The compiled pattern, or None if there are no words.
+    """
+    return compile_skip_words_pattern(remove_words)
+
+
+@lru_cache(maxsize=32)
+def _compile_skip_words_pattern(words):
+    # Longest first, so the reported match is the most specific word.
+    ordered_words = sorted(set(words), key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, ordered_words)), re.IGNORECASE)
 
 
 def is_filename_match_for_character(filename, character_name_filter):
@@ -0,0 +1,36 @@
+import socket
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("PyQt5")
+requests = pytest.importorskip("requests")
+
+from src.services.async_downloader import stream_file_with_aiohttp
+from src.core.workers import is_incomplete_read_error
+
+
+def _serve_truncated_body(server_socket):
+    conn, _ = server_socket.accept()
+    with conn:
+        conn.recv(65536)
+        conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 1000\r\nConnection: close\r\n\r\n" + b"x" * 10)
+
+
+def test_truncated_async_body_is_queued_for_retry_later(tmp_path):
+    server_socket = socket.socket()
+    server_socket.bind(("127.0.0.1", 0))
+    server_socket.listen(1)
+    port = server_socket.getsockname()[1]
+    server_thread = threading.Thread(target=_serve_truncated_body, args=(server_socket,), daemon=True)
+    server_thread.start()
+    try:
+        with pytest.raises(requests.exceptions.ConnectionError) as exc_info:
+            stream_file_with_aiohttp(f"http://127.0.0.1:{port}/file.bin", str(tmp_path / "file.bin.part"), {},
+                                     timeout=(5, 5))
+    finally:
+        server_thread.join(5)
+        server_socket.close()
+
+    assert is_incomplete_read_error(exc_info.value)